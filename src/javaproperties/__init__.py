@@ -12,20 +12,37 @@ Visit <https://github.com/jwodder/javaproperties> or
 """
 
 import codecs
+from .lazyprops import LazyProperties
+from .metrics import (
+    CallMetrics,
+    MetricsRegistry,
+    OperationStats,
+    add_metrics_listener,
+    remove_metrics_listener,
+)
+from .parallel import FileLoadError, load_many, load_path_parallel
 from .propclass import Properties
 from .propfile import PropertiesFile
 from .reading import (
     Comment,
     InvalidUEscapeError,
     KeyValue,
+    ParseStats,
     PropertiesElement,
+    PropertiesParser,
     Whitespace,
+    aload,
+    aparse,
     load,
+    load_path,
     loads,
     parse,
     unescape,
 )
 from .writing import (
+    EscapeCache,
+    EscapeCacheInfo,
+    adump,
     dump,
     dumps,
     escape,
@@ -34,7 +51,8 @@ from .writing import (
     join_key_value,
     to_comment,
 )
-from .xmlprops import dump_xml, dumps_xml, load_xml, loads_xml
+from .xmlpropfile import XMLPropertiesFile
+from .xmlprops import adump_xml, aload_xml, dump_xml, dumps_xml, load_xml, loads_xml
 
 __version__ = "0.9.0.dev1"
 __author__ = "John Thorvald Wodder II"
@@ -43,13 +61,29 @@ __license__ = "MIT"
 __url__ = "https://github.com/jwodder/javaproperties"
 
 __all__ = [
+    "CallMetrics",
     "Comment",
+    "EscapeCache",
+    "EscapeCacheInfo",
+    "FileLoadError",
     "InvalidUEscapeError",
     "KeyValue",
+    "LazyProperties",
+    "MetricsRegistry",
+    "OperationStats",
+    "ParseStats",
     "Properties",
     "PropertiesElement",
     "PropertiesFile",
+    "PropertiesParser",
     "Whitespace",
+    "XMLPropertiesFile",
+    "add_metrics_listener",
+    "adump",
+    "adump_xml",
+    "aload",
+    "aload_xml",
+    "aparse",
     "dump",
     "dump_xml",
     "dumps",
@@ -59,10 +93,14 @@ __all__ = [
     "javapropertiesreplace_errors",
     "join_key_value",
     "load",
+    "load_many",
+    "load_path",
+    "load_path_parallel",
     "load_xml",
     "loads",
     "loads_xml",
     "parse",
+    "remove_metrics_listener",
     "to_comment",
     "unescape",
 ]
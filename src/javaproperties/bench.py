@@ -0,0 +1,412 @@
+"""
+Benchmarks for the hot paths of `javaproperties`
+
+Run ``python -m javaproperties.bench --help`` for usage.  Each benchmark is run
+on a synthetic workload generated from a fixed seed, so results from different
+runs (and different versions of the package) on the same machine are
+comparable.  Results can be saved to a JSON file with ``--save`` and compared
+against a previously saved file with ``--baseline``.
+"""
+
+from __future__ import annotations
+import argparse
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from io import BytesIO
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import timeit
+from typing import Any
+from . import __version__
+from .corpus import XML_ESCAPED_CHARS, Corpus
+from .parallel import load_many, load_path_parallel
+from .propclass import Properties
+from .propfile import PropertiesFile
+from .reading import load_path, loads, parse, unescape
+from .writing import dumps, escape, join_key_value
+from .xmlpropfile import XMLPropertiesFile
+from .xmlprops import dump_xml, load_xml
+
+#: The number of files that the workload is split into for the
+#: ``parallel.*`` benchmarks
+PARALLEL_FILES = 8
+
+
+@dataclass
+class Workload:
+    """A deterministically-generated set of inputs for the benchmarks"""
+
+    #: The key-value pairs, without duplicates
+    pairs: list[tuple[str, str]]
+    #: A ``.properties`` document containing the pairs along with comments,
+    #: blank lines, and continuation lines, as generated by `Corpus`
+    text: str
+    #: An XML properties document containing the pairs
+    xml: bytes
+    #: A random sample of the keys
+    sample: list[str]
+
+    @classmethod
+    def generate(cls, size: int, seed: int = 0) -> Workload:
+        """
+        Generate a workload of ``size`` key-value pairs from the random seed
+        ``seed``
+        """
+        # `dump_xml()` cannot represent all of `ESCAPED_CHARS`, and the same
+        # pairs are used for both formats:
+        corpus = Corpus(entries=size, seed=seed, escaped_chars=XML_ESCAPED_CHARS)
+        pairs = list(corpus.pairs())
+        return cls(
+            pairs=pairs,
+            text=corpus.text(),
+            xml=corpus.xml(),
+            sample=random.Random(seed).sample([k for k, _ in pairs], min(size, 1000)),
+        )
+
+
+@dataclass
+class Benchmark:
+    """A single benchmark"""
+
+    #: The name of the benchmark, in the form ``"subsystem.operation"``
+    name: str
+    #: The function to time
+    func: Callable[[], Any]
+    #: The number of entries processed by each call to `func`
+    entries: int
+    #: The number of bytes (or characters) processed by each call to `func`
+    nbytes: int
+
+
+@dataclass
+class Result:
+    """The timing of a `Benchmark`"""
+
+    name: str
+    #: The best time of a single call, in seconds
+    seconds: float
+    entries: int
+    nbytes: int
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1 / self.seconds
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.nbytes / self.seconds
+
+    @property
+    def ns_per_entry(self) -> float:
+        return self.seconds / self.entries * 1e9
+
+    def for_json(self) -> dict[str, Any]:
+        return {
+            "seconds": self.seconds,
+            "entries": self.entries,
+            "nbytes": self.nbytes,
+            "ops_per_sec": self.ops_per_sec,
+            "bytes_per_sec": self.bytes_per_sec,
+            "ns_per_entry": self.ns_per_entry,
+        }
+
+
+@contextmanager
+def benchmarks(wl: Workload) -> Iterator[list[Benchmark]]:
+    """
+    A context manager returning the benchmarks for the given workload.  Any
+    temporary files needed by the benchmarks are deleted on exit.
+    """
+    n = len(wl.pairs)
+    text = wl.text
+    textlen = len(text)
+    data = dict(wl.pairs)
+    escaped = [join_key_value(k, v) for k, v in wl.pairs]
+    fields = [f for line in escaped for f in line.split("=", 1)]
+    raw = [f for kv in wl.pairs for f in kv]
+    dumped = dumps(data, timestamp=None)
+    pf = PropertiesFile.loads(text)
+    edits = [(k, f"new value for {k}") for k in wl.sample]
+    xpf = XMLPropertiesFile.loads(wl.xml)
+    chain = None
+    for i in range(5):
+        chain = Properties(
+            {k: v for j, (k, v) in enumerate(wl.pairs) if j % 5 == i},
+            defaults=chain,
+        )
+    assert chain is not None
+    cached = Properties(defaults=chain, cache_defaults=True)
+
+    def propfile_set() -> None:
+        pf2 = pf.copy()
+        for k, v in edits:
+            pf2[k] = v
+
+    def propfile_delete() -> None:
+        pf2 = pf.copy()
+        for k in wl.sample:
+            del pf2[k]
+
+    def propfile_edit_dumps() -> None:
+        pf2 = pf.copy()
+        for k, v in edits:
+            pf2[k] = v
+        pf2.dumps()
+
+    def xmlpropfile_edit_dump() -> None:
+        xpf2 = xpf.copy()
+        for k, v in edits:
+            xpf2[k] = v
+        xpf2.dump(BytesIO())
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "workload.properties")
+        with open(path, "w", encoding="iso-8859-1") as fp:
+            fp.write(dumped)
+        # The same entries split among several files, for `load_many()`
+        paths = []
+        for i in range(PARALLEL_FILES):
+            p = os.path.join(tmpdir, f"part{i}.properties")
+            with open(p, "w", encoding="iso-8859-1") as fp:
+                fp.write(dumps(wl.pairs[i::PARALLEL_FILES], timestamp=None))
+            paths.append(p)
+        # Small enough for `load_path_parallel()` to split the file into
+        # several chunks
+        chunk_size = len(dumped) // PARALLEL_FILES + 1
+        yield [
+            Benchmark("reading.parse", lambda: list(parse(text)), n, textlen),
+            Benchmark("reading.loads", lambda: loads(text), n, textlen),
+            Benchmark("reading.load_path", lambda: load_path(path), n, len(dumped)),
+            Benchmark(
+                "reading.unescape",
+                lambda: [unescape(f) for f in fields],
+                n,
+                sum(map(len, fields)),
+            ),
+            Benchmark(
+                "writing.escape",
+                lambda: [escape(f) for f in raw],
+                n,
+                sum(map(len, raw)),
+            ),
+            Benchmark(
+                "writing.dumps",
+                lambda: dumps(data, timestamp=None),
+                n,
+                len(dumped),
+            ),
+            Benchmark(
+                "propfile.loads",
+                lambda: PropertiesFile.loads(text),
+                n,
+                textlen,
+            ),
+            Benchmark("propfile.dumps", pf.dumps, n, textlen),
+            Benchmark("propfile.set", propfile_set, len(edits), 0),
+            Benchmark("propfile.delete", propfile_delete, len(wl.sample), 0),
+            Benchmark("propfile.edit_dumps", propfile_edit_dumps, n, textlen),
+            Benchmark(
+                "propclass.getProperty",
+                lambda: [chain.getProperty(k) for k in wl.sample],
+                len(wl.sample),
+                0,
+            ),
+            Benchmark(
+                "propclass.getProperty_cached",
+                lambda: [cached.getProperty(k) for k in wl.sample],
+                len(wl.sample),
+                0,
+            ),
+            Benchmark(
+                "xmlprops.load_xml",
+                lambda: load_xml(BytesIO(wl.xml)),
+                n,
+                len(wl.xml),
+            ),
+            Benchmark(
+                "xmlprops.dump_xml",
+                lambda: dump_xml(data, BytesIO()),
+                n,
+                len(wl.xml),
+            ),
+            Benchmark(
+                "xmlpropfile.loads",
+                lambda: XMLPropertiesFile.loads(wl.xml),
+                n,
+                len(wl.xml),
+            ),
+            Benchmark("xmlpropfile.edit_dump", xmlpropfile_edit_dump, n, len(wl.xml)),
+            Benchmark(
+                "parallel.load_many",
+                lambda: list(load_many(paths)),
+                n,
+                len(dumped),
+            ),
+            Benchmark(
+                "parallel.load_many_serial",
+                lambda: [load_path(p) for p in paths],
+                n,
+                len(dumped),
+            ),
+            Benchmark(
+                "parallel.load_path_parallel",
+                lambda: load_path_parallel(path, chunk_size=chunk_size),
+                n,
+                len(dumped),
+            ),
+        ]
+
+
+def run(bench: Benchmark, repeat: int = 5, min_time: float = 0.2) -> Result:
+    """
+    Time ``bench``, calling its function enough times per repetition to take
+    at least ``min_time`` seconds, and return the best time per call out of
+    ``repeat`` repetitions
+    """
+    timer = timeit.Timer(bench.func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    times = [elapsed] + timer.repeat(repeat=max(repeat - 1, 0), number=number)
+    return Result(
+        name=bench.name,
+        seconds=min(times) / number,
+        entries=bench.entries,
+        nbytes=bench.nbytes,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m javaproperties.bench",
+        description="Benchmark the hot paths of javaproperties",
+    )
+    parser.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=10000,
+        help="Number of entries in the workload [default: 10000]",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Random seed for generating the workload [default: 0]",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timing repetitions per benchmark [default: 5]",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum duration of each repetition in seconds [default: 0.2]",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        metavar="FILE",
+        help="Compare the results against those saved in FILE",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        metavar="RATIO",
+        help=(
+            "Exit with a nonzero status if any benchmark is more than RATIO"
+            " times slower than the baseline"
+        ),
+    )
+    parser.add_argument(
+        "-s", "--save", metavar="FILE", help="Save the results as JSON to FILE"
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        metavar="PATTERN",
+        help="Only run benchmarks whose names match one of these glob patterns",
+    )
+    args = parser.parse_args(argv)
+    if args.size < 1:
+        parser.error("--size must be positive")
+    baseline: dict[str, Any] | None = None
+    if args.baseline is not None:
+        with open(args.baseline, encoding="utf-8") as fp:
+            baseline = json.load(fp)
+        assert baseline is not None
+        if (baseline["size"], baseline["seed"]) != (args.size, args.seed):
+            print(
+                f"Warning: baseline was run with --size {baseline['size']}"
+                f" --seed {baseline['seed']}",
+                file=sys.stderr,
+            )
+    results: list[Result] = []
+    slower: list[str] = []
+    print(
+        f"{'benchmark':<30} {'ops/s':>10} {'MB/s':>9} {'ns/entry':>10}"
+        + (f" {'vs baseline':>12}" if baseline is not None else "")
+    )
+    with benchmarks(Workload.generate(args.size, args.seed)) as benches:
+        for b in benches:
+            if args.patterns and not any(fnmatchcase(b.name, p) for p in args.patterns):
+                continue
+            r = run(b, repeat=args.repeat, min_time=args.min_time)
+            results.append(r)
+            mbps = f"{r.bytes_per_sec / 1e6:9.2f}" if r.nbytes else f"{'-':>9}"
+            line = f"{r.name:<30} {r.ops_per_sec:10.2f} {mbps} {r.ns_per_entry:10.0f}"
+            if baseline is not None:
+                if (base := baseline["results"].get(r.name)) is not None:
+                    # >1 means faster than the baseline
+                    speedup = base["seconds"] / r.seconds
+                    line += f" {speedup:11.2f}x"
+                    if (
+                        args.max_slowdown is not None
+                        and 1 / speedup > args.max_slowdown
+                    ):
+                        slower.append(r.name)
+                else:
+                    line += f" {'-':>12}"
+            print(line, flush=True)
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf-8") as fp:
+            json.dump(
+                {
+                    "javaproperties": __version__,
+                    "python": platform.python_implementation()
+                    + " "
+                    + platform.python_version(),
+                    "platform": platform.platform(),
+                    "size": args.size,
+                    "seed": args.seed,
+                    "results": {r.name: r.for_json() for r in results},
+                },
+                fp,
+                indent=4,
+            )
+            print(file=fp)
+    if slower:
+        print(
+            f"Slower than baseline by more than {args.max_slowdown}x: "
+            + ", ".join(slower),
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,411 @@
+"""
+Generation of synthetic ``.properties`` corpora for benchmarks & stress tests
+
+A `Corpus` describes the shape of a document — its number of entries, the
+frequency of characters that need escaping, comments, continuation lines,
+duplicate keys, etc. — along with a random seed, and it deterministically
+generates the same document every time it is written.  Documents are produced
+lazily, so corpora of any size can be written without holding them in memory.
+
+Corpora can also be written from the command line; run ``python -m
+javaproperties.corpus --help`` for usage.
+"""
+
+from __future__ import annotations
+import argparse
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from io import BytesIO
+import itertools
+import math
+import random
+import re
+import sys
+from typing import BinaryIO, Literal, TextIO
+from .writing import dump, join_key_value, to_comment
+from .xmlprops import dump_xml
+
+#: Characters that do not need escaping in a ``.properties`` file
+PLAIN_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ./-_,;()"
+
+#: ASCII characters that are escaped when written to a ``.properties`` file
+ESCAPED_CHARS = "=:#!\\\t\n\r\f"
+
+#: The subset of `ESCAPED_CHARS` that `javaproperties.dump_xml()` output can
+#: represent in values
+XML_ESCAPED_CHARS = "=:#!\\\t\n"
+
+#: Non-ASCII characters in the Basic Multilingual Plane, written as
+#: ``\uXXXX`` escapes when ``ensure_ascii`` is true
+BMP_CHARS = "\xa0\xe9\xf0\xffāλЖא—€☃日Ａ"
+
+#: Characters outside the Basic Multilingual Plane, written as surrogate pairs
+#: of ``\uXXXX`` escapes when ``ensure_ascii`` is true
+ASTRAL_CHARS = "\U0001f410\U0001f600\U0001d11e\U00020000\U0010fffd"
+
+#: Number of entries sampled by `Corpus.for_size()` to estimate the size of an
+#: entry
+SIZE_SAMPLE = 1000
+
+#: Number of most recent distinct keys that duplicate keys are chosen from
+DUPLICATE_WINDOW = 1000
+
+#: Length of the string of random characters from which keys, values, and
+#: comments are taken
+CHAR_POOL_SIZE = 1 << 16
+
+#: Number of lines `Corpus.write()` writes at a time
+WRITE_BATCH_SIZE = 1024
+
+SIZE_RGX = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$", flags=re.I)
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """
+    The parameters of a deterministically-generated ``.properties`` document.
+    Every ratio is a probability between 0 and 1.
+    """
+
+    #: The number of key-value entries, including duplicates
+    entries: int = 1000
+    #: The random seed
+    seed: int = 0
+    #: The maximum length of each key, not counting the unique suffix added to
+    #: each non-duplicate key
+    key_length: int = 16
+    #: The maximum length of each value
+    value_length: int = 48
+    #: The proportion of key & value characters that are ASCII characters
+    #: requiring escapes
+    escape_ratio: float = 0.03
+    #: The characters requiring escapes to choose from
+    escaped_chars: str = ESCAPED_CHARS
+    #: The proportion of key & value characters that are non-ASCII characters
+    #: in the Basic Multilingual Plane
+    bmp_ratio: float = 0.02
+    #: The proportion of key & value characters that are outside the Basic
+    #: Multilingual Plane
+    astral_ratio: float = 0.005
+    #: The proportion of entries split across multiple lines with backslash
+    #: continuations
+    continuation_ratio: float = 0.05
+    #: The proportion of entries that reuse the key of a recent entry
+    duplicate_ratio: float = 0.0
+    #: The proportion of entries preceded by a comment line
+    comment_ratio: float = 0.05
+    #: The proportion of entries preceded by a blank line
+    blank_ratio: float = 0.05
+    #: The line ending to use
+    newline: Literal["\n", "\r\n", "\r"] = "\n"
+    #: The key-value separators to choose from for each entry
+    separators: tuple[str, ...] = ("=",)
+    #: Whether to escape non-ASCII characters in the ``.properties`` format
+    ensure_ascii: bool = True
+    _weights: tuple[list[str], list[float]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.entries < 0:
+            raise ValueError("entries must be nonnegative")
+        for name in [
+            "escape_ratio",
+            "bmp_ratio",
+            "astral_ratio",
+            "continuation_ratio",
+            "duplicate_ratio",
+            "comment_ratio",
+            "blank_ratio",
+        ]:
+            if not 0 <= getattr(self, name) <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        plain = 1 - self.escape_ratio - self.bmp_ratio - self.astral_ratio
+        if plain < 0:
+            raise ValueError("Character ratios must not sum to more than 1")
+        if self.newline not in ("\n", "\r\n", "\r"):
+            raise ValueError(f"Invalid newline: {self.newline!r}")
+        if not self.escaped_chars:
+            raise ValueError("escaped_chars must be nonempty")
+        if not self.separators:
+            raise ValueError("separators must be nonempty")
+        chars: list[str] = []
+        cum_weights: list[float] = []
+        total = 0.0
+        for pool, ratio in [
+            (PLAIN_CHARS, plain),
+            (self.escaped_chars, self.escape_ratio),
+            (BMP_CHARS, self.bmp_ratio),
+            (ASTRAL_CHARS, self.astral_ratio),
+        ]:
+            for c in pool:
+                total += ratio / len(pool)
+                chars.append(c)
+                cum_weights.append(total)
+        object.__setattr__(self, "_weights", (chars, cum_weights))
+
+    @classmethod
+    def for_size(cls, nbytes: int, **kwargs: object) -> Corpus:
+        """
+        Return a `Corpus` with the given parameters and a number of entries
+        chosen so that its ``.properties`` form is approximately ``nbytes``
+        bytes long
+        """
+        sample = cls(entries=SIZE_SAMPLE, **kwargs)  # type: ignore[arg-type]
+        per_entry = sum(len(line) for line in sample.lines()) / SIZE_SAMPLE
+        return replace(sample, entries=max(math.ceil(nbytes / per_entry), 1))
+
+    def _char_pool(self, rng: random.Random) -> str:
+        """
+        Generate a random string with the corpus's character distribution from
+        which `_random_string()` takes slices
+        """
+        chars, cum_weights = self._weights
+        size = max(CHAR_POOL_SIZE, 2 * self.key_length, 2 * self.value_length)
+        return "".join(rng.choices(chars, cum_weights=cum_weights, k=size))
+
+    @staticmethod
+    def _random_string(rand: Callable[[], float], pool: str, max_length: int) -> str:
+        """
+        Return a random string of up to ``max_length`` characters, taken from
+        ``pool``, using the random number generator ``rand``
+        """
+        # Drawing each character separately (or using `Random.randrange()`)
+        # makes generating large corpora several times slower.
+        length = int(rand() * (max_length + 1))
+        start = int(rand() * (len(pool) - length + 1))
+        return pool[start : start + length]
+
+    def pairs(self) -> Iterator[tuple[str, str]]:
+        """
+        Generate the key-value pairs of the corpus, including duplicates, in
+        order of occurrence
+        """
+        rng = random.Random(self.seed)
+        pool = self._char_pool(rng)
+        rand = rng.random
+        recent: deque[str] = deque(maxlen=DUPLICATE_WINDOW)
+        for i in range(self.entries):
+            if recent and rand() < self.duplicate_ratio:
+                key = recent[int(rand() * len(recent))]
+            else:
+                # Make the key distinct from all other non-duplicates:
+                key = f"{self._random_string(rand, pool, self.key_length)}.{i}"
+                recent.append(key)
+            yield (key, self._random_string(rand, pool, self.value_length))
+
+    def expected(self) -> dict[str, str]:
+        """
+        Return the `dict` that loading the corpus in any format should
+        produce
+        """
+        return dict(self.pairs())
+
+    def lines(self) -> Iterator[str]:
+        """
+        Generate the lines of the corpus in ``.properties`` format, including
+        comments, blank lines, and continuation lines.  Each string yielded is
+        one logical line ending with `newline`.
+        """
+        rng = random.Random(f"{self.seed}:layout")
+        pool = self._char_pool(rng)
+        rand = rng.random
+        nl = self.newline
+        seps = self.separators
+        for key, value in self.pairs():
+            if rand() < self.comment_ratio:
+                comment = self._random_string(rand, pool, self.value_length)
+                comment = comment.replace("\r", "").replace("\n", "")
+                yield to_comment(comment, ensure_ascii=self.ensure_ascii or None) + nl
+            if rand() < self.blank_ratio:
+                yield nl
+            line = join_key_value(
+                key,
+                value,
+                separator=seps[int(rand() * len(seps))],
+                ensure_ascii=self.ensure_ascii,
+            )
+            if rand() < self.continuation_ratio:
+                line = _split_line(rng, line, nl)
+            yield line + nl
+
+    def text(self) -> str:
+        """Return the whole corpus in ``.properties`` format as a `str`"""
+        return "".join(self.lines())
+
+    def write(self, fp: TextIO) -> None:
+        """
+        Write the corpus in ``.properties`` format to ``fp``, which should be
+        opened with an encoding of Latin-1 (or, if `ensure_ascii` is false, an
+        encoding capable of representing all of the corpus's characters)
+        """
+        lines = self.lines()
+        while chunk := "".join(itertools.islice(lines, WRITE_BATCH_SIZE)):
+            fp.write(chunk)
+
+    def dump(self, fp: TextIO) -> None:
+        """
+        Write the corpus's pairs to ``fp`` using `javaproperties.dump()`.
+        Comments, blank lines, continuations, `newline`, and `separators` are
+        not used.
+        """
+        dump(self.pairs(), fp, timestamp=None, ensure_ascii=self.ensure_ascii)
+
+    def dump_xml(self, fp: BinaryIO, encoding: str = "UTF-8") -> None:
+        """
+        Write the corpus's pairs to ``fp`` using `javaproperties.dump_xml()`.
+        For the result to load back as `expected()`, `escaped_chars` must be
+        limited to `XML_ESCAPED_CHARS`.
+        """
+        dump_xml(self.pairs(), fp, encoding=encoding)
+
+    def xml(self, encoding: str = "UTF-8") -> bytes:
+        """Return the corpus in XML format as `bytes`"""
+        fp = BytesIO()
+        self.dump_xml(fp, encoding=encoding)
+        return fp.getvalue()
+
+
+def _split_line(rng: random.Random, line: str, nl: str) -> str:
+    """
+    Split ``line`` in two at a random point with a backslash continuation,
+    avoiding splitting inside an escape sequence or putting whitespace (which
+    would be discarded) at the start of the continuation line
+    """
+    if len(line) < 2:
+        return line
+    cut = rng.randrange(1, len(line))
+    while cut > 0 and (
+        line[cut - 1] == "\\"
+        or "\\u" in line[max(cut - 5, 0) : cut]
+        or line[cut] in " \t\f"
+    ):
+        cut -= 1
+    if cut == 0:
+        return line
+    indent = rng.choice(["", "  ", "    ", "\t"])
+    return line[:cut] + "\\" + nl + indent + line[cut:]
+
+
+def parse_size(s: str) -> int:
+    """
+    Parse a size in bytes, optionally followed by a binary multiplier suffix
+    like ``"K"``, ``"MiB"``, or ``"GB"``
+    """
+    m = SIZE_RGX.fullmatch(s)
+    if not m:
+        raise ValueError(f"Invalid size: {s!r}")
+    power = " KMGT".index(m[2].upper() or " ")
+    return int(float(m[1]) * 1024**power)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m javaproperties.corpus",
+        description="Generate a synthetic .properties corpus",
+    )
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument(
+        "-n", "--entries", type=int, help="Number of entries [default: 1000]"
+    )
+    size.add_argument(
+        "-s",
+        "--size",
+        type=parse_size,
+        help="Approximate size of the output, e.g. 100K, 20M, or 1G",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["properties", "dump", "xml"],
+        default="properties",
+        help=(
+            "Write the corpus in .properties format with comments, blank lines"
+            " & continuations ('properties'), in .properties format with dump()"
+            " ('dump'), or in XML format with dump_xml() ('xml')"
+        ),
+    )
+    for name, dflt in [
+        ("escape-ratio", Corpus.escape_ratio),
+        ("bmp-ratio", Corpus.bmp_ratio),
+        ("astral-ratio", Corpus.astral_ratio),
+        ("continuation-ratio", Corpus.continuation_ratio),
+        ("duplicate-ratio", Corpus.duplicate_ratio),
+        ("comment-ratio", Corpus.comment_ratio),
+        ("blank-ratio", Corpus.blank_ratio),
+    ]:
+        parser.add_argument(
+            f"--{name}",
+            type=float,
+            default=dflt,
+            metavar="RATIO",
+            help=f"[default: {dflt}]",
+        )
+    parser.add_argument(
+        "--newline",
+        choices=["lf", "crlf", "cr"],
+        default="lf",
+        help="Line ending for the 'properties' format [default: lf]",
+    )
+    parser.add_argument(
+        "--unicode",
+        action="store_true",
+        help="Write non-ASCII characters as-is in UTF-8 instead of escaping them",
+    )
+    parser.add_argument(
+        "outfile",
+        nargs="?",
+        default="-",
+        help="File to write the corpus to [default: stdout]",
+    )
+    args = parser.parse_args(argv)
+    params = {
+        "seed": args.seed,
+        "escape_ratio": args.escape_ratio,
+        "bmp_ratio": args.bmp_ratio,
+        "astral_ratio": args.astral_ratio,
+        "continuation_ratio": args.continuation_ratio,
+        "duplicate_ratio": args.duplicate_ratio,
+        "comment_ratio": args.comment_ratio,
+        "blank_ratio": args.blank_ratio,
+        "newline": {"lf": "\n", "crlf": "\r\n", "cr": "\r"}[args.newline],
+        "ensure_ascii": not args.unicode,
+    }
+    if args.format == "xml":
+        params["escaped_chars"] = XML_ESCAPED_CHARS
+    try:
+        if args.size is not None:
+            corpus = Corpus.for_size(args.size, **params)
+        else:
+            corpus = Corpus(
+                entries=args.entries if args.entries is not None else 1000,
+                **params,  # type: ignore[arg-type]
+            )
+    except ValueError as e:
+        parser.error(str(e))
+    if args.format == "xml":
+        if args.outfile == "-":
+            corpus.dump_xml(sys.stdout.buffer)
+        else:
+            with open(args.outfile, "wb") as fp:
+                corpus.dump_xml(fp)
+    else:
+        encoding = "utf-8" if args.unicode else "iso-8859-1"
+        if args.outfile == "-":
+            out = open(
+                sys.stdout.fileno(), "w", encoding=encoding, newline="", closefd=False
+            )
+        else:
+            out = open(args.outfile, "w", encoding=encoding, newline="")
+        with out:
+            if args.format == "dump":
+                corpus.dump(out)
+            else:
+                corpus.write(out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
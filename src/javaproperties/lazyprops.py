@@ -0,0 +1,99 @@
+from __future__ import annotations
+from collections.abc import Iterator, Mapping
+from typing import AnyStr, IO
+from .reading import KeyValue, _scan_source, unescape
+
+
+class LazyProperties(Mapping[str, str]):
+    """
+    .. versionadded:: 0.9.0
+
+    A read-only mapping of the key-value pairs in a simple line-oriented
+    ``.properties`` file in which values are only unescaped when they are
+    first accessed.  Instances are constructed from a file or string with
+    `LazyProperties.load()` or `LazyProperties.loads()`.
+
+    Keys are unescaped as the input is read, so iterating over, counting, and
+    testing membership of keys is as cheap as with a `dict`, but the values
+    are stored exactly as they appear in the input and are only decoded when
+    looked up (after which the decoded value is cached).  This makes loading
+    a large file in order to read only a few of its values faster than with
+    `load()`.
+
+    As with `load()`, later occurrences of a key override previous
+    occurrences of the same key.
+
+    .. note::
+
+        Because values are decoded lazily, an invalid ``\\uXXXX`` escape
+        sequence in a value causes an `InvalidUEscapeError` to be raised when
+        the value is accessed rather than when the file is loaded.  Invalid
+        escape sequences in keys are still reported at load time.
+    """
+
+    def __init__(self) -> None:
+        #: mapping from keys to their values as they appear in the input
+        self._raw: dict[str, str] = {}
+        #: mapping from keys to their unescaped values, for values that have
+        #: been accessed
+        self._values: dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._values[key] = unescape(self._raw[key])
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    @classmethod
+    def load(cls, fp: IO) -> LazyProperties:
+        """
+        Parse the contents of the `~io.IOBase.readline`-supporting file-like
+        object ``fp`` as a simple line-oriented ``.properties`` file and return
+        a `LazyProperties` instance.
+
+        ``fp`` may be either a text or binary filehandle, with or without
+        universal newlines enabled.  If it is a binary filehandle, its contents
+        are decoded as Latin-1.
+
+        :param IO fp: the file from which to read the ``.properties`` document
+        :rtype: LazyProperties
+        :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+            occurs in a key in the input
+        """
+        return cls._from_source(fp)
+
+    @classmethod
+    def loads(cls, s: AnyStr) -> LazyProperties:
+        """
+        Parse the contents of the string ``s`` as a simple line-oriented
+        ``.properties`` file and return a `LazyProperties` instance.
+
+        ``s`` may be either a text string or bytes string.  If it is a bytes
+        string, its contents are decoded as Latin-1.
+
+        :param Union[str,bytes] s: the string from which to read the
+            ``.properties`` document
+        :rtype: LazyProperties
+        :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+            occurs in a key in the input
+        """
+        return cls._from_source(s)
+
+    @classmethod
+    def _from_source(cls, src: IO | str | bytes) -> LazyProperties:
+        obj = cls()
+        raw = obj._raw
+        for elem_cls, _, key, value in _scan_source(src):
+            if elem_cls is KeyValue:
+                raw[unescape(key)] = value
+        return obj
@@ -0,0 +1,268 @@
+from __future__ import annotations
+from collections.abc import Callable, Iterable, Iterator, Sized
+import threading
+from time import perf_counter
+from types import TracebackType
+from typing import Any, IO, NamedTuple, TypeVar, cast
+
+T = TypeVar("T", bound=Sized)
+U = TypeVar("U")
+F = TypeVar("F", bound=IO)
+
+#: The currently-registered metrics listeners.  Instrumented functions check
+#: this list's truthiness before doing anything else, so that instrumentation
+#: costs nothing more than that when no listeners are registered.  The list is
+#: only ever modified in place.
+_listeners: list[Callable[[CallMetrics], Any]] = []
+
+_listeners_lock = threading.Lock()
+
+
+class CallMetrics(NamedTuple):
+    """
+    .. versionadded:: 0.9.0
+
+    Measurements of a single call to an instrumented function, as passed to
+    the listeners registered with `add_metrics_listener()`
+    """
+
+    #: The name of the function called, e.g., ``"load"`` or
+    #: ``"PropertiesFile.dump"``
+    operation: str
+    #: The duration of the call in seconds
+    duration: float
+    #: The number of bytes (or, for text input, characters) read
+    bytes_in: int
+    #: The number of bytes (or, for text output, characters) written or
+    #: returned
+    bytes_out: int
+    #: The number of key-value entries read or written
+    entries: int
+    #: The exception raised by the call, if any
+    error: BaseException | None
+
+
+def add_metrics_listener(listener: Callable[[CallMetrics], Any]) -> None:
+    """
+    .. versionadded:: 0.9.0
+
+    Register a callable to be called with a `CallMetrics` instance after every
+    call to an instrumented function.  The instrumented functions are `load()`,
+    `loads()`, `load_path()`, `dump()`, `dumps()`, `load_xml()`, `loads_xml()`,
+    `dump_xml()`, `dumps_xml()`, and the ``load()``, ``loads()``, ``dump()``,
+    and ``dumps()`` methods of `PropertiesFile`.
+
+    Listeners are called synchronously in the thread that made the call, in
+    order of registration, and any exceptions they raise are propagated to
+    the caller.  When no listeners are registered, the instrumented functions
+    do not measure anything.
+
+    :param callable listener: the callable to register
+    """
+    with _listeners_lock:
+        _listeners.append(listener)
+
+
+def remove_metrics_listener(listener: Callable[[CallMetrics], Any]) -> None:
+    """
+    .. versionadded:: 0.9.0
+
+    Unregister a listener registered with `add_metrics_listener()`
+
+    :param callable listener: the callable to unregister
+    :raises ValueError: if ``listener`` is not registered
+    """
+    with _listeners_lock:
+        _listeners.remove(listener)
+
+
+class OperationStats(NamedTuple):
+    """
+    .. versionadded:: 0.9.0
+
+    Totals of the `CallMetrics` recorded by a `MetricsRegistry` for a single
+    operation
+    """
+
+    #: The number of calls
+    calls: int = 0
+    #: The number of calls that raised an exception
+    errors: int = 0
+    #: The total duration of all calls in seconds
+    duration: float = 0.0
+    #: The duration of the longest call in seconds
+    max_duration: float = 0.0
+    #: The total number of bytes (or characters) read
+    bytes_in: int = 0
+    #: The total number of bytes (or characters) written or returned
+    bytes_out: int = 0
+    #: The total number of key-value entries read or written
+    entries: int = 0
+
+
+class MetricsRegistry:
+    """
+    .. versionadded:: 0.9.0
+
+    A metrics listener that keeps running totals of the `CallMetrics` it
+    receives for each operation.  Use `install()` & `uninstall()` (or a
+    ``with`` block) to register & unregister the registry as a listener, and
+    call `snapshot()` to get the current totals, e.g., for exporting them to a
+    monitoring system.
+
+    >>> from javaproperties import MetricsRegistry, loads
+    >>> registry = MetricsRegistry()
+    >>> with registry:
+    ...     loads("key=value\\nfoo=bar\\n")
+    ...
+    {'key': 'value', 'foo': 'bar'}
+    >>> stats = registry.snapshot()["loads"]
+    >>> (stats.calls, stats.errors, stats.bytes_in, stats.entries)
+    (1, 0, 18, 2)
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, metrics: CallMetrics) -> None:
+        with self._lock:
+            stats = self._stats.get(metrics.operation, _EMPTY_STATS)
+            self._stats[metrics.operation] = OperationStats(
+                calls=stats.calls + 1,
+                errors=stats.errors + (metrics.error is not None),
+                duration=stats.duration + metrics.duration,
+                max_duration=max(stats.max_duration, metrics.duration),
+                bytes_in=stats.bytes_in + metrics.bytes_in,
+                bytes_out=stats.bytes_out + metrics.bytes_out,
+                entries=stats.entries + metrics.entries,
+            )
+
+    def __enter__(self) -> MetricsRegistry:
+        self.install()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        self.uninstall()
+
+    def install(self) -> None:
+        """Register the registry with `add_metrics_listener()`"""
+        add_metrics_listener(self)
+
+    def uninstall(self) -> None:
+        """Unregister the registry with `remove_metrics_listener()`"""
+        remove_metrics_listener(self)
+
+    def snapshot(self) -> dict[str, OperationStats]:
+        """
+        Return a `dict` mapping the names of the operations called so far to
+        their current totals
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self) -> None:
+        """Discard all totals recorded so far"""
+        with self._lock:
+            self._stats.clear()
+
+
+_EMPTY_STATS = OperationStats()
+
+
+class _Measurement:
+    """
+    A context manager for measuring a call to an instrumented function and
+    reporting the results to the listeners on exit
+    """
+
+    __slots__ = ("operation", "bytes_in", "bytes_out", "entries", "start")
+
+    def __init__(self, operation: str, bytes_in: int = 0) -> None:
+        self.operation = operation
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+        self.entries = 0
+        self.start = 0.0
+
+    def __enter__(self) -> _Measurement:
+        self.start = perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        metrics = CallMetrics(
+            operation=self.operation,
+            duration=perf_counter() - self.start,
+            bytes_in=self.bytes_in,
+            bytes_out=self.bytes_out,
+            entries=self.entries,
+            error=exc_val,
+        )
+        for listener in tuple(_listeners):
+            listener(metrics)
+
+    def count_entries(self, items: Iterable[U]) -> Iterator[U]:
+        for x in items:
+            self.entries += 1
+            yield x
+
+    def count_in(self, chunks: Iterable[T]) -> Iterator[T]:
+        for c in chunks:
+            self.bytes_in += len(c)
+            yield c
+
+    def hook(
+        self, object_pairs_hook: Callable[[Iterator[Any]], U]
+    ) -> Callable[[Iterator[Any]], U]:
+        """Wrap an ``object_pairs_hook`` to count the pairs passed to it"""
+        return lambda pairs: object_pairs_hook(self.count_entries(pairs))
+
+    def reader(self, fp: F) -> F:
+        """Wrap ``fp`` so that the data read from it is added to `bytes_in`"""
+        return cast(F, _CountingReader(fp, self))
+
+    def writer(self, fp: F) -> F:
+        """Wrap ``fp`` so that the data written to it is added to `bytes_out`"""
+        return cast(F, _CountingWriter(fp, self))
+
+
+class _CountingReader:
+    """
+    Wraps a file's ``read()`` & ``readline()`` methods to count the data read
+    """
+
+    def __init__(self, fp: IO, measurement: _Measurement) -> None:
+        self._fp = fp
+        self._measurement = measurement
+
+    def read(self, size: int = -1) -> Any:
+        data = self._fp.read(size)
+        self._measurement.bytes_in += len(data)
+        return data
+
+    def readline(self, size: int = -1) -> Any:
+        data = self._fp.readline(size)
+        self._measurement.bytes_in += len(data)
+        return data
+
+
+class _CountingWriter:
+    """Wraps a file's ``write()`` method to count the data written"""
+
+    def __init__(self, fp: IO, measurement: _Measurement) -> None:
+        self._fp = fp
+        self._measurement = measurement
+
+    def write(self, data: Any) -> Any:
+        self._measurement.bytes_out += len(data)
+        return self._fp.write(data)
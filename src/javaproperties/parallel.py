@@ -0,0 +1,361 @@
+from __future__ import annotations
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from itertools import chain
+import mmap
+import os
+from typing import Any, Literal, TypeVar, overload
+from .reading import _iterpairs, _scan_bytes, _splitlines_buffer, load_path
+
+T = TypeVar("T")
+
+P = TypeVar("P", bound="str | os.PathLike[str]")
+
+ExecutorSpec = Literal["process", "thread"] | Executor
+
+#: The maximum number of files that `load_many()` gives to a worker at a time
+#: when no ``chunksize`` is specified
+MAX_FILES_PER_TASK = 64
+
+#: The approximate number of bytes of a file that `load_path_parallel()` gives
+#: to a worker at a time
+PARALLEL_CHUNK_SIZE = 16 << 20
+
+
+class FileLoadError(Exception):
+    """
+    .. versionadded:: 0.9.0
+
+    Raised by `load_many()` when an error occurs while loading one of its files
+    """
+
+    def __init__(self, path: str | os.PathLike[str], error: Exception) -> None:
+        #: The path of the file that could not be loaded
+        self.path: str | os.PathLike[str] = path
+        #: The exception raised while loading the file
+        self.error: Exception = error
+        super().__init__(path, error)
+
+    def __str__(self) -> str:
+        return f"{os.fsdecode(self.path)}: {self.error}"
+
+
+@overload
+def load_many(
+    paths: Iterable[P],
+    *,
+    executor: ExecutorSpec = ...,
+    max_workers: int | None = ...,
+    ordered: bool = ...,
+    chunksize: int | None = ...,
+) -> Generator[tuple[P, dict[str, str]], None, None]: ...
+
+
+@overload
+def load_many(
+    paths: Iterable[P],
+    object_pairs_hook: type[T],
+    *,
+    executor: ExecutorSpec = ...,
+    max_workers: int | None = ...,
+    ordered: bool = ...,
+    chunksize: int | None = ...,
+) -> Generator[tuple[P, T], None, None]: ...
+
+
+@overload
+def load_many(
+    paths: Iterable[P],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+    *,
+    executor: ExecutorSpec = ...,
+    max_workers: int | None = ...,
+    ordered: bool = ...,
+    chunksize: int | None = ...,
+) -> Generator[tuple[P, T], None, None]: ...
+
+
+def load_many(  # type: ignore[no-untyped-def]
+    paths,
+    object_pairs_hook=dict,
+    *,
+    executor="process",
+    max_workers=None,
+    ordered=True,
+    chunksize=None,
+):
+    """
+    .. versionadded:: 0.9.0
+
+    Load multiple simple line-oriented ``.properties`` files concurrently.
+    Each file is parsed as by `load_path()`, with ``object_pairs_hook`` applied
+    to its key-value pairs, and a generator of ``(path, result)`` pairs is
+    returned.  If ``ordered`` is true (the default), the pairs are yielded in
+    the same order as ``paths``; otherwise, they are yielded as the files
+    finish loading.
+
+    By default, the files are divided among the worker processes of a
+    `~concurrent.futures.ProcessPoolExecutor` so that they can be parsed on
+    multiple CPU cores; in this case, ``object_pairs_hook`` and its return
+    values must be picklable.  Pass ``executor="thread"`` to use a
+    `~concurrent.futures.ThreadPoolExecutor` instead, which is preferable when
+    loading is dominated by I/O, such as on network filesystems.  An existing
+    `~concurrent.futures.Executor` may also be passed, in which case it is not
+    shut down afterwards.
+
+    If a file cannot be loaded, a `FileLoadError` wrapping the original
+    exception is raised in place of the file's result, and any files not yet
+    loaded are skipped.
+
+    If you stop iterating over the generator early, call its ``close()``
+    method (e.g., via `contextlib.closing`) to cancel the loading of the
+    remaining files and wait for the workers to stop.  A newly created
+    executor is shut down once all work has been submitted to it, so its
+    workers exit after finishing the outstanding files even if the generator
+    is never closed.
+
+    :param paths: the paths of the ``.properties`` files to load
+    :type paths: iterable of str or os.PathLike
+    :param callable object_pairs_hook: class or function for combining the
+        key-value pairs of each file
+    :param executor: ``"process"``, ``"thread"``, or an
+        `~concurrent.futures.Executor` to run the workers in
+    :param Optional[int] max_workers: the maximum number of workers for a newly
+        created executor; defaults to the executor class's default
+    :param bool ordered: whether to yield results in the order of ``paths``
+        rather than in order of completion
+    :param Optional[int] chunksize: the number of files to give to a worker at
+        a time; by default, this is based on the number of files & workers, up
+        to `MAX_FILES_PER_TASK`
+    :rtype: Generator[tuple[path, dict[str, str]]] or Generator[tuple[path,
+        return value of object_pairs_hook]]
+    :raises FileLoadError: if a file cannot be loaded
+    """
+    _check_executor(executor)
+    paths = list(paths)
+    if chunksize is None:
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = min(max(len(paths) // (workers * 4), 1), MAX_FILES_PER_TASK)
+    elif chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    groups = [paths[i : i + chunksize] for i in range(0, len(paths), chunksize)]
+    return _load_many(groups, object_pairs_hook, executor, max_workers, ordered)
+
+
+def _load_many(
+    groups: list[list[Any]],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], Any],
+    executor: ExecutorSpec,
+    max_workers: int | None,
+    ordered: bool,
+) -> Generator[tuple[Any, Any], None, None]:
+    pool, owned = _get_executor(executor, max_workers)
+    futures: dict[Future[tuple[list[Any], FileLoadError | None]], list[Any]] = {}
+    try:
+        for g in groups:
+            futures[pool.submit(_load_files, g, object_pairs_hook)] = g
+        if owned:
+            # Let the workers exit as soon as the submitted work is done, even
+            # if the generator is abandoned without being closed.
+            pool.shutdown(wait=False)
+        for fut in futures if ordered else as_completed(futures):
+            results, error = fut.result()
+            yield from zip(futures[fut], results)
+            if error is not None:
+                raise error from error.error
+    finally:
+        _release(pool, owned, futures)
+
+
+def _load_files(
+    paths: list[Any], object_pairs_hook: Callable[[Iterator[tuple[str, str]]], Any]
+) -> tuple[list[Any], FileLoadError | None]:
+    """
+    Load the given files in order, stopping at the first one that fails.
+    Returns the results for the files loaded and the error, if any.
+    """
+    results = []
+    for p in paths:
+        try:
+            results.append(load_path(p, object_pairs_hook))
+        except Exception as e:
+            return (results, FileLoadError(p, e))
+    return (results, None)
+
+
+@overload
+def load_path_parallel(
+    path: str | os.PathLike[str],
+    *,
+    executor: ExecutorSpec = ...,
+    max_workers: int | None = ...,
+    chunk_size: int = ...,
+) -> dict[str, str]: ...
+
+
+@overload
+def load_path_parallel(
+    path: str | os.PathLike[str],
+    object_pairs_hook: type[T],
+    *,
+    executor: ExecutorSpec = ...,
+    max_workers: int | None = ...,
+    chunk_size: int = ...,
+) -> T: ...
+
+
+@overload
+def load_path_parallel(
+    path: str | os.PathLike[str],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+    *,
+    executor: ExecutorSpec = ...,
+    max_workers: int | None = ...,
+    chunk_size: int = ...,
+) -> T: ...
+
+
+def load_path_parallel(  # type: ignore[no-untyped-def]
+    path,
+    object_pairs_hook=dict,
+    *,
+    executor="process",
+    max_workers=None,
+    chunk_size=PARALLEL_CHUNK_SIZE,
+):
+    """
+    .. versionadded:: 0.9.0
+
+    Like `load_path()`, but split the file into chunks of roughly
+    ``chunk_size`` bytes and parse them concurrently, by default in a
+    `~concurrent.futures.ProcessPoolExecutor`.  This is intended for very large
+    files; files no larger than ``chunk_size`` are simply loaded with
+    `load_path()`.
+
+    Chunks only ever end at line endings that are not escaped by a backslash,
+    so no logical line is split between chunks.  The key-value pairs from all
+    chunks are passed to ``object_pairs_hook`` in order of occurrence, exactly
+    as with `load_path()`, and so later occurrences of a key still override
+    earlier ones by default.
+
+    :param path: the path to the ``.properties`` file
+    :type path: str or os.PathLike
+    :param callable object_pairs_hook: class or function for combining the
+        key-value pairs
+    :param executor: ``"process"``, ``"thread"``, or an
+        `~concurrent.futures.Executor` to run the workers in
+    :param Optional[int] max_workers: the maximum number of workers for a newly
+        created executor; defaults to the executor class's default
+    :param int chunk_size: the approximate number of bytes to give to a worker
+        at a time
+    :rtype: `dict` of text strings or the return value of ``object_pairs_hook``
+    :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+        occurs in the input
+    """
+    _check_executor(executor)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    with open(path, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size <= chunk_size:
+            bounds = None
+        else:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                bounds = _chunk_bounds(mm, chunk_size)
+    if bounds is None or len(bounds) <= 2:
+        return load_path(path, object_pairs_hook)
+    pool, owned = _get_executor(executor, max_workers)
+    futures = []
+    try:
+        for start, end in zip(bounds, bounds[1:]):
+            futures.append(pool.submit(_load_range, path, start, end))
+        return object_pairs_hook(chain.from_iterable(zip(*f.result()) for f in futures))
+    finally:
+        _release(pool, owned, futures)
+
+
+def _chunk_bounds(mm: mmap.mmap, chunk_size: int) -> list[int]:
+    """
+    Return the offsets at which to split ``mm`` into chunks of about
+    ``chunk_size`` bytes each, including the start & end of the data
+    """
+    size = len(mm)
+    bounds = [0]
+    pos = chunk_size
+    while pos < size:
+        # Find the first line ending at or after `pos` that does not end a
+        # continued line.
+        while True:
+            lf = mm.find(b"\n", pos)
+            cr = mm.find(b"\r", pos, size if lf == -1 else lf)
+            if cr != -1:
+                eol = cr
+                pos = cr + 2 if mm[cr + 1 : cr + 2] == b"\n" else cr + 1
+            elif lf != -1:
+                eol = lf - 1 if lf > 0 and mm[lf - 1] == 0x0D else lf
+                pos = lf + 1
+            else:
+                pos = size
+                break
+            i = eol
+            while i > 0 and mm[i - 1] == 0x5C:
+                i -= 1
+            if (eol - i) % 2 == 0:
+                break
+        if pos >= size:
+            break
+        bounds.append(pos)
+        pos += chunk_size
+    bounds.append(size)
+    return bounds
+
+
+def _load_range(
+    path: str | os.PathLike[str], start: int, end: int
+) -> tuple[list[str], list[str]]:
+    """
+    Parse the given byte range of the file at ``path`` and return its keys &
+    values as separate lists, which are faster to send between processes than
+    a list of pairs
+    """
+    with open(path, "rb") as fp:
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = mm[start:end]
+    keys: list[str] = []
+    values: list[str] = []
+    for k, v in _iterpairs(_scan_bytes(_splitlines_buffer(data))):
+        keys.append(k)
+        values.append(v)
+    return (keys, values)
+
+
+def _check_executor(executor: ExecutorSpec) -> None:
+    if executor not in ("process", "thread") and not isinstance(executor, Executor):
+        raise ValueError(f"Invalid executor: {executor!r}")
+
+
+def _get_executor(
+    executor: ExecutorSpec, max_workers: int | None
+) -> tuple[Executor, bool]:
+    """
+    Return an executor for ``executor`` along with whether it was newly created
+    """
+    if executor == "process":
+        return (ProcessPoolExecutor(max_workers), True)
+    elif executor == "thread":
+        return (ThreadPoolExecutor(max_workers), True)
+    else:
+        assert isinstance(executor, Executor)
+        return (executor, False)
+
+
+def _release(pool: Executor, owned: bool, futures: Iterable[Future[Any]]) -> None:
+    for fut in futures:
+        fut.cancel()
+    if owned:
+        pool.shutdown(wait=True)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from collections.abc import Iterable, Iterator, Mapping, MutableMapping
 from typing import Any, BinaryIO, IO, TextIO, TypeVar
+from weakref import WeakValueDictionary
 from .reading import load
 from .writing import dump
 from .xmlprops import dump_xml, load_xml
@@ -25,12 +26,17 @@ class Properties(MutableMapping[str, str]):
          `Properties` instances can now compare equal to `dict`\\s and other
          mapping types
 
+    .. versionchanged:: 0.9.0
+         ``cache_defaults`` parameter added
+
     :param data: A mapping or iterable of ``(key, value)`` pairs with which to
         initialize the `Properties` instance.  All keys and values in ``data``
         must be text strings.
     :type data: mapping or `None`
     :param Optional[Properties] defaults: a set of default properties that will
         be used as fallback for `getProperty`
+    :param bool cache_defaults: the initial value of the `cache_defaults`
+        attribute
 
     .. |java8properties| replace:: Java 8's ``java.util.Properties``
     .. _java8properties: https://docs.oracle.com/javase/8/docs/api/java/util/Properties.html
@@ -40,24 +46,99 @@ class Properties(MutableMapping[str, str]):
         self,
         data: None | Mapping[str, str] | Iterable[tuple[str, str]] = None,
         defaults: Properties | None = None,
+        *,
+        cache_defaults: bool = False,
     ) -> None:
         self.data: dict[str, str] = {}
-        #: A `Properties` subobject used as fallback for `getProperty`.  Only
-        #: `getProperty`, `propertyNames`, `stringPropertyNames`, and `__eq__`
-        #: use this attribute; all other methods (including the standard
-        #: mapping methods) ignore it.
-        self.defaults = defaults
+        #: the key-value pairs of the instance and its `defaults` chain
+        #: (earlier levels taking precedence), or `None` if not yet computed
+        self._flat: dict[str, str] | None = None
+        #: instances whose `_flat` was computed from this instance, keyed by
+        #: `id` (as `Properties` instances are unhashable)
+        self._dependents: WeakValueDictionary[int, Properties] | None = None
+        self._defaults = defaults
+        #: .. versionadded:: 0.9.0
+        #:
+        #: Whether `getProperty`, `propertyNames`, and `stringPropertyNames`
+        #: should use a cached merger of the instance and its `defaults` chain
+        #: instead of looking through each level of the chain on every call,
+        #: making lookups a single `dict` access.  The cache is rebuilt on the
+        #: next call after the instance or any level of its `defaults` chain
+        #: is modified through any `Properties` method or has its `defaults`
+        #: reassigned.  Modifications made directly to the `data` attribute
+        #: of any level are not detected.
+        self.cache_defaults = cache_defaults
         if data is not None:
             self.update(data)
 
+    @property
+    def defaults(self) -> Properties | None:
+        """
+        A `Properties` subobject used as fallback for `getProperty`.  Only
+        `getProperty`, `propertyNames`, `stringPropertyNames`, and `__eq__` use
+        this attribute; all other methods (including the standard mapping
+        methods) ignore it.
+        """
+        return self._defaults
+
+    @defaults.setter
+    def defaults(self, value: Properties | None) -> None:
+        self._defaults = value
+        self._changed()
+
+    def _changed(self) -> None:
+        # Invalidate all caches that include this instance's data
+        self._flat = None
+        if self._dependents:
+            for p in self._dependents.values():
+                p._flat = None
+            # The dependents will register again when they rebuild their
+            # caches.
+            self._dependents.clear()
+
+    def _flatten(self) -> dict[str, str]:
+        flat = dict(self.data)
+        level = self._defaults
+        while level is not None:
+            if level._dependents is None:
+                level._dependents = WeakValueDictionary()
+            level._dependents[id(self)] = self
+            for k, v in level.data.items():
+                flat.setdefault(k, v)
+            level = level._defaults
+        self._flat = flat
+        return flat
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_flat"] = None
+        state["_dependents"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        state = dict(state)
+        # Pickles made before version 0.9.0 store `defaults` as a plain
+        # attribute and lack the caching attributes.
+        if "defaults" in state:
+            state["_defaults"] = state.pop("defaults")
+        state.setdefault("_defaults", None)
+        state.setdefault("cache_defaults", False)
+        state["_flat"] = None
+        state["_dependents"] = None
+        self.__dict__.update(state)
+
     def __getitem__(self, key: str) -> str:
         return self.data[key]
 
     def __setitem__(self, key: str, value: str) -> None:
         self.data[key] = value
+        if self._flat is not None or self._dependents:
+            self._changed()
 
     def __delitem__(self, key: str) -> None:
         del self.data[key]
+        if self._flat is not None or self._dependents:
+            self._changed()
 
     def __iter__(self) -> Iterator[str]:
         return iter(self.data)
@@ -93,6 +174,11 @@ class Properties(MutableMapping[str, str]):
             the `Properties` instance
         :rtype: str (if ``key`` was found)
         """
+        if self.cache_defaults:
+            flat = self._flat
+            if flat is None:
+                flat = self._flatten()
+            return flat.get(key, defaultValue)
         try:
             return self[key]
         except KeyError:
@@ -121,6 +207,7 @@ class Properties(MutableMapping[str, str]):
             occurs in the input
         """
         self.data.update(load(inStream))
+        self._changed()
 
     def propertyNames(self) -> Iterator[str]:
         r"""
@@ -130,6 +217,11 @@ class Properties(MutableMapping[str, str]):
 
         :rtype: Iterator[str]
         """
+        if self.cache_defaults:
+            # `_flatten()` always creates a new dict, so this is unaffected by
+            # later modifications.
+            yield from self._flat if self._flat is not None else self._flatten()
+            return
         for k in self.data:
             yield k
         if self.defaults is not None:
@@ -162,6 +254,8 @@ class Properties(MutableMapping[str, str]):
 
         :rtype: set[str]
         """
+        if self.cache_defaults:
+            return set(self._flat if self._flat is not None else self._flatten())
         names = set(self.data)
         if self.defaults is not None:
             names.update(self.defaults.stringPropertyNames())
@@ -184,6 +278,7 @@ class Properties(MutableMapping[str, str]):
             attribute
         """
         self.data.update(load_xml(inStream))
+        self._changed()
 
     def storeToXML(
         self,
@@ -211,4 +306,6 @@ class Properties(MutableMapping[str, str]):
         Create a shallow copy of the mapping.  The copy's `defaults` attribute
         will be the same instance as the original's `defaults`.
         """
-        return type(self)(self.data, self.defaults)
+        dup = type(self)(self.data, self.defaults)
+        dup.cache_defaults = self.cache_defaults
+        return dup
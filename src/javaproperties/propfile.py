@@ -1,15 +1,630 @@
 from __future__ import annotations
+from array import array
+from bisect import bisect_right
 from collections import OrderedDict
-from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Reversible
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Reversible,
+    Sequence,
+)
 from datetime import datetime
-from io import BytesIO, StringIO
+from io import StringIO
+from itertools import chain, islice
 from typing import Any, AnyStr, IO, TextIO, cast
-from .reading import Comment, KeyValue, PropertiesElement, Whitespace, loads, parse
-from .util import CONTINUED_RGX, LinkedList, LinkedListNode, ascii_splitlines
-from .writing import java_timestamp, join_key_value, to_comment
+from .metrics import _listeners, _Measurement
+from .reading import (
+    Comment,
+    KeyValue,
+    PropertiesElement,
+    Whitespace,
+    _iterlines,
+    _scan,
+    loads,
+    unescape,
+)
+from .util import CONTINUED_RGX, ascii_splitlines
+from .writing import EscapeCache, java_timestamp, join_key_value, to_comment
 
 _NOSOURCE = ""  # .source value for new or modified KeyValue instances
 
+# Kinds of lines stored in `_Lines.kinds`
+_DELETED = 0
+_WHITESPACE = 1
+_COMMENT = 2
+_KEYVALUE = 3
+
+
+def _kind(elem: PropertiesElement) -> int:
+    if isinstance(elem, KeyValue):
+        return _KEYVALUE
+    elif isinstance(elem, Comment):
+        return _COMMENT
+    else:
+        return _WHITESPACE
+
+
+#: number of lines in each `_Page` built by `_Lines` (pages can grow larger when
+#: lines are inserted)
+_PAGE_SIZE = 1024
+
+
+class _Page:
+    """
+    A run of consecutive lines in a `_Lines` instance, stored as parallel
+    arrays.  Pages may be shared between `_Lines` instances, and only the
+    instance whose token is the page's ``owner`` may modify it in place.
+    """
+
+    __slots__ = ("owner", "kinds", "starts", "ends", "vstarts", "elems")
+
+    def __init__(
+        self,
+        owner: object,
+        kinds: bytearray,
+        starts: array[int],
+        ends: array[int],
+        vstarts: array[int],
+        elems: list[PropertiesElement | None],
+    ) -> None:
+        self.owner = owner
+        #: the kind of each line, or `_DELETED` for tombstones
+        self.kinds = kinds
+        #: the start & end offsets in the source of each line that is
+        #: unchanged since it was loaded; -1 for all other lines
+        self.starts = starts
+        self.ends = ends
+        #: the offset in the source of the start of the raw value of each
+        #: unchanged key-value pair whose raw value can be sliced out of the
+        #: source (i.e., that runs from this offset to the end of the line,
+        #: minus the line terminator); -1 for all other lines
+        self.vstarts = vstarts
+        #: the element for each new or modified line; `None` for tombstones
+        #: and lines loaded from the source
+        self.elems = elems
+
+    @classmethod
+    def empty(cls, owner: object) -> _Page:
+        return cls(owner, bytearray(), array("q"), array("q"), array("q"), [])
+
+    def copy(self, owner: object) -> _Page:
+        return _Page(
+            owner,
+            self.kinds[:],
+            self.starts[:],
+            self.ends[:],
+            self.vstarts[:],
+            self.elems[:],
+        )
+
+    def extend(self, elems: list[PropertiesElement]) -> None:
+        self.kinds.extend(map(_kind, elems))
+        nones = array("q", [-1]) * len(elems)
+        self.starts.extend(nones)
+        self.ends.extend(nones)
+        self.vstarts.extend(nones)
+        self.elems.extend(elems)
+
+
+class _Lines:
+    """
+    The lines of a `PropertiesFile`, stored in pages of parallel arrays.
+    Lines loaded from a document are stored as spans of the document's text
+    and are only turned into `PropertiesElement` instances on demand; new &
+    modified lines are stored as `PropertiesElement` instances.  Deleted lines
+    are left in place as tombstones until `compact()` is called.
+
+    Copies made with `copy()` share their pages with the original, and a page
+    is only copied when one of the instances sharing it modifies it.
+    """
+
+    def __init__(self, source: str = "") -> None:
+        #: the document from which lines were loaded
+        self.source = source
+        self.pages: list[_Page] = []
+        #: the position of the first line of each page
+        self.bounds = array("q")
+        #: the total number of lines, including tombstones
+        self.size = 0
+        #: whether every page other than the last holds exactly `_PAGE_SIZE`
+        #: lines, in which case `bounds` need not be searched
+        self.uniform = True
+        #: the number of leading positions that were loaded from `source`
+        self.loaded = 0
+        #: positions less than `loaded` (other than 0) at which a run of
+        #: unchanged lines that are contiguous in `source` is interrupted
+        self.breaks: set[int] = set()
+        #: the number of tombstones
+        self.deleted = 0
+        #: the owner of the pages that this instance may modify in place
+        self.token = object()
+
+    @classmethod
+    def load(cls, source: str) -> tuple[_Lines, list[tuple[int, str]]]:
+        """
+        Parse ``source`` and return a `_Lines` instance containing its lines
+        along with a list of the positions & keys of the key-value pairs
+        """
+        kinds = bytearray()
+        starts = []
+        vstarts = []
+        keys = []
+        pos = 0
+        for i, (elem_cls, src, key, value) in enumerate(_scan(_iterlines(source))):
+            starts.append(pos)
+            pos += len(src)
+            if elem_cls is KeyValue:
+                kinds.append(_KEYVALUE)
+                keys.append((i, unescape(key)))
+                if "\\u" in value:
+                    # Report invalid escape sequences now rather than when the
+                    # value is first used.
+                    unescape(value)
+                line = src.rstrip("\r\n")
+                if line.endswith(value):
+                    vstarts.append(pos - len(src) + len(line) - len(value))
+                else:
+                    vstarts.append(-1)
+            elif elem_cls is Comment:
+                kinds.append(_COMMENT)
+                vstarts.append(-1)
+            else:
+                kinds.append(_WHITESPACE)
+                vstarts.append(-1)
+        lines = cls(source)
+        ends = starts[1:] + [pos] if starts else []
+        lines._fill(kinds, starts, ends, vstarts, [None] * len(starts))
+        lines.loaded = lines.size
+        return lines, keys
+
+    def _fill(
+        self,
+        kinds: bytearray,
+        starts: Sequence[int],
+        ends: Sequence[int],
+        vstarts: Sequence[int],
+        elems: list[PropertiesElement | None],
+    ) -> None:
+        # Replace the pages with pages containing the given lines
+        self.pages = [
+            _Page(
+                self.token,
+                kinds[k : k + _PAGE_SIZE],
+                array("q", starts[k : k + _PAGE_SIZE]),
+                array("q", ends[k : k + _PAGE_SIZE]),
+                array("q", vstarts[k : k + _PAGE_SIZE]),
+                elems[k : k + _PAGE_SIZE],
+            )
+            for k in range(0, len(kinds), _PAGE_SIZE)
+        ]
+        self.bounds = array("q", range(0, len(kinds), _PAGE_SIZE))
+        self.size = len(kinds)
+        self.uniform = True
+
+    def _flatten(
+        self,
+    ) -> tuple[
+        bytearray, array[int], array[int], array[int], list[PropertiesElement | None]
+    ]:
+        # Return the concatenations of the pages' arrays
+        kinds = bytearray()
+        starts = array("q")
+        ends = array("q")
+        vstarts = array("q")
+        elems: list[PropertiesElement | None] = []
+        for page in self.pages:
+            kinds += page.kinds
+            starts += page.starts
+            ends += page.ends
+            vstarts += page.vstarts
+            elems += page.elems
+        return (kinds, starts, ends, vstarts, elems)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _locate(self, i: int) -> tuple[int, int]:
+        # Return the index of the page containing position `i` and the index
+        # of the position within the page
+        if self.uniform:
+            return divmod(i, _PAGE_SIZE)
+        k = bisect_right(self.bounds, i) - 1
+        return (k, i - self.bounds[k])
+
+    def _writable(self, k: int) -> _Page:
+        # Return the page at index `k`, first copying it if it's shared
+        page = self.pages[k]
+        if page.owner is not self.token:
+            page = self.pages[k] = page.copy(self.token)
+        return page
+
+    def _modify(self, i: int) -> tuple[_Page, int]:
+        # Return the (writable) page containing position `i` and the index of
+        # the position within the page
+        if self.uniform:
+            k, j = divmod(i, _PAGE_SIZE)
+        else:
+            k, j = self._locate(i)
+        page = self.pages[k]
+        if page.owner is not self.token:
+            page = self.pages[k] = page.copy(self.token)
+        return (page, j)
+
+    def iterkinds(self) -> Iterator[tuple[int, int]]:
+        """
+        Iterate over the positions & kinds of all non-deleted lines in order
+        """
+        for base, page in zip(self.bounds, self.pages):
+            for j, kind in enumerate(page.kinds):
+                if kind:
+                    yield (base + j, kind)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the positions of all non-deleted lines"""
+        return (i for i, _ in self.iterkinds())
+
+    def kind(self, i: int) -> int:
+        k, j = self._locate(i)
+        return self.pages[k].kinds[j]
+
+    def __getitem__(self, i: int) -> PropertiesElement:
+        k, j = self._locate(i)
+        page = self.pages[k]
+        elem = page.elems[j]
+        if elem is None:
+            assert page.kinds[j] != _DELETED, "Tried to fetch deleted line"
+            text = self.source[page.starts[j] : page.ends[j]]
+            kind = page.kinds[j]
+            if kind == _KEYVALUE:
+                ((_, _, key, value),) = _scan(iter(ascii_splitlines(text)))
+                elem = KeyValue(unescape(key), unescape(value), text)
+            elif kind == _COMMENT:
+                elem = Comment(text)
+            else:
+                elem = Whitespace(text)
+        return elem
+
+    def value(self, i: int) -> str:
+        """Return the value of the key-value pair at position ``i``"""
+        if self.uniform:
+            k, j = divmod(i, _PAGE_SIZE)
+        else:
+            k, j = self._locate(i)
+        page = self.pages[k]
+        elem = page.elems[j]
+        if elem is None:
+            vstart = page.vstarts[j]
+            if vstart >= 0:
+                return unescape(self.source[vstart : page.ends[j]].rstrip("\r\n"))
+            elem = self[i]
+        assert isinstance(elem, KeyValue)
+        return elem.value
+
+    def __setitem__(self, i: int, elem: PropertiesElement) -> None:
+        page, j = self._modify(i)
+        assert page.kinds[j] != _DELETED, "Tried to replace deleted line"
+        page.kinds[j] = _kind(elem)
+        page.elems[j] = elem
+        if page.starts[j] >= 0:
+            page.starts[j] = page.ends[j] = page.vstarts[j] = -1
+            self._break(i)
+
+    def __delitem__(self, i: int) -> None:
+        self.delete_many((i,))
+
+    def delete_many(self, positions: Iterable[int]) -> None:
+        """Equivalent to ``del self[i]`` for each ``i`` in ``positions``"""
+        for i in positions:
+            page, j = self._modify(i)
+            assert page.kinds[j] != _DELETED, "Tried to delete deleted line"
+            page.kinds[j] = _DELETED
+            page.elems[j] = None
+            self.deleted += 1
+            if page.starts[j] >= 0:
+                page.starts[j] = page.ends[j] = page.vstarts[j] = -1
+                self._break(i)
+
+    def _break(self, i: int) -> None:
+        # Called when the line at position `i` stops being the unchanged text
+        # from `source`
+        if 0 < i < self.loaded:
+            self.breaks.add(i)
+        if i + 1 < self.loaded:
+            self.breaks.add(i + 1)
+
+    def append(self, elem: PropertiesElement) -> int:
+        """Append ``elem`` and return its position"""
+        return self.extend([elem])
+
+    def extend(self, elems: list[PropertiesElement]) -> int:
+        """Append all of ``elems`` and return the position of the first one"""
+        start = self.size
+        pos = 0
+        while pos < len(elems):
+            if not self.pages or len(self.pages[-1].kinds) >= _PAGE_SIZE:
+                self.bounds.append(self.size + pos)
+                self.pages.append(_Page.empty(self.token))
+            page = self._writable(len(self.pages) - 1)
+            chunk = elems[pos : pos + _PAGE_SIZE - len(page.kinds)]
+            page.extend(chunk)
+            pos += len(chunk)
+        self.size += len(elems)
+        return start
+
+    def last(self) -> int | None:
+        """Return the position of the last non-deleted line, if any"""
+        for k in reversed(range(len(self.pages))):
+            n = len(self.pages[k].kinds.rstrip(b"\0"))
+            if n:
+                return self.bounds[k] + n - 1
+        return None
+
+    def insert(self, i: int, elems: list[PropertiesElement]) -> int:
+        """
+        Insert ``elems`` before the line at position ``i`` (or at the end if
+        ``i`` equals ``len(self)``).  Tombstones immediately before ``i`` are
+        reused where possible; if there are not enough of them, the lines at
+        positions ``i`` and onwards are moved forwards, and the number of
+        positions by which they are moved is returned.
+        """
+        j = i
+        while j > 0 and i - j < len(elems) and self.kind(j - 1) == _DELETED:
+            j -= 1
+        shift = len(elems) - (i - j)
+        if shift:
+            if i == self.size:
+                # Let `extend()` take care of the details.
+                self.extend([Whitespace("")] * shift)
+                start = self.size - shift
+                for pos in range(start, self.size):
+                    k, o = self._locate(pos)
+                    page = self.pages[k]
+                    page.kinds[o] = _DELETED
+                    page.elems[o] = None
+            else:
+                k, o = self._locate(i)
+                page = self._writable(k)
+                page.kinds[o:o] = bytes(shift)
+                nones = array("q", [-1]) * shift
+                page.starts[o:o] = nones
+                page.ends[o:o] = nones
+                page.vstarts[o:o] = nones
+                page.elems[o:o] = [None] * shift
+                for kk in range(k + 1, len(self.pages)):
+                    self.bounds[kk] += shift
+                self.size += shift
+                self.uniform = False
+                if i < self.loaded:
+                    self.loaded += shift
+                    self.breaks = {b + shift if b >= i else b for b in self.breaks}
+            self.deleted += shift
+        for pos, elem in enumerate(elems, start=j):
+            page, o = self._modify(pos)
+            page.kinds[o] = _kind(elem)
+            page.elems[o] = elem
+            self.deleted -= 1
+            self._break(pos)
+        return shift
+
+    def compact(self) -> array[int]:
+        """
+        Remove all tombstones and return an array mapping old positions to new
+        positions (or -1 for removed tombstones)
+        """
+        kinds, starts, ends, vstarts, elems = self._flatten()
+        keep = [i for i, k in enumerate(kinds) if k]
+        remap = array("q", [-1]) * len(kinds)
+        for new, old in enumerate(keep):
+            remap[old] = new
+        starts = array("q", [starts[i] for i in keep])
+        ends = array("q", [ends[i] for i in keep])
+        self._fill(
+            kinds.replace(b"\0", b""),
+            starts,
+            ends,
+            array("q", [vstarts[i] for i in keep]),
+            [elems[i] for i in keep],
+        )
+        self.loaded = loaded = sum(1 for i in keep if i < self.loaded)
+        self.breaks = {
+            i
+            for i in range(1, loaded)
+            if starts[i] < 0 or starts[i - 1] < 0 or starts[i] != ends[i - 1]
+        }
+        self.deleted = 0
+        return remap
+
+    def copy(self) -> _Lines:
+        """
+        Return a copy of the instance that shares its pages with the original
+        """
+        dup = _Lines(self.source)
+        dup.pages = self.pages[:]
+        dup.bounds = self.bounds[:]
+        dup.size = self.size
+        dup.uniform = self.uniform
+        dup.loaded = self.loaded
+        dup.breaks = set(self.breaks)
+        dup.deleted = self.deleted
+        # The pages are now shared, so neither instance may modify them in
+        # place.
+        self.token = object()
+        return dup
+
+    def write(self, fp: TextIO, render: Callable[[PropertiesElement], str]) -> None:
+        """
+        Write the lines to ``fp``, writing each run of unchanged lines that
+        are contiguous in `source` with a single call and converting all other
+        lines to strings with ``render``
+        """
+        source = self.source
+        _, starts, ends, _, elems = self._flatten()
+        # The text `source[start:end]` is pending output
+        start = end = -1
+        i = 0
+        stops = sorted(self.breaks)
+        stops.append(self.loaded)
+        for b in stops:
+            # Positions i+1 through b-1 are unchanged and contiguous in
+            # `source` with the positions before them.
+            if i < b and starts[i] < 0:
+                elem = elems[i]
+                if elem is not None:
+                    if start < end:
+                        fp.write(source[start:end])
+                    start = end = -1
+                    fp.write(render(elem))
+                i += 1
+            if i < b:
+                if starts[i] != end:
+                    if start < end:
+                        fp.write(source[start:end])
+                    start = starts[i]
+                end = ends[b - 1]
+            i = b
+        if start < end:
+            fp.write(source[start:end])
+        for elem in elems[self.loaded :]:
+            if elem is not None:
+                fp.write(render(elem))
+
+    def _check(self) -> None:
+        """
+        Assert the internal consistency of the instance's data structures.
+        This method is for debugging only.
+        """
+        assert len(self.bounds) == len(self.pages), "Page bounds are wrong"
+        size = 0
+        for base, page in zip(self.bounds, self.pages):
+            assert base == size, "Page bound is wrong"
+            assert page.kinds, "Empty page"
+            assert (
+                len(page.kinds)
+                == len(page.starts)
+                == len(page.ends)
+                == len(page.vstarts)
+                == len(page.elems)
+            ), "Page arrays differ in length"
+            size += len(page.kinds)
+        assert size == self.size, "Size is wrong"
+        assert self.deleted == sum(
+            page.kinds.count(_DELETED) for page in self.pages
+        ), "Bad tombstone count"
+        assert self.loaded <= self.size, "Too many loaded lines"
+        prev_start = prev_end = -1
+        for i in range(self.size):
+            k, j = self._locate(i)
+            page = self.pages[k]
+            kind = page.kinds[j]
+            start = page.starts[j]
+            if kind == _DELETED:
+                assert page.elems[j] is None, "Deleted line has element"
+                assert start < 0, "Deleted line has source"
+            else:
+                line = self[i]
+                assert _kind(line) == kind, "Line has wrong kind"
+                if start >= 0:
+                    assert i < self.loaded, "Loaded line after new lines"
+                    assert (
+                        self.source[start : page.ends[j]] == line.source
+                    ), "Loaded line does not match its source"
+                else:
+                    assert page.elems[j] is not None, "Modified line not stored"
+            if 0 < i < self.loaded and i not in self.breaks:
+                assert (
+                    prev_start >= 0 and start == prev_end
+                ), "Unrecorded break in loaded lines"
+            prev_start = start
+            prev_end = page.ends[j]
+
+
+class _SharedIndex(MutableMapping[str, "int | list[int]"]):
+    """
+    A mutable view of a `PropertiesFile` key index that is shared with other
+    copies of the same file.  The shared ``base`` mapping is never modified;
+    instead, entries for keys that have been changed or removed since the
+    copy was made are stored in ``changed`` (with removed keys mapped to
+    `None`), and keys that are not in the
+    base mapping (or that were removed from it and then added again, and
+    thus now come last) are stored in order in ``added``.
+
+    List entries may be shared as well and so must never be modified in
+    place.
+    """
+
+    def __init__(
+        self,
+        base: Mapping[str, int | list[int]],
+        changed: dict[str, int | list[int] | None] | None = None,
+        added: dict[str, int | list[int]] | None = None,
+        removed: int = 0,
+    ) -> None:
+        self.base = base
+        self.changed = {} if changed is None else changed
+        self.added = {} if added is None else added
+        #: the number of keys of ``base`` that have been removed
+        self.removed = removed
+
+    def _in_base(self, key: str) -> bool:
+        # Whether `key` is a key of `base` that has not been removed
+        return key in self.base and self.changed.get(key, 0) is not None
+
+    def __getitem__(self, key: str) -> int | list[int]:
+        try:
+            return self.added[key]
+        except KeyError:
+            pass
+        e = self.changed[key] if key in self.changed else self.base[key]
+        if e is None:
+            raise KeyError(key)
+        return e
+
+    def __setitem__(self, key: str, e: int | list[int]) -> None:
+        if key not in self.added and self._in_base(key):
+            self.changed[key] = e
+        else:
+            self.added[key] = e
+
+    def __delitem__(self, key: str) -> None:
+        try:
+            del self.added[key]
+        except KeyError:
+            if not self._in_base(key):
+                raise
+            self.changed[key] = None
+            self.removed += 1
+
+    def __iter__(self) -> Iterator[str]:
+        changed = self.changed
+        for key in self.base:
+            if changed.get(key, 0) is not None:
+                yield key
+        yield from self.added
+
+    def __reversed__(self) -> Iterator[str]:
+        yield from reversed(self.added)
+        changed = self.changed
+        for key in reversed(cast(Reversible[str], self.base)):
+            if changed.get(key, 0) is not None:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.base) - self.removed + len(self.added)
+
+    def copy(self) -> _SharedIndex:
+        return _SharedIndex(
+            self.base, dict(self.changed), dict(self.added), self.removed
+        )
+
+
+def _last(e: int | list[int]) -> int:
+    # Return the position of the last occurrence of a key from its entry in
+    # `PropertiesFile._key2slots`
+    return e if isinstance(e, int) else e[-1]
+
 
 class PropertiesFile(MutableMapping[str, str]):
     """
@@ -45,8 +660,8 @@ class PropertiesFile(MutableMapping[str, str]):
     comparing a `PropertiesFile` to any other type of mapping, only the
     key-value pairs are considered, and order is ignored.
 
-    `PropertiesFile` currently only supports reading & writing the simple
-    line-oriented format, not XML.
+    `PropertiesFile` only supports reading & writing the simple line-oriented
+    format, not XML; for XML documents, use `XMLPropertiesFile`.
     """
 
     def __init__(
@@ -54,12 +669,24 @@ class PropertiesFile(MutableMapping[str, str]):
         mapping: None | Mapping[str, str] | Iterable[tuple[str, str]] = None,
         **kwargs: str,
     ) -> None:
-        #: mapping from keys to list of LinkedListNode's in self._lines
-        self._key2nodes: MutableMapping[
-            str, list[LinkedListNode[PropertiesElement]]
-        ] = OrderedDict()
-        #: linked list of PropertiesElement's in order of appearance in file
-        self._lines: LinkedList[PropertiesElement] = LinkedList()
+        #: mapping from keys to the position in self._lines of their
+        #: occurrence or (for keys that occur more than once in the input) to
+        #: a list of the positions of their occurrences, minus `_offset`.  May
+        #: be a `_SharedIndex` after `copy()`, in which case list entries must
+        #: not be modified in place.
+        self._key2slots: MutableMapping[str, int | list[int]] = OrderedDict()
+        #: the number of positions by which all key-value pairs have been
+        #: moved forwards by insertions of comments before them
+        self._offset = 0
+        #: the lines of the file in order of appearance
+        self._lines = _Lines()
+        #: pairs of lists from `_key2slots` that are no longer in use and
+        #: indices into them; the lines at the positions in each list from the
+        #: index onwards are to be deleted by `_flush()`
+        self._pending: list[tuple[list[int], int]] = []
+        #: the cached return value of `_scan_header()`, or `None` if it needs
+        #: to be recomputed
+        self._header: tuple[int | None, int, str | None] | None = None
         if mapping is not None:
             self.update(mapping)
         self.update(kwargs)
@@ -69,88 +696,183 @@ class PropertiesFile(MutableMapping[str, str]):
         Assert the internal consistency of the instance's data structures.
         This method is for debugging only.
         """
-        for k, ns in self._key2nodes.items():
+        self._flush()
+        header = self._header
+        self._header = None
+        assert header is None or header == self._scan_header(), "Stale header"
+        lines = self._lines
+        lines._check()
+        assert len(list(self._key2slots)) == len(self._key2slots), "Bad key count"
+        for k, e in self._key2slots.items():
             assert k is not None, "null key"
-            assert ns, "Key does not map to any nodes"
-            indices = []
-            for n in ns:
-                ix = self._lines.find_node(n)
-                assert ix is not None, "Key has node not in line list"
-                indices.append(ix)
-                assert isinstance(n.value, KeyValue), "Key maps to comment"
-                assert n.value.key == k, "Key does not map to itself"
-                assert n.value.value is not None, "Key has null value"
-            assert indices == sorted(indices), "Key's nodes are not in order"
-        for line in self._lines:
+            if isinstance(e, int):
+                slots = [e + self._offset]
+            else:
+                assert len(e) > 1, "Key maps to short list"
+                slots = [i + self._offset for i in e]
+            for i in slots:
+                assert lines.kind(i) != _DELETED, "Key maps to deleted line"
+                line = lines[i]
+                assert isinstance(line, KeyValue), "Key maps to comment"
+                assert line.key == k, "Key does not map to itself"
+                assert line.value is not None, "Key has null value"
+            assert slots == sorted(slots), "Key's lines are not in order"
+        for i in lines:
+            line = lines[i]
             if not isinstance(line, KeyValue):
                 assert line.source is not None, "Comment source not stored"
                 assert loads(line.source) == {}, "Comment source is not comment"
             else:
                 assert line.value is not None, "Key has null value"
+                assert line.value == lines.value(i), "Stored value is wrong"
                 if line.source != _NOSOURCE:
                     assert loads(line.source) == {
                         line.key: line.value
                     }, "Key source does not deserialize to itself"
-                assert line.key in self._key2nodes, "Key is missing from map"
-                assert any(
-                    line is n.value for n in self._key2nodes[line.key]
+                assert line.key in self._key2slots, "Key is missing from map"
+                e = self._key2slots[line.key]
+                i -= self._offset
+                assert (
+                    i == e if isinstance(e, int) else i in e
                 ), "Key does not map to itself"  # pragma: no cover
 
     def __getitem__(self, key: str) -> str:
-        pe = self._key2nodes[key][-1].value
-        assert isinstance(pe, KeyValue)
-        return pe.value
+        return self._lines.value(_last(self._key2slots[key]) + self._offset)
 
     def __setitem__(self, key: str, value: str) -> None:
         try:
-            nodes = self._key2nodes[key]
+            e = self._key2slots[key]
         except KeyError:
-            if self._lines.end is not None:
-                # We're adding a line to the end of the file, so make sure the
-                # line before it ends with a newline and (if it's not a
-                # comment) doesn't end with a trailing line continuation.
-                lastline = self._lines.end.value
-                if not (
-                    isinstance(lastline, KeyValue) and lastline.source == _NOSOURCE
-                ):
-                    lastsrc = lastline.source
-                    if isinstance(lastline, KeyValue):
-                        lastsrc = CONTINUED_RGX.sub(r"\1", lastsrc)
-                    if not lastsrc.endswith(("\r", "\n")):
-                        lastsrc += "\n"
-                    self._lines.end.value = lastline._with_source(lastsrc)
-            n = self._lines.append(KeyValue(key, value, _NOSOURCE))
-            self._key2nodes[key] = [n]
+            self._append({key: value})
         else:
-            # Update the first occurrence of the key and discard the rest.
-            # This way, the order in which the keys are listed in the file and
-            # dict will be preserved.
-            n0 = nodes.pop(0)
-            for n2 in nodes:
-                n2.unlink()
-            self._key2nodes[key] = [n0]
-            n0.value = KeyValue(key, value, _NOSOURCE)
+            if not isinstance(e, int):
+                # Update the first occurrence of the key and discard the rest.
+                # This way, the order in which the keys are listed in the file
+                # and dict will be preserved.  Deleting the rest is deferred
+                # to `_flush()` so that this takes constant time.
+                self._pending.append((e, 1))
+                e = self._key2slots[key] = e[0]
+            self._lines[e + self._offset] = KeyValue(key, value, _NOSOURCE)
+
+    def update(self, other: Any = (), /, **kwargs: str) -> None:
+        """
+        Update the mapping with the key-value pairs from the mapping or
+        iterable of pairs ``other`` and from ``kwargs``, with the same results
+        as assigning each pair in turn.
+
+        .. versionchanged:: 0.9.0
+            New keys are now appended in a single batch after all existing
+            keys have been updated in place, which is much faster than
+            assigning them one at a time.
+        """
+        if isinstance(other, Mapping):
+            pairs: Iterable[tuple[str, str]] = other.items()
+        elif hasattr(other, "keys"):
+            pairs = ((k, other[k]) for k in other.keys())
+        else:
+            pairs = other
+        key2slots = self._key2slots
+        new: dict[str, str] = {}
+        for key, value in chain(pairs, kwargs.items()):
+            if key in key2slots and key not in new:
+                self[key] = value
+            else:
+                new[key] = value
+        if new:
+            self._append(new)
+
+    def _append(self, pairs: dict[str, str]) -> None:
+        # Add key-value pairs for new keys to the end of the file
+        self._flush()
+        lines = self._lines
+        last = lines.last()
+        if last is not None:
+            # We're adding lines to the end of the file, so make sure the line
+            # before them ends with a newline and (if it's not a comment)
+            # doesn't end with a trailing line continuation.
+            lastline = lines[last]
+            if not (isinstance(lastline, KeyValue) and lastline.source == _NOSOURCE):
+                lastsrc = lastline.source
+                if isinstance(lastline, KeyValue):
+                    lastsrc = CONTINUED_RGX.sub(r"\1", lastsrc)
+                if not lastsrc.endswith(("\r", "\n")):
+                    lastsrc += "\n"
+                if lastsrc != lastline.source:
+                    lines[last] = lastline._with_source(lastsrc)
+        start = lines.extend([KeyValue(k, v, _NOSOURCE) for k, v in pairs.items()])
+        self._key2slots.update(
+            zip(pairs, range(start - self._offset, len(lines) - self._offset))
+        )
 
     def __delitem__(self, key: str) -> None:
-        for n in self._key2nodes.pop(key):
-            n.unlink()
+        e = self._key2slots.pop(key)
+        if isinstance(e, int):
+            i = e + self._offset
+            del self._lines[i]
+            if self._header is not None and i <= self._header[1]:
+                # The first key-value pair was deleted.
+                self._header = None
+            self._maybe_compact()
+        else:
+            self._pending.append((e, 0))
+
+    def _flush(self) -> None:
+        """
+        Delete the lines for repeated keys that have been reassigned or
+        deleted since the last call.  This must be called before any
+        operation that examines lines other than those in `_key2slots`.
+        """
+        if self._pending:
+            offset = self._offset
+            for slots, start in self._pending:
+                self._lines.delete_many(i + offset for i in islice(slots, start, None))
+            self._pending.clear()
+            self._header = None
+            self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        # Compacting once tombstones make up half of the lines keeps the cost
+        # of deletion amortized O(1).
+        lines = self._lines
+        if lines.deleted > 32 and 2 * lines.deleted > len(lines):
+            self._flush()
+            remap = lines.compact()
+            self._header = None
+            offset = self._offset
+            # Build a new index rather than updating the old one in place, as
+            # the old one may be shared with copies.
+            self._key2slots = OrderedDict(
+                (
+                    k,
+                    (
+                        remap[e + offset]
+                        if isinstance(e, int)
+                        else [remap[i + offset] for i in e]
+                    ),
+                )
+                for k, e in self._key2slots.items()
+            )
+            self._offset = 0
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._key2nodes)
+        return iter(self._key2slots)
 
     def __reversed__(self) -> Iterator[str]:
-        return reversed(cast(Reversible[str], self._key2nodes))
+        return reversed(cast(Reversible[str], self._key2slots))
 
     def __len__(self) -> int:
-        return len(self._key2nodes)
+        return len(self._key2slots)
 
     def _comparable(self) -> list[tuple[str | None, str]]:
+        self._flush()
+        lines = self._lines
         return [
             (p.key, p.value) if isinstance(p, KeyValue) else (None, p.source)
-            for n in self._lines.iternodes()
-            for p in [n.value]
+            for i in lines
+            for p in [lines[i]]
             ### TODO: Also include non-final repeated keys???
-            if not isinstance(p, KeyValue) or n is self._key2nodes[p.key][-1]
+            if not isinstance(p, KeyValue)
+            or i == _last(self._key2slots[p.key]) + self._offset
         ]
 
     def __eq__(self, other: Any) -> bool:
@@ -182,12 +904,12 @@ class PropertiesFile(MutableMapping[str, str]):
         :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
             occurs in the input
         """
-        obj = cls()
-        for elem in parse(fp):
-            n = obj._lines.append(elem)
-            if isinstance(elem, KeyValue):
-                obj._key2nodes.setdefault(elem.key, []).append(n)
-        return obj
+        if _listeners:
+            with _Measurement("PropertiesFile.load") as m:
+                obj = cls._from_source("".join(m.count_in(_iterlines(fp))))
+                m.entries = len(obj)
+                return obj
+        return cls._from_source("".join(_iterlines(fp)))
 
     @classmethod
     def loads(cls, s: AnyStr) -> PropertiesFile:
@@ -208,13 +930,40 @@ class PropertiesFile(MutableMapping[str, str]):
         :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
             occurs in the input
         """
+        if _listeners:
+            with _Measurement("PropertiesFile.loads", len(s)) as m:
+                obj = cls._from_source(
+                    s.decode("iso-8859-1") if isinstance(s, bytes) else s
+                )
+                m.entries = len(obj)
+                return obj
         if isinstance(s, bytes):
-            fp = BytesIO(s)
+            return cls._from_source(s.decode("iso-8859-1"))
         else:
-            fp = StringIO(s)
-        return cls.load(fp)
+            return cls._from_source(s)
 
-    def dump(self, fp: TextIO, separator: str = "=", ensure_ascii: bool = True) -> None:
+    @classmethod
+    def _from_source(cls, source: str) -> PropertiesFile:
+        obj = cls()
+        obj._lines, keys = _Lines.load(source)
+        key2slots = obj._key2slots
+        for i, key in keys:
+            e = key2slots.get(key)
+            if e is None:
+                key2slots[key] = i
+            elif isinstance(e, int):
+                key2slots[key] = [e, i]
+            else:
+                e.append(i)
+        return obj
+
+    def dump(
+        self,
+        fp: TextIO,
+        separator: str = "=",
+        ensure_ascii: bool = True,
+        escape_cache: EscapeCache | None = None,
+    ) -> None:
         """
         Write the mapping to a file in simple line-oriented ``.properties``
         format.
@@ -232,6 +981,9 @@ class PropertiesFile(MutableMapping[str, str]):
         .. versionchanged:: 0.8.0
             ``ensure_ascii`` parameter added
 
+        .. versionchanged:: 0.9.0
+            ``escape_cache`` parameter added
+
         .. note::
 
             Serializing a `PropertiesFile` instance with the :func:`dump()`
@@ -248,23 +1000,49 @@ class PropertiesFile(MutableMapping[str, str]):
             modified key-value pairs will be replaced with ``\\uXXXX`` escape
             sequences in the output; if false, non-ASCII characters will be
             passed through as-is
+        :param Optional[EscapeCache] escape_cache: if non-`None`, new or
+            modified keys & values will be escaped via the given `EscapeCache`
         :return: `None`
         """
-        for line in self._lines:
+        if _listeners:
+            with _Measurement("PropertiesFile.dump") as m:
+                m.entries = len(self)
+                self._dump(m.writer(fp), separator, ensure_ascii, escape_cache)
+        else:
+            self._dump(fp, separator, ensure_ascii, escape_cache)
+
+    def _dump(
+        self,
+        fp: TextIO,
+        separator: str,
+        ensure_ascii: bool,
+        escape_cache: EscapeCache | None,
+    ) -> None:
+        jkv = join_key_value if escape_cache is None else escape_cache.join_key_value
+
+        def render(line: PropertiesElement) -> str:
             if isinstance(line, KeyValue) and line.source == _NOSOURCE:
-                print(
-                    join_key_value(
+                return (
+                    jkv(
                         line.key,
                         line.value,
                         separator=separator,
                         ensure_ascii=ensure_ascii,
-                    ),
-                    file=fp,
+                    )
+                    + "\n"
                 )
             else:
-                fp.write(line.source)
+                return line.source
 
-    def dumps(self, separator: str = "=", ensure_ascii: bool = True) -> str:
+        self._flush()
+        self._lines.write(fp, render)
+
+    def dumps(
+        self,
+        separator: str = "=",
+        ensure_ascii: bool = True,
+        escape_cache: EscapeCache | None = None,
+    ) -> str:
         """
         Convert the mapping to a `str` in simple line-oriented ``.properties``
         format.
@@ -282,6 +1060,9 @@ class PropertiesFile(MutableMapping[str, str]):
         .. versionchanged:: 0.8.0
             ``ensure_ascii`` parameter added
 
+        .. versionchanged:: 0.9.0
+            ``escape_cache`` parameter added
+
         .. note::
 
             Serializing a `PropertiesFile` instance with the :func:`dumps()`
@@ -296,19 +1077,48 @@ class PropertiesFile(MutableMapping[str, str]):
             modified key-value pairs will be replaced with ``\\uXXXX`` escape
             sequences in the output; if false, non-ASCII characters will be
             passed through as-is
+        :param Optional[EscapeCache] escape_cache: if non-`None`, new or
+            modified keys & values will be escaped via the given `EscapeCache`
         :rtype: str
         """
         s = StringIO()
-        self.dump(s, separator=separator, ensure_ascii=ensure_ascii)
+        if _listeners:
+            with _Measurement("PropertiesFile.dumps") as m:
+                m.entries = len(self)
+                self._dump(s, separator, ensure_ascii, escape_cache)
+                out = s.getvalue()
+                m.bytes_out = len(out)
+                return out
+        self._dump(s, separator, ensure_ascii, escape_cache)
         return s.getvalue()
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        if "_key2nodes" in state:
+            # Pickled before version 0.9.0, when the lines were stored in a
+            # `LinkedList` of `PropertiesElement`s; rebuild from their sources.
+            source = "".join(elem.source for elem in state["_lines"])
+            state = type(self)._from_source(source).__dict__
+        self.__dict__.update(state)
+
     def copy(self) -> PropertiesFile:
-        """Create a copy of the mapping, including formatting information"""
+        """
+        Create a copy of the mapping, including formatting information
+
+        .. versionchanged:: 0.9.0
+            The copy now shares its data with the original, and each instance
+            only stores its own copies of the parts that it modifies, making
+            copying a large file take time & memory proportional to the
+            number of lines divided by a large constant.
+        """
+        self._flush()
+        if not isinstance(self._key2slots, _SharedIndex):
+            # From now on, the current index is never modified.
+            self._key2slots = _SharedIndex(self._key2slots)
         dup = type(self)()
-        for elem in self._lines:
-            n = dup._lines.append(elem)
-            if isinstance(elem, KeyValue):
-                dup._key2nodes.setdefault(elem.key, []).append(n)
+        dup._lines = self._lines.copy()
+        dup._key2slots = self._key2slots.copy()
+        dup._offset = self._offset
+        dup._header = self._header
         return dup
 
     @property
@@ -355,46 +1165,76 @@ class PropertiesFile(MutableMapping[str, str]):
         key = value
         zebra: apple
         """
-        for elem in self._lines:
-            if isinstance(elem, Comment) and elem.is_timestamp():
-                return elem.value
-            elif isinstance(elem, KeyValue):
-                return None
-        return None
+        ts, _, _ = self._scan_header()
+        if ts is None:
+            return None
+        elem = self._lines[ts]
+        assert isinstance(elem, Comment)
+        return elem.value
 
     @timestamp.setter
     def timestamp(self, value: str | None | bool | float | datetime) -> None:
         if value is not None and value is not False:
             if not isinstance(value, str):
                 value = java_timestamp(value)
-            comments = [Comment(c) for c in ascii_splitlines(to_comment(value) + "\n")]
+            comments: list[PropertiesElement] = [
+                Comment(c) for c in ascii_splitlines(to_comment(value) + "\n")
+            ]
         else:
             comments = []
-        for n in self._lines.iternodes():
-            if isinstance(n.value, Comment) and n.value.is_timestamp():
-                if comments:
-                    n.value = comments[0]
-                    for c in comments[1:]:
-                        n = n.insert_after(c)
-                else:
-                    n.unlink()
-                return
-            elif isinstance(n.value, KeyValue):
-                for c in comments:
-                    n.insert_before(c)
-                return
+        lines = self._lines
+        ts, end, _ = self._scan_header()
+        if ts is None:
+            self._offset += lines.insert(end, comments)
+            self._header = None
+        elif comments:
+            lines[ts] = comments[0]
+            if len(comments) > 1:
+                self._offset += lines.insert(ts + 1, comments[1:])
+                self._header = None
+            else:
+                assert isinstance(comments[0], Comment)
+                if not comments[0].is_timestamp():
+                    self._header = None
         else:
-            for c in comments:
-                self._lines.append(c)
+            del self.timestamp
 
     @timestamp.deleter
     def timestamp(self) -> None:
-        for n in self._lines.iternodes():
-            if isinstance(n.value, Comment) and n.value.is_timestamp():
-                n.unlink()
-                return
-            elif isinstance(n.value, KeyValue):
-                return
+        ts, _, _ = self._scan_header()
+        if ts is not None:
+            del self._lines[ts]
+            self._header = None
+            self._maybe_compact()
+
+    def _scan_header(self) -> tuple[int | None, int, str | None]:
+        """
+        Return the position of the timestamp comment (or `None` if there is
+        none), the position of the first key-value pair (or the number of
+        lines if there are none), and the value of `header_comment`.
+
+        The result is cached until a change is made to the lines before the
+        first key-value pair.
+        """
+        self._flush()
+        if self._header is None:
+            lines = self._lines
+            ts = None
+            comments = []
+            for i, kind in lines.iterkinds():
+                if kind == _KEYVALUE:
+                    break
+                elif ts is None and kind == _COMMENT:
+                    elem = lines[i]
+                    assert isinstance(elem, Comment)
+                    if elem.is_timestamp():
+                        ts = i
+                    else:
+                        comments.append(elem.value)
+            else:
+                i = len(lines)
+            self._header = (ts, i, "\n".join(comments) if comments else None)
+        return self._header
 
     @property
     def header_comment(self) -> str | None:
@@ -438,51 +1278,30 @@ class PropertiesFile(MutableMapping[str, str]):
         key = value
         zebra: apple
         """
-        comments = []
-        for elem in self._lines:
-            if isinstance(elem, Whitespace):
-                pass
-            elif isinstance(elem, KeyValue):
-                break
-            else:
-                assert isinstance(elem, Comment)
-                if elem.is_timestamp():
-                    break
-                comments.append(elem.value)
-        if comments:
-            return "\n".join(comments)
-        else:
-            return None
+        return self._scan_header()[2]
 
     @header_comment.setter
     def header_comment(self, value: str | None) -> None:
         if value is None:
-            comments = []
+            comments: list[PropertiesElement] = []
         else:
             comments = [Comment(c) for c in ascii_splitlines(to_comment(value) + "\n")]
-        while self._lines.start is not None:
-            n = self._lines.start
-            if isinstance(n.value, KeyValue) or (
-                isinstance(n.value, Comment) and n.value.is_timestamp()
-            ):
-                break
-            else:
-                n.unlink()
-        if self._lines.start is None:
-            for c in comments:
-                self._lines.append(c)
-        else:
-            n = self._lines.start
-            for c in comments:
-                n.insert_before(c)
+        stop = self._clear_header()
+        self._offset += self._lines.insert(stop, comments)
+        self._header = None
+        self._maybe_compact()
 
     @header_comment.deleter
     def header_comment(self) -> None:
-        while self._lines.start is not None:
-            n = self._lines.start
-            if isinstance(n.value, KeyValue) or (
-                isinstance(n.value, Comment) and n.value.is_timestamp()
-            ):
-                break
-            else:
-                n.unlink()
+        self._clear_header()
+        self._maybe_compact()
+
+    def _clear_header(self) -> int:
+        # Delete all lines before the timestamp or first key-value pair and
+        # return the position of the latter
+        lines = self._lines
+        ts, end, _ = self._scan_header()
+        stop = end if ts is None else ts
+        lines.delete_many([i for i in range(stop) if lines.kind(i) != _DELETED])
+        self._header = None
+        return stop
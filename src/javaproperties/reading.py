@@ -1,26 +1,38 @@
 from __future__ import annotations
-from collections.abc import Callable, Iterable, Iterator
-from io import BytesIO, StringIO
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import chain
+import mmap
+import os
 import re
-from typing import Any, IO, TypeVar, overload
-from .util import CONTINUED_RGX, ascii_splitlines
+from typing import Any, AnyStr, IO, TypeVar, overload
+from .metrics import _listeners, _Measurement
+from .util import CONTINUED_RGX, AsyncReader, aiter_chunks, ascii_splitlines
 
 T = TypeVar("T")
 
 
 @overload
-def load(fp: IO) -> dict[str, str]: ...
+def load(fp: IO, *, stats: ParseStats | None = ...) -> dict[str, str]: ...
 
 
 @overload
-def load(fp: IO, object_pairs_hook: type[T]) -> T: ...
+def load(
+    fp: IO, object_pairs_hook: type[T], *, stats: ParseStats | None = ...
+) -> T: ...
 
 
 @overload
-def load(fp: IO, object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T]) -> T: ...
+def load(
+    fp: IO,
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+    *,
+    stats: ParseStats | None = ...,
+) -> T: ...
 
 
-def load(fp, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
+def load(fp, object_pairs_hook=dict, *, stats=None):  # type: ignore[no-untyped-def]
     """
     Parse the contents of the `~io.IOBase.readline`-supporting file-like object
     ``fp`` as a simple line-oriented ``.properties`` file and return a `dict`
@@ -42,39 +54,53 @@ def load(fp, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
         Invalid ``\\uXXXX`` escape sequences will now cause an
         `InvalidUEscapeError` to be raised
 
+    .. versionchanged:: 0.9.0
+        ``stats`` argument added
+
     :param IO fp: the file from which to read the ``.properties`` document
     :param callable object_pairs_hook: class or function for combining the
         key-value pairs
+    :param Optional[ParseStats] stats: if non-`None`, statistics about the
+        document are added to this object while it is parsed
     :rtype: `dict` of text strings or the return value of ``object_pairs_hook``
     :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
         occurs in the input
     """
-    return object_pairs_hook(
-        (kv.key, kv.value) for kv in parse(fp) if isinstance(kv, KeyValue)
-    )
+    if _listeners:
+        with _Measurement("load") as m:
+            pairs = _loadpairs(m.reader(fp), stats)
+            return object_pairs_hook(m.count_entries(pairs))
+    return object_pairs_hook(_loadpairs(fp, stats))
 
 
 @overload
-def loads(s: str | bytes) -> dict[str, str]: ...
+def loads(s: str | bytes, *, stats: ParseStats | None = ...) -> dict[str, str]: ...
 
 
 @overload
-def loads(s: str | bytes, object_pairs_hook: type[T]) -> T: ...
+def loads(
+    s: str | bytes, object_pairs_hook: type[T], *, stats: ParseStats | None = ...
+) -> T: ...
 
 
 @overload
 def loads(
-    s: str | bytes, object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T]
+    s: str | bytes,
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+    *,
+    stats: ParseStats | None = ...,
 ) -> T: ...
 
 
-def loads(s, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
+def loads(s, object_pairs_hook=dict, *, stats=None):  # type: ignore[no-untyped-def]
     """
     Parse the contents of the string ``s`` as a simple line-oriented
     ``.properties`` file and return a `dict` of the key-value pairs.
 
     ``s`` may be either a text string or bytes string.  If it is a bytes
-    string, its contents are decoded as Latin-1.
+    string, its contents are decoded as Latin-1.  (Bytes input is scanned as
+    bytes, and only the keys & values are decoded, so it is not necessary to
+    decode the input before passing it to `loads`.)
 
     By default, the key-value pairs extracted from ``s`` are combined into a
     `dict` with later occurrences of a key overriding previous occurrences of
@@ -88,16 +114,173 @@ def loads(s, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
         Invalid ``\\uXXXX`` escape sequences will now cause an
         `InvalidUEscapeError` to be raised
 
+    .. versionchanged:: 0.9.0
+        ``stats`` argument added
+
     :param Union[str,bytes] s: the string from which to read the
         ``.properties`` document
+    :param callable object_pairs_hook: class or function for combining the
+        key-value pairs
+    :param Optional[ParseStats] stats: if non-`None`, statistics about the
+        document are added to this object while it is parsed
+    :rtype: `dict` of text strings or the return value of ``object_pairs_hook``
+    :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+        occurs in the input
+    """
+    if _listeners:
+        with _Measurement("loads", len(s)) as m:
+            pairs = _loadpairs(s, stats)
+            return object_pairs_hook(m.count_entries(pairs))
+    return object_pairs_hook(_loadpairs(s, stats))
+
+
+@overload
+async def aload(
+    src: AsyncReader | AsyncIterable[str | bytes],
+) -> dict[str, str]: ...
+
+
+@overload
+async def aload(
+    src: AsyncReader | AsyncIterable[str | bytes],
+    object_pairs_hook: type[T],
+) -> T: ...
+
+
+@overload
+async def aload(
+    src: AsyncReader | AsyncIterable[str | bytes],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+) -> T: ...
+
+
+async def aload(src, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
+    """
+    .. versionadded:: 0.9.0
+
+    Like `load()`, but read the ``.properties`` document from an asynchronous
+    source.  ``src`` may be either an object with an async ``read()`` method
+    (such as an `asyncio.StreamReader`) or an async iterable of chunks of the
+    document; in either case, the data may be either text strings or bytes
+    strings (which are decoded as Latin-1).  The input is parsed as it is
+    read, yielding to the event loop between chunks.
+
+    The key-value pairs are passed to ``object_pairs_hook`` as with `load()`
+    once the entire input has been read.
+
+    :param src: the source from which to read the ``.properties`` document
+    :param callable object_pairs_hook: class or function for combining the
+        key-value pairs
+    :rtype: `dict` of text strings or the return value of ``object_pairs_hook``
+    :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+        occurs in the input
+    """
+    pairs = [(e.key, e.value) async for e in aparse(src) if isinstance(e, KeyValue)]
+    return object_pairs_hook(iter(pairs))
+
+
+@overload
+def load_path(path: str | os.PathLike[str]) -> dict[str, str]: ...
+
+
+@overload
+def load_path(path: str | os.PathLike[str], object_pairs_hook: type[T]) -> T: ...
+
+
+@overload
+def load_path(
+    path: str | os.PathLike[str],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+) -> T: ...
+
+
+def load_path(path, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
+    """
+    .. versionadded:: 0.9.0
+
+    Parse the contents of the file at ``path`` as a simple line-oriented
+    ``.properties`` file and return a `dict` of the key-value pairs.
+
+    The file is memory-mapped and scanned as raw bytes, and only the keys and
+    values are decoded (as Latin-1), so loading a large file this way uses
+    less memory than reading it with `load()` or `loads()`.
+
+    By default, the key-value pairs extracted from the file are combined into
+    a `dict` with later occurrences of a key overriding previous occurrences
+    of the same key.  To change this behavior, pass a callable as the
+    ``object_pairs_hook`` argument; it will be called with one argument, a
+    generator of ``(key, value)`` pairs representing the key-value entries in
+    the file (including duplicates) in order of occurrence.  `load_path` will
+    then return the value returned by ``object_pairs_hook``.  As the file is
+    closed once ``object_pairs_hook`` returns, the hook must consume the
+    generator before returning.
+
+    :param path: the path to the ``.properties`` file
+    :type path: str or os.PathLike
     :param callable object_pairs_hook: class or function for combining the
         key-value pairs
     :rtype: `dict` of text strings or the return value of ``object_pairs_hook``
     :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
         occurs in the input
     """
-    fp = BytesIO(s) if isinstance(s, bytes) else StringIO(s)
-    return load(fp, object_pairs_hook=object_pairs_hook)
+    if _listeners:
+        with _Measurement("load_path") as m:
+            return _load_path(path, m.hook(object_pairs_hook), m)
+    return _load_path(path, object_pairs_hook, None)
+
+
+def _load_path(
+    path: str | os.PathLike[str],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+    measurement: _Measurement | None,
+) -> T:
+    with open(path, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if measurement is not None:
+            measurement.bytes_in = size
+        if size == 0:
+            # Empty files cannot be memory-mapped.
+            return object_pairs_hook(iter(()))
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return object_pairs_hook(_iterpairs(_scan_bytes(_splitlines_buffer(mm))))
+
+
+def _loadpairs(
+    src: IO | str | bytes, stats: ParseStats | None
+) -> Iterator[tuple[str, str]]:
+    """
+    Return a generator of the unescaped keys & values of the entries in
+    ``src``, recording statistics in ``stats`` if it is non-`None`
+    """
+    if stats is None:
+        return _iterpairs(_scan_source(src))
+    else:
+        return ((k, v) for cls, _, k, v in _scan_stats(src, stats) if cls is KeyValue)
+
+
+#: Number of keys & values `_iterpairs()` collects before unescaping them
+#: together
+UNESCAPE_BATCH_SIZE = 1024
+
+
+def _iterpairs(
+    elements: Iterable[tuple[type[PropertiesElement], str | bytes, str, str]],
+) -> Iterator[tuple[str, str]]:
+    """
+    Given the output of `_scan()` or `_scan_bytes()`, return a generator of the
+    unescaped keys & values of the `KeyValue` elements
+    """
+    batch: list[str] = []
+    for cls, _, key, value in elements:
+        if cls is KeyValue:
+            batch.append(key)
+            batch.append(value)
+            if len(batch) >= UNESCAPE_BATCH_SIZE:
+                fields = iter(_unescape_batch(batch))
+                yield from zip(fields, fields)
+                batch = []
+    fields = iter(_unescape_batch(batch))
+    yield from zip(fields, fields)
 
 
 TIMESTAMP_RGX = re.compile(
@@ -119,6 +302,8 @@ class PropertiesElement(Iterable[str]):
     Superclass of objects returned by `parse()`
     """
 
+    __slots__ = ("source",)
+
     def __init__(self, source: str) -> None:
         #: The raw, unmodified input line (including trailing newlines)
         self.source: str = source
@@ -126,6 +311,15 @@ class PropertiesElement(Iterable[str]):
     def __iter__(self) -> Iterator[str]:
         return iter((self.source,))
 
+    def __setstate__(self, state: Any) -> None:
+        # Instances are pickled with a ``(None, slots)`` state, but pickles
+        # made before version 0.9.0 (when the classes gained ``__slots__``)
+        # have a plain `dict` of attributes.
+        if isinstance(state, tuple):
+            state = state[1]
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     def __eq__(self, other: Any) -> bool:
         if type(self) is type(other):
             return tuple(self) == tuple(other)
@@ -159,6 +353,8 @@ class Comment(PropertiesElement):
     Subclass of `PropertiesElement` representing a comment
     """
 
+    __slots__ = ()
+
     @property
     def value(self) -> str:
         """
@@ -193,6 +389,8 @@ class Whitespace(PropertiesElement):
     contains only whitespace (and possibly some line continuations)
     """
 
+    __slots__ = ()
+
 
 class KeyValue(PropertiesElement):
     """
@@ -201,8 +399,12 @@ class KeyValue(PropertiesElement):
     Subclass of `PropertiesElement` representing a key-value entry
     """
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key: str, value: str, source: str):
-        super().__init__(source=source)
+        # Set `source` directly rather than via `super().__init__()`, as this
+        # constructor is called for every key-value pair parsed.
+        self.source = source
         #: The entry's key, after processing escape sequences
         self.key: str = key
         #: The entry's value, after processing escape sequences
@@ -221,12 +423,94 @@ class KeyValue(PropertiesElement):
         return type(self)(key=self.key, value=self.value, source=newsource)
 
 
-COMMENT_RGX = re.compile(r"^[ \t\f]*[#!]")
-BLANK_RGX = re.compile(r"^[ \t\f]*\r?\n?\Z")
-SEPARATOR_RGX = re.compile(r"(?<!\\)(?:\\\\)*([ \t\f]*[=:]|[ \t\f])[ \t\f]*")
+# Matches the (still-escaped) key of a logical line as group 1, followed by
+# the key-value separator and any whitespace after it
+KEY_SEPARATOR_RGX = re.compile(
+    r"((?:[^\\ \t\f=:]+|\\.)*)(?:[ \t\f]*[=:]|[ \t\f])?[ \t\f]*"
+)
 
 
-def parse(src: IO | str | bytes) -> Iterator[PropertiesElement]:
+@dataclass
+class ParseStats:
+    """
+    .. versionadded:: 0.9.0
+
+    Counters describing the contents of a simple line-oriented
+    ``.properties`` document, filled in by passing an instance as the
+    ``stats`` argument to `parse()`, `load()`, or `loads()`.  The counters are
+    gathered while the document is parsed, without a separate pass over the
+    input.
+
+    Counts are added to any already in the object, and the maximums are only
+    ever raised, so a single instance can be used to summarize several
+    documents.  (Duplicate keys, however, are only detected within a single
+    document.)
+
+    >>> from javaproperties import ParseStats, loads
+    >>> stats = ParseStats()
+    >>> loads("# Comment\\nkey = a\\\\\\n    b\\\\tc\\nkey = \\\\u00e9\\n", stats=stats)
+    {'key': 'é'}
+    >>> stats.physical_lines, stats.logical_lines, stats.continuation_lines
+    (4, 3, 1)
+    >>> stats.escapes
+    Counter({'\\\\t': 1, '\\\\u': 1})
+    >>> stats.duplicate_keys
+    1
+    """
+
+    #: The number of physical lines, i.e., lines terminated by a line ending
+    #: (plus any final unterminated line)
+    physical_lines: int = 0
+    #: The number of key-value entries
+    key_values: int = 0
+    #: The number of comments
+    comments: int = 0
+    #: The number of blank lines (which may be made up of several physical
+    #: lines joined by line continuations)
+    blank_lines: int = 0
+    #: The number of escape sequences in keys & values, by escape sequence,
+    #: e.g., ``"\\t"`` or ``"\\="``; all ``\uXXXX`` escapes are counted
+    #: under ``"\\u"``
+    escapes: Counter[str] = field(default_factory=Counter)
+    #: The number of keys & values containing at least one escape sequence
+    #: (i.e., those that cannot be passed through unchanged)
+    escaped_fields: int = 0
+    #: The number of UTF-16 surrogate pairs (typically written as pairs of
+    #: ``\uXXXX`` escapes) decoded into non-BMP characters
+    surrogate_pairs: int = 0
+    #: The number of key-value entries whose key also occurred in an earlier
+    #: entry of the same document
+    duplicate_keys: int = 0
+    #: The length of the longest physical line, not counting its line ending
+    max_line_length: int = 0
+    #: The length of the longest value, after processing escape sequences
+    max_value_length: int = 0
+
+    @property
+    def logical_lines(self) -> int:
+        """
+        The number of logical lines, i.e., of entries, comments, and blank
+        lines
+        """
+        return self.key_values + self.comments + self.blank_lines
+
+    @property
+    def continuation_lines(self) -> int:
+        """
+        The number of physical lines joined onto a preceding line by a line
+        continuation
+        """
+        return self.physical_lines - self.logical_lines
+
+    @property
+    def u_escapes(self) -> int:
+        """The number of ``\\uXXXX`` escape sequences"""
+        return self.escapes["\\u"]
+
+
+def parse(
+    src: IO | str | bytes, *, stats: ParseStats | None = None
+) -> Iterator[PropertiesElement]:
     """
     Parse the given data as a simple line-oriented ``.properties`` file and
     return a generator of `PropertiesElement` objects representing the
@@ -250,59 +534,434 @@ def parse(src: IO | str | bytes) -> Iterator[PropertiesElement]:
         `parse()` now accepts strings as input, and it now returns a generator
         of custom objects instead of triples of strings
 
+    .. versionchanged:: 0.9.0
+        ``stats`` argument added
+
     :param src: the ``.properties`` document
     :type src: string or file-like object
+    :param Optional[ParseStats] stats: if non-`None`, statistics about the
+        document are added to this object as it is parsed
     :rtype: Iterator[PropertiesElement]
     :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
         occurs in the input
     """
-    liter: Iterator[str]
+    if stats is not None:
+        for cls, raw, key, value in _scan_stats(src, stats):
+            source = raw.decode("iso-8859-1") if isinstance(raw, bytes) else raw
+            if cls is KeyValue:
+                yield KeyValue(key, value, source)
+            else:
+                yield cls(source)
+        return
+    for cls, raw, key, value in _scan_source(src):
+        source = raw.decode("iso-8859-1") if isinstance(raw, bytes) else raw
+        if cls is KeyValue:
+            yield KeyValue(unescape(key), unescape(value), source)
+        else:
+            yield cls(source)
+
+
+async def aparse(
+    src: AsyncReader | AsyncIterable[str | bytes],
+) -> AsyncIterator[PropertiesElement]:
+    """
+    .. versionadded:: 0.9.0
+
+    Like `parse()`, but read the ``.properties`` document from an
+    asynchronous source and return an async generator of `PropertiesElement`
+    objects.  ``src`` may be either an object with an async ``read()`` method
+    (such as an `asyncio.StreamReader`) or an async iterable of chunks of the
+    document; in either case, the data may be either text strings or bytes
+    strings (which are decoded as Latin-1).  Each element is yielded as soon
+    as the data for its logical line has been read.
+
+    :param src: the source from which to read the ``.properties`` document
+    :rtype: AsyncIterator[PropertiesElement]
+    :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+        occurs in the input
+    """
+    parser = PropertiesParser()
+    async for chunk in aiter_chunks(src):
+        for elem in parser.feed(chunk):
+            yield elem
+    for elem in parser.close():
+        yield elem
+
+
+def _scan_source(
+    src: IO | str | bytes, stats: ParseStats | None = None
+) -> Iterator[tuple[type[PropertiesElement], str | bytes, str, str]]:
+    """
+    Scan a string, bytes string, or `~io.IOBase.readline`-supporting file-like
+    object with `_scan()` or, for bytes input, `_scan_bytes()`.  As bytes input
+    is Latin-1, it can be scanned without being decoded first; only the keys &
+    values are decoded, and the ``source`` of each element is left as bytes.
+
+    If ``stats`` is non-`None`, the physical lines are counted in it.
+    """
     if isinstance(src, bytes):
-        liter = iter(ascii_splitlines(src.decode("iso-8859-1")))
+        blines = _splitlines_buffer(src)
+        if stats is not None:
+            blines = _count_lines(blines, b"\r\n", stats)
+        return _scan_bytes(blines)
     elif isinstance(src, str):
-        liter = iter(ascii_splitlines(src))
+        lines = iter(ascii_splitlines(src))
+        if stats is not None:
+            lines = _count_lines(lines, "\r\n", stats)
+        return _scan(lines)
+    else:
+        return _scan_file(src, stats)
+
+
+def _scan_file(
+    fp: IO, stats: ParseStats | None
+) -> Iterator[tuple[type[PropertiesElement], str | bytes, str, str]]:
+    """
+    Scan a text or binary file-like object, determining which it is from the
+    type of its first line
+    """
+    first = fp.readline()
+    if isinstance(first, bytes):
+        if first:
+            blines = _splitlines_bytes(chain([first], iter(fp.readline, b"")))
+            if stats is not None:
+                blines = _count_lines(blines, b"\r\n", stats)
+            yield from _scan_bytes(blines)
     else:
-        fp: IO = src
+        lines: Iterator[str] = chain(ascii_splitlines(first), _readlines(fp))
+        if stats is not None:
+            lines = _count_lines(lines, "\r\n", stats)
+        yield from _scan(lines)
+
+
+def _count_lines(
+    lines: Iterator[AnyStr], eol: AnyStr, stats: ParseStats
+) -> Iterator[AnyStr]:
+    """
+    Pass through the physical lines yielded by ``lines`` (which end with
+    characters from ``eol``), counting them and their lengths in ``stats``
+    """
+    for line in lines:
+        stats.physical_lines += 1
+        length = len(line.rstrip(eol))
+        if length > stats.max_line_length:
+            stats.max_line_length = length
+        yield line
+
 
-        def lineiter() -> Iterator[str]:
+def _iterlines(src: IO | str | bytes) -> Iterator[str]:
+    """
+    Return an iterator over the physical lines (including line endings) of a
+    string, bytes string, or `~io.IOBase.readline`-supporting file-like object
+    """
+    if isinstance(src, bytes):
+        return iter(ascii_splitlines(src.decode("iso-8859-1")))
+    elif isinstance(src, str):
+        return iter(ascii_splitlines(src))
+    else:
+        return _readlines(src)
+
+
+def _readlines(fp: IO) -> Iterator[str]:
+    while True:
+        line = fp.readline()
+        ll: str
+        if isinstance(line, bytes):
+            ll = line.decode("iso-8859-1")
+        else:
+            ll = line
+        if ll == "":
+            return
+        yield from ascii_splitlines(ll)
+
+
+def _scan(
+    liter: Iterator[str],
+) -> Iterator[tuple[type[PropertiesElement], str, str, str]]:
+    """
+    Group the physical lines yielded by ``liter`` into logical lines and yield
+    a ``(cls, source, key, value)`` tuple for each one, where ``cls`` is the
+    `PropertiesElement` subclass for the line, ``source`` is the raw input,
+    and ``key`` and ``value`` are the still-escaped key & value (or empty
+    strings if ``cls`` is not `KeyValue`).
+
+    Each logical line is classified, joined, and split at its separator in a
+    single pass using only `str` methods and (at most) one regex match.
+    """
+    for source in liter:
+        line = source.lstrip(" \t\f")
+        if not line or line[0] in "\r\n":
+            yield (Whitespace, source, "", "")
+            continue
+        elif line[0] in "#!":
+            yield (Comment, source, "", "")
+            continue
+        line = line.rstrip("\r\n")
+        if line.endswith("\\") and _is_continued(line):
+            sources = [source]
+            parts = [line[:-1]]
             while True:
-                line = fp.readline()
-                ll: str
-                if isinstance(line, bytes):
-                    ll = line.decode("iso-8859-1")
+                nextline = next(liter, "")
+                sources.append(nextline)
+                part = nextline.lstrip(" \t\f").rstrip("\r\n")
+                if part.endswith("\\") and _is_continued(part):
+                    parts.append(part[:-1])
                 else:
-                    ll = line
-                if ll == "":
-                    return
-                yield from ascii_splitlines(ll)
+                    parts.append(part)
+                    break
+            source = "".join(sources)
+            line = "".join(parts)
+            if line == "":  # series of otherwise-blank lines with continuations
+                yield (Whitespace, source, "", "")
+                continue
+        m = KEY_SEPARATOR_RGX.match(line)
+        assert m is not None
+        yield (KeyValue, source, m[1], line[m.end() :])
+
+
+def _scan_stats(
+    src: IO | str | bytes, stats: ParseStats
+) -> Iterator[tuple[type[PropertiesElement], str | bytes, str, str]]:
+    """
+    Like `_scan_source()`, but with the keys & values unescaped, and with
+    statistics about the input recorded in ``stats`` along the way
+    """
+
+    def unesc(m: re.Match[str]) -> str:
+        escapes[m[0][:2]] += 1
+        return _unesc(m)
+
+    def unescape_field(f: str) -> str:
+        # Equivalent to `unescape()`, but counting what gets decoded
+        if "\\" in f:
+            stats.escaped_fields += 1
+            f = ESCAPE_RGX.sub(unesc, f)
+        if not _surrogate_free(f):
+            f, n = SURROGATE_PAIR_RGX.subn(_unsurrogate, f)
+            stats.surrogate_pairs += n
+        return f
+
+    escapes = stats.escapes
+    seen: set[str] = set()
+    for cls, source, key, value in _scan_source(src, stats):
+        if cls is KeyValue:
+            stats.key_values += 1
+            key = unescape_field(key)
+            value = unescape_field(value)
+            if key in seen:
+                stats.duplicate_keys += 1
+            else:
+                seen.add(key)
+            if len(value) > stats.max_value_length:
+                stats.max_value_length = len(value)
+        elif cls is Comment:
+            stats.comments += 1
+        else:
+            stats.blank_lines += 1
+        yield (cls, source, key, value)
+
+
+def _is_continued(line: str) -> bool:
+    """
+    Returns `True` iff ``line`` (which must not end with a line ending) ends
+    with an odd number of backslashes, i.e., with a line continuation
+    """
+    return (len(line) - len(line.rstrip("\\"))) % 2 == 1
+
+
+class PropertiesParser:
+    """
+    .. versionadded:: 0.9.0
+
+    An incremental ("push") parser for simple line-oriented ``.properties``
+    data that arrives in pieces, such as from a socket or message queue.
+    Pass each piece of data to `feed()` as it arrives; `feed()` returns the
+    `PropertiesElement` objects for all logical lines that were completed by
+    the new data.  Once all data has been fed, call `close()` to obtain the
+    elements for any remaining input.
+
+    Data may be fed as text strings or bytes strings (which are decoded as
+    Latin-1).  Pieces may be split at arbitrary points, including in the
+    middle of a line continuation or between the CR and LF of a CR LF line
+    ending.  Concatenating the return values of all calls to `feed()` and
+    `close()` produces the same elements as calling `parse()` on the
+    complete input.
+
+    >>> parser = PropertiesParser()
+    >>> parser.feed("k = a\\\\\\n")
+    []
+    >>> parser.feed("  b\\nfoo")
+    [javaproperties.reading.KeyValue(key='k', value='ab', source='k = a\\\\\\n  b\\n')]
+    >>> parser.close()
+    [javaproperties.reading.KeyValue(key='foo', value='', source='foo')]
+    """
+
+    def __init__(self) -> None:
+        #: The pieces of trailing input that has not yet been terminated by a
+        #: line ending (including a trailing CR, which may yet be followed by
+        #: an LF).  They are only joined once a line ending arrives, so that a
+        #: long line fed in many small pieces is not copied on every call.
+        self._buffer: list[str] = []
+        #: Complete physical lines that have not yet been parsed
+        self._pending: list[str] = []
+        #: Whether the last line in ``_pending`` ends with a line continuation
+        self._continuing: bool = False
+        self._closed: bool = False
+
+    def feed(self, data: str | bytes) -> list[PropertiesElement]:
+        """
+        Feed a piece of input to the parser and return a list of the
+        `PropertiesElement` objects for the logical lines that it completes.
+
+        :param Union[str,bytes] data: the next piece of input
+        :rtype: list[PropertiesElement]
+        :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+            occurs in a completed line
+        :raises ValueError: if the parser has already been closed
+        """
+        if self._closed:
+            raise ValueError("feed() called on closed PropertiesParser")
+        if isinstance(data, bytes):
+            data = data.decode("iso-8859-1")
+        buffer = self._buffer
+        if (
+            "\n" not in data
+            and "\r" not in data
+            and not (buffer and buffer[-1].endswith("\r"))
+        ):
+            # No lines were completed.
+            if data:
+                buffer.append(data)
+            return []
+        buffer.append(data)
+        lines = ascii_splitlines("".join(buffer))
+        if lines and not lines[-1].endswith("\n"):
+            self._buffer = [lines.pop()]
+        else:
+            self._buffer = []
+        pending = self._pending
+        complete = 0
+        for line in lines:
+            pending.append(line)
+            if not self._continuing:
+                stripped = line.lstrip(" \t\f")
+                if not stripped or stripped[0] in "\r\n#!":
+                    complete = len(pending)
+                    continue
+            body = line.rstrip("\r\n")
+            self._continuing = body.endswith("\\") and _is_continued(body)
+            if not self._continuing:
+                complete = len(pending)
+        if not complete:
+            return []
+        src = "".join(pending[:complete])
+        del pending[:complete]
+        return list(parse(src))
+
+    def close(self) -> list[PropertiesElement]:
+        """
+        Signal the end of the input and return a list of the
+        `PropertiesElement` objects for any logical lines not returned by
+        previous calls to `feed()`.  After calling this method, the parser
+        can no longer be used.
+
+        :rtype: list[PropertiesElement]
+        :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
+            occurs in the remaining input
+        """
+        self._closed = True
+        src = "".join(self._pending) + "".join(self._buffer)
+        self._pending = []
+        self._buffer = []
+        return list(parse(src))
+
+
+KEY_SEPARATOR_BYTES_RGX = re.compile(KEY_SEPARATOR_RGX.pattern.encode("us-ascii"))
+
+
+#: The approximate number of bytes that `_splitlines_buffer()` splits into
+#: lines at a time
+SPLIT_WINDOW_SIZE = 65536
+
 
-        liter = lineiter()
+def _splitlines_buffer(buf: bytes | mmap.mmap) -> Iterator[bytes]:
+    """
+    Return a generator of the physical lines in ``buf``.  Rather than
+    splitting all of ``buf`` at once, which would hold a copy of it in memory
+    as a list of lines, it is split a window of about `SPLIT_WINDOW_SIZE`
+    bytes at a time.  Each window ends just after an LF, so no CR LF is ever
+    split between windows.
+    """
+    size = len(buf)
+    pos = 0
+    while pos < size:
+        end = buf.find(b"\n", pos + SPLIT_WINDOW_SIZE)
+        end = size if end == -1 else end + 1
+        # `bytes.splitlines()` only treats LF, CR LF, and CR as line endings.
+        yield from buf[pos:end].splitlines(True)
+        pos = end
+
+
+def _splitlines_bytes(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Split the LF-terminated lines yielded by a ``readline()`` method at any CR
+    line endings they contain
+    """
+    for line in lines:
+        if b"\r" in line:
+            # `bytes.splitlines()` only treats LF, CR LF, and CR as line
+            # endings.
+            yield from line.splitlines(True)
+        else:
+            yield line
+
+
+def _scan_bytes(
+    liter: Iterator[bytes],
+) -> Iterator[tuple[type[PropertiesElement], bytes, str, str]]:
+    """
+    Like `_scan()`, but operating on physical lines of Latin-1-encoded bytes.
+    Only the key & value of each `KeyValue` are decoded; ``source`` is
+    yielded undecoded.
+    """
     for source in liter:
-        line = source
-        if COMMENT_RGX.match(line):
-            yield Comment(source)
+        line = source.lstrip(b" \t\f")
+        if not line or line[0] in b"\r\n":
+            yield (Whitespace, source, "", "")
             continue
-        elif BLANK_RGX.match(line):
-            yield Whitespace(source)
+        elif line[0] in b"#!":
+            yield (Comment, source, "", "")
             continue
-        line = line.lstrip(" \t\f").rstrip("\r\n")
-        while CONTINUED_RGX.search(line):
-            line = line[:-1]
-            nextline = next(liter, "")
-            source += nextline
-            line += nextline.lstrip(" \t\f").rstrip("\r\n")
-        if line == "":  # series of otherwise-blank lines with continuations
-            yield Whitespace(source)
-            continue
-        m = SEPARATOR_RGX.search(line)
-        if m:
-            yield KeyValue(
-                unescape(line[: m.start(1)]),
-                unescape(line[m.end() :]),
-                source,
-            )
-        else:
-            yield KeyValue(unescape(line), "", source)
+        line = line.rstrip(b"\r\n")
+        if line.endswith(b"\\") and _is_continued_bytes(line):
+            sources = [source]
+            parts = [line[:-1]]
+            while True:
+                nextline = next(liter, b"")
+                sources.append(nextline)
+                part = nextline.lstrip(b" \t\f").rstrip(b"\r\n")
+                if part.endswith(b"\\") and _is_continued_bytes(part):
+                    parts.append(part[:-1])
+                else:
+                    parts.append(part)
+                    break
+            source = b"".join(sources)
+            line = b"".join(parts)
+            if line == b"":
+                yield (Whitespace, source, "", "")
+                continue
+        m = KEY_SEPARATOR_BYTES_RGX.match(line)
+        assert m is not None
+        yield (
+            KeyValue,
+            source,
+            m[1].decode("iso-8859-1"),
+            line[m.end() :].decode("iso-8859-1"),
+        )
+
+
+def _is_continued_bytes(line: bytes) -> bool:
+    return (len(line) - len(line.rstrip(b"\\"))) % 2 == 1
 
 
 SURROGATE_PAIR_RGX = re.compile(r"[\uD800-\uDBFF][\uDC00-\uDFFF]")
@@ -333,9 +992,32 @@ def unescape(field: str) -> str:
     :raises InvalidUEscapeError: if an invalid ``\\uXXXX`` escape sequence
         occurs in the input
     """
+    if "\\" not in field and _surrogate_free(field):
+        return field
     return SURROGATE_PAIR_RGX.sub(_unsurrogate, ESCAPE_RGX.sub(_unesc, field))
 
 
+def _surrogate_free(s: str) -> bool:
+    """
+    Returns `True` if ``s`` is known to not contain any surrogate code points.
+    (A return value of `False` does not guarantee that surrogates are present.)
+    """
+    return s.isascii() or max(s) < "\ud800"
+
+
+def _unescape_batch(fields: list[str]) -> list[str]:
+    """
+    Apply `unescape()` to each string in ``fields`` and return a list of the
+    results.  If none of the strings need decoding, which can be determined
+    with a single check over all of them together, ``fields`` itself is
+    returned.
+    """
+    joined = "".join(fields)
+    if "\\" not in joined and _surrogate_free(joined):
+        return fields
+    return [f if "\\" not in f and f.isascii() else unescape(f) for f in fields]
+
+
 _unescapes = {"t": "\t", "n": "\n", "f": "\f", "r": "\r"}
 
 
@@ -1,17 +1,34 @@
 from __future__ import annotations
-from collections.abc import Iterable, Iterator, Mapping
+import asyncio
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+import inspect
 import re
-from typing import Generic, TypeVar
+from typing import Generic, Protocol, TypeVar
 
 CONTINUED_RGX = re.compile(r"(?<!\\)((?:\\\\)*)\\\r?\n?\Z")
 
 EOL_RGX = re.compile(r"\r\n?|\n")
 
+# Characters other than CR & LF that `str.splitlines()` treats as line breaks
+EXTRA_EOL_RGX = re.compile(r"[\v\f\x1C-\x1E\x85\u2028\u2029]")
+
 T = TypeVar("T")
 K = TypeVar("K")
 V = TypeVar("V")
 
 
+# `LinkedList` & `LinkedListNode` are no longer used by `PropertiesFile`, but
+# they must remain importable so that `PropertiesFile` objects pickled before
+# version 0.9.0 can still be loaded.
+
+
 class LinkedList(Generic[T]):
     def __init__(self) -> None:
         self.start: LinkedListNode[T] | None = None
@@ -96,7 +113,7 @@ def itemize(
 ) -> Iterable[tuple[K, V]]:
     items: Iterable[tuple[K, V]]
     if isinstance(kvs, Mapping):
-        items = ((k, kvs[k]) for k in kvs)
+        items = kvs.items()
     else:
         items = kvs
     if sort_keys:
@@ -109,6 +126,8 @@ def ascii_splitlines(s: str) -> list[str]:
     Like `str.splitlines(True)`, except it only treats LF, CR LF, and CR as
     line endings
     """
+    if not EXTRA_EOL_RGX.search(s):
+        return s.splitlines(True)
     lines = []
     lastend = 0
     for m in EOL_RGX.finditer(s):
@@ -117,3 +136,63 @@ def ascii_splitlines(s: str) -> list[str]:
     if lastend < len(s):
         lines.append(s[lastend:])
     return lines
+
+
+#: Number of characters or bytes requested per call when reading from an
+#: object with an async ``read()`` method
+ASYNC_READ_SIZE = 65536
+
+
+class AsyncReader(Protocol):
+    """
+    An object with an async ``read()`` method, such as `asyncio.StreamReader`
+    """
+
+    def read(self, n: int, /) -> Awaitable[str | bytes]: ...
+
+
+async def aiter_chunks(
+    src: AsyncReader | AsyncIterable[str | bytes],
+) -> AsyncIterator[str | bytes]:
+    """
+    Return an async iterator over the chunks of data in ``src``, which may be
+    either an object with an async ``read()`` method or an async iterable.
+    Control is returned to the event loop after each chunk.
+    """
+    if hasattr(src, "read"):
+        while True:
+            chunk = await src.read(ASYNC_READ_SIZE)
+            if not chunk:
+                return
+            yield chunk
+            await asyncio.sleep(0)
+    else:
+        async for chunk in src:
+            yield chunk
+            await asyncio.sleep(0)
+
+
+class AsyncWriter(Protocol):
+    """
+    An object with a ``write()`` method that accepts bytes and that may be
+    either synchronous or async, such as `asyncio.StreamWriter`
+    """
+
+    def write(self, data: bytes, /) -> object: ...
+
+
+async def awrite(fp: AsyncWriter, data: bytes) -> None:
+    """
+    Write ``data`` to ``fp`` and wait for it to be flushed.  ``fp`` must have
+    a ``write()`` method, which may be either synchronous (like that of
+    `asyncio.StreamWriter`) or async.  If ``fp`` also has an async
+    ``drain()`` method (like `asyncio.StreamWriter`), it is awaited afterwards.
+    Control is returned to the event loop after each write.
+    """
+    r = fp.write(data)
+    if inspect.isawaitable(r):
+        await r
+    drain = getattr(fp, "drain", None)
+    if drain is not None:
+        await drain()
+    await asyncio.sleep(0)
@@ -1,11 +1,13 @@
 from __future__ import annotations
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime
-from io import StringIO
+from functools import lru_cache
+from itertools import islice
 import re
 import time
-from typing import TextIO
-from .util import itemize
+from typing import NamedTuple, TextIO
+from .metrics import _listeners, _Measurement
+from .util import AsyncWriter, awrite, itemize
 
 
 def dump(
@@ -17,6 +19,7 @@ def dump(
     sort_keys: bool = False,
     ensure_ascii: bool = True,
     ensure_ascii_comments: bool | None = None,
+    escape_cache: EscapeCache | None = None,
 ) -> None:
     """
     Write a series of key-value pairs to a file in simple line-oriented
@@ -25,6 +28,9 @@ def dump(
     .. versionchanged:: 0.6.0
         ``ensure_ascii`` and ``ensure_ascii_comments`` parameters added
 
+    .. versionchanged:: 0.9.0
+        ``escape_cache`` parameter added
+
     :param props: A mapping or iterable of ``(key, value)`` pairs to write to
         ``fp``.  All keys and values in ``props`` must be `str` values.  If
         ``sort_keys`` is `False`, the entries are output in iteration order.
@@ -52,17 +58,138 @@ def dump(
         characters in ``comments`` will be replaced with ``\\uXXXX`` escape
         sequences in the output; if `None`, only non-Latin-1 characters will be
         escaped; if false, no characters will be escaped
+    :param Optional[EscapeCache] escape_cache: if non-`None`, keys & values
+        will be escaped via the given `EscapeCache`
+    :return: `None`
+    """
+    if _listeners:
+        with _Measurement("dump") as m:
+            for chunk in _dump_chunks(
+                m.count_entries(itemize(props, sort_keys=sort_keys)),
+                separator=separator,
+                comments=comments,
+                timestamp=timestamp,
+                sort_keys=False,
+                ensure_ascii=ensure_ascii,
+                ensure_ascii_comments=ensure_ascii_comments,
+                escape_cache=escape_cache,
+            ):
+                m.bytes_out += len(chunk)
+                fp.write(chunk)
+        return
+    for chunk in _dump_chunks(
+        props,
+        separator=separator,
+        comments=comments,
+        timestamp=timestamp,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii,
+        ensure_ascii_comments=ensure_ascii_comments,
+        escape_cache=escape_cache,
+    ):
+        fp.write(chunk)
+
+
+#: Number of key-value pairs that `dump()` and related functions serialize and
+#: write at a time
+DUMP_BATCH_SIZE = 4096
+
+
+async def adump(
+    props: Mapping[str, str] | Iterable[tuple[str, str]],
+    fp: AsyncWriter,
+    separator: str = "=",
+    comments: str | None = None,
+    timestamp: None | bool | float | datetime = True,
+    sort_keys: bool = False,
+    ensure_ascii: bool = True,
+    ensure_ascii_comments: bool | None = None,
+    encoding: str = "iso-8859-1",
+    escape_cache: EscapeCache | None = None,
+) -> None:
+    """
+    .. versionadded:: 0.9.0
+
+    Like `dump()`, but write to an asynchronous binary stream such as an
+    `asyncio.StreamWriter`.  The output is encoded in ``encoding`` using the
+    :ref:`'javapropertiesreplace' error handler <javapropertiesreplace>` and
+    is written in batches of lines, waiting for ``fp`` to drain (if it has an
+    async ``drain()`` method) and yielding to the event loop after each batch.
+
+    :param props: A mapping or iterable of ``(key, value)`` pairs to write to
+        ``fp``.  All keys and values in ``props`` must be `str` values.  If
+        ``sort_keys`` is `False`, the entries are output in iteration order.
+    :param fp: A binary stream to write the values of ``props`` to.  Its
+        ``write()`` method may be either synchronous or async.
+    :param str separator: The string to use for separating keys & values.  Only
+        ``" "``, ``"="``, and ``":"`` (possibly with added whitespace) should
+        ever be used as the separator.
+    :param Optional[str] comments: if non-`None`, ``comments`` will be written
+        to ``fp`` as a comment before any other content
+    :param timestamp: If neither `None` nor `False`, a timestamp in the form of
+        ``Mon Sep 02 14:00:54 EDT 2016`` is written as a comment to ``fp``
+        after ``comments`` (if any) and before the key-value pairs.  If
+        ``timestamp`` is `True`, the current date & time is used.  If it is a
+        number, it is converted from seconds since the epoch to local time.  If
+        it is a `datetime.datetime` object, its value is used directly, with
+        naïve objects assumed to be in the local timezone.
+    :type timestamp: `None`, `bool`, number, or `datetime.datetime`
+    :param bool sort_keys: if true, the elements of ``props`` are sorted
+        lexicographically by key in the output
+    :param bool ensure_ascii: if true, all non-ASCII characters will be
+        replaced with ``\\uXXXX`` escape sequences in the output; if false,
+        non-ASCII characters will be passed through as-is
+    :param Optional[bool] ensure_ascii_comments: if true, all non-ASCII
+        characters in ``comments`` will be replaced with ``\\uXXXX`` escape
+        sequences in the output; if `None`, only non-Latin-1 characters will be
+        escaped; if false, no characters will be escaped
+    :param str encoding: the name of the encoding to use for the output
+    :param Optional[EscapeCache] escape_cache: if non-`None`, keys & values
+        will be escaped via the given `EscapeCache`
     :return: `None`
     """
+    for chunk in _dump_chunks(
+        props,
+        separator=separator,
+        comments=comments,
+        timestamp=timestamp,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii,
+        ensure_ascii_comments=ensure_ascii_comments,
+        escape_cache=escape_cache,
+    ):
+        await awrite(fp, chunk.encode(encoding, "javapropertiesreplace"))
+
+
+def _dump_chunks(
+    props: Mapping[str, str] | Iterable[tuple[str, str]],
+    separator: str,
+    comments: str | None,
+    timestamp: None | bool | float | datetime,
+    sort_keys: bool,
+    ensure_ascii: bool,
+    ensure_ascii_comments: bool | None,
+    escape_cache: EscapeCache | None,
+) -> Iterator[str]:
+    """
+    Return a generator of consecutive pieces of the output of `dump()` for the
+    given arguments.  Each piece consists of one or more complete lines, with
+    the key-value pairs serialized `DUMP_BATCH_SIZE` at a time.
+    """
+    header = ""
     if comments is not None:
-        print(to_comment(comments, ensure_ascii=ensure_ascii_comments), file=fp)
+        header += to_comment(comments, ensure_ascii=ensure_ascii_comments) + "\n"
     if timestamp is not None and timestamp is not False:
-        print(to_comment(java_timestamp(timestamp)), file=fp)
-    for k, v in itemize(props, sort_keys=sort_keys):
-        print(
-            join_key_value(k, v, separator, ensure_ascii=ensure_ascii),
-            file=fp,
-        )
+        header += to_comment(java_timestamp(timestamp)) + "\n"
+    if header:
+        yield header
+    items = iter(itemize(props, sort_keys=sort_keys))
+    while batch := list(islice(items, DUMP_BATCH_SIZE)):
+        if escape_cache is None:
+            yield _join_pairs(batch, separator, ensure_ascii)
+        else:
+            jkv = escape_cache.join_key_value
+            yield "".join([jkv(k, v, separator, ensure_ascii) + "\n" for k, v in batch])
 
 
 def dumps(
@@ -73,6 +200,7 @@ def dumps(
     sort_keys: bool = False,
     ensure_ascii: bool = True,
     ensure_ascii_comments: bool | None = None,
+    escape_cache: EscapeCache | None = None,
 ) -> str:
     """
     Convert a series of key-value pairs to a `str` in simple line-oriented
@@ -81,6 +209,9 @@ def dumps(
     .. versionchanged:: 0.6.0
         ``ensure_ascii`` and ``ensure_ascii_comments`` parameters added
 
+    .. versionchanged:: 0.9.0
+        ``escape_cache`` parameter added
+
     :param props: A mapping or iterable of ``(key, value)`` pairs to serialize.
         All keys and values in ``props`` must be `str` values.  If
         ``sort_keys`` is `False`, the entries are output in iteration order.
@@ -106,20 +237,38 @@ def dumps(
         characters in ``comments`` will be replaced with ``\\uXXXX`` escape
         sequences in the output; if `None`, only non-Latin-1 characters will be
         escaped; if false, no characters will be escaped
+    :param Optional[EscapeCache] escape_cache: if non-`None`, keys & values
+        will be escaped via the given `EscapeCache`
     :rtype: text string
     """
-    s = StringIO()
-    dump(
-        props,
-        s,
-        separator=separator,
-        comments=comments,
-        timestamp=timestamp,
-        sort_keys=sort_keys,
-        ensure_ascii=ensure_ascii,
-        ensure_ascii_comments=ensure_ascii_comments,
+    if _listeners:
+        with _Measurement("dumps") as m:
+            s = "".join(
+                _dump_chunks(
+                    m.count_entries(itemize(props, sort_keys=sort_keys)),
+                    separator=separator,
+                    comments=comments,
+                    timestamp=timestamp,
+                    sort_keys=False,
+                    ensure_ascii=ensure_ascii,
+                    ensure_ascii_comments=ensure_ascii_comments,
+                    escape_cache=escape_cache,
+                )
+            )
+            m.bytes_out = len(s)
+            return s
+    return "".join(
+        _dump_chunks(
+            props,
+            separator=separator,
+            comments=comments,
+            timestamp=timestamp,
+            sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii,
+            ensure_ascii_comments=ensure_ascii_comments,
+            escape_cache=escape_cache,
+        )
     )
-    return s.getvalue()
 
 
 NON_ASCII_RGX = re.compile(r"[^\x00-\x7F]")
@@ -234,6 +383,44 @@ def _base_escape(field: str, ensure_ascii: bool = True) -> str:
     return rgx.sub(_esc, field)
 
 
+# Like the above, but without matching LF, for use on newline-joined fields
+NEEDS_ESCAPE_ASCII_JOINED_RGX = re.compile(r"[^\n\x20-\x7E]|[\\#!=:]")
+NEEDS_ESCAPE_UNICODE_JOINED_RGX = re.compile(r"[\x00-\x09\x0B-\x1F\x7F]|[\\#!=:]")
+
+
+def _join_pairs(
+    pairs: list[tuple[str, str]], separator: str, ensure_ascii: bool
+) -> str:
+    """
+    Convert a list of key-value pairs to `join_key_value()` lines, each
+    terminated by a newline.
+
+    All of the keys (and all of the values) are joined together with LFs and
+    escaped with a single regex substitution, after which the LFs are used to
+    split them apart again.  If any key or value already contains an LF, the
+    pairs are instead passed to `join_key_value()` one at a time.
+    """
+    keys, values = zip(*pairs)
+    joined_keys = "\n".join(keys)
+    joined_values = "\n".join(values)
+    n = len(pairs) - 1
+    if joined_keys.count("\n") != n or joined_values.count("\n") != n:
+        return "".join(
+            join_key_value(k, v, separator, ensure_ascii=ensure_ascii) + "\n"
+            for k, v in pairs
+        )
+    if ensure_ascii:
+        rgx = NEEDS_ESCAPE_ASCII_JOINED_RGX
+    else:
+        rgx = NEEDS_ESCAPE_UNICODE_JOINED_RGX
+    esc_keys = rgx.sub(_esc, joined_keys).replace(" ", r"\ ").split("\n")
+    # Escape the first space of each value that starts with one:
+    esc_values = ("\n" + rgx.sub(_esc, joined_values)).replace("\n ", "\n\\ ")
+    return (
+        "\n".join(map(separator.join, zip(esc_keys, esc_values[1:].split("\n")))) + "\n"
+    )
+
+
 def escape(field: str, ensure_ascii: bool = True) -> str:
     """
     Escape a string so that it can be safely used as either a key or value in a
@@ -255,6 +442,85 @@ def escape(field: str, ensure_ascii: bool = True) -> str:
     return _base_escape(field, ensure_ascii=ensure_ascii).replace(" ", r"\ ")
 
 
+class EscapeCache:
+    """
+    .. versionadded:: 0.9.0
+
+    A bounded LRU cache of escaped keys & values that can be passed to
+    `dump()`, `dumps()`, `adump()`, and `PropertiesFile.dump()` via their
+    ``escape_cache`` parameters in order to avoid re-escaping strings that
+    recur across entries or calls, such as keys shared by many files or
+    common values like ``true`` and ``false``.  A single instance may be
+    shared by any number of calls.
+
+    Cache entries are keyed by the string being escaped and the
+    ``ensure_ascii`` setting.  The output produced with a cache is identical
+    to that produced without one.
+
+    >>> cache = EscapeCache(maxsize=128)
+    >>> cache.join_key_value('enabled', 'true')
+    'enabled=true'
+    >>> cache.join_key_value('enabled', 'true')
+    'enabled=true'
+    >>> cache.cache_info()
+    EscapeCacheInfo(hits=2, misses=2, maxsize=128, currsize=2)
+
+    :param Optional[int] maxsize: the maximum number of escaped strings to
+        store; if `None`, the cache is unbounded
+    """
+
+    def __init__(self, maxsize: int | None = 65536) -> None:
+        self._base_escape = lru_cache(maxsize=maxsize)(_base_escape)
+
+    def escape(self, field: str, ensure_ascii: bool = True) -> str:
+        """Like `escape()`, but consults & populates the cache"""
+        return self._base_escape(field, ensure_ascii).replace(" ", r"\ ")
+
+    def join_key_value(
+        self,
+        key: str,
+        value: str,
+        separator: str = "=",
+        ensure_ascii: bool = True,
+    ) -> str:
+        """Like `join_key_value()`, but consults & populates the cache"""
+        value = self._base_escape(value, ensure_ascii)
+        if value.startswith(" "):
+            value = "\\" + value
+        return (
+            self._base_escape(key, ensure_ascii).replace(" ", r"\ ") + separator + value
+        )
+
+    def cache_info(self) -> EscapeCacheInfo:
+        """
+        Return an `EscapeCacheInfo` of the cache's statistics, in the same form
+        as the return value of `functools.lru_cache`'s ``cache_info()``
+        """
+        return EscapeCacheInfo(*self._base_escape.cache_info())
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its statistics"""
+        self._base_escape.cache_clear()
+
+
+class EscapeCacheInfo(NamedTuple):
+    """
+    .. versionadded:: 0.9.0
+
+    Statistics of an `EscapeCache`, as returned by `EscapeCache.cache_info()`
+    """
+
+    #: The number of escapes served from the cache
+    hits: int
+    #: The number of escapes that had to be computed
+    misses: int
+    #: The maximum number of escaped strings the cache will store, or `None`
+    #: if it is unbounded
+    maxsize: int | None
+    #: The number of escaped strings currently cached
+    currsize: int
+
+
 DAYS_OF_WEEK = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
 MONTHS = [
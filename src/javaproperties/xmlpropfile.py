@@ -0,0 +1,440 @@
+from __future__ import annotations
+from array import array
+import codecs
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+import re
+from typing import AnyStr, BinaryIO, IO
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+from xml.sax.saxutils import escape, quoteattr
+from .xmlprops import dumps_xml, loads_xml
+
+#: The document used for `XMLPropertiesFile` instances that are not loaded from
+#: an existing document
+_EMPTY_DOCUMENT = '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n' + (
+    dumps_xml({})
+)
+
+#: Encodings that expat decodes itself and that encode the markup characters as
+#: ASCII, so that documents in them can be edited without being transcoded
+_NATIVE_ENCODINGS = {"utf-8", "ascii", "latin-1"}
+
+_ENCODING_DECL_RGX = re.compile(
+    rb"<\?xml[^>]*?\sencoding\s*=\s*[\"']([A-Za-z][A-Za-z0-9._-]*)[\"']"
+)
+
+#: Whitespace up to & including the end of a line
+_LINE_END_RGX = re.compile(rb"[ \t]*(?:\r\n?|\n)")
+
+
+def _detect_encoding(data: bytes) -> str:
+    # Return the name of the encoding of an XML document, following Appendix F
+    # of the XML specification
+    if data.startswith(codecs.BOM_UTF8):
+        return "utf-8"
+    elif data.startswith((codecs.BOM_UTF16_LE, b"<\0")):
+        return "utf-16-le"
+    elif data.startswith((codecs.BOM_UTF16_BE, b"\0<")):
+        return "utf-16-be"
+    m = _ENCODING_DECL_RGX.match(data)
+    return m[1].decode("ascii") if m else "utf-8"
+
+
+def _codec_name(encoding: str) -> str:
+    return codecs.lookup(encoding).name.replace("iso8859-1", "latin-1")
+
+
+class XMLPropertiesFile(MutableMapping[str, str]):
+    """
+    .. versionadded:: 0.9.0
+
+    A custom mapping class for reading from, editing, and writing to an XML
+    ``.properties`` file while preserving the layout of the original document.
+
+    An instance can be constructed from another mapping and/or iterable of
+    pairs, after which it will act like a `dict` whose contents are written out
+    in the same format as `dump_xml()`.  Alternatively, an instance can be
+    constructed from a file or string with `XMLPropertiesFile.load()` or
+    `XMLPropertiesFile.loads()`, in which case the instance keeps the text of
+    the original document, and writing it back out with
+    `~XMLPropertiesFile.dump()` or `~XMLPropertiesFile.dumps()` reproduces that
+    text exactly, except that:
+
+    - the ``<entry>`` element for each key that has been assigned a new value
+      is replaced with a newly-generated ``<entry>`` element; if the key
+      occurred more than once in the document, only its first occurrence is
+      replaced, and the others are removed
+
+    - the ``<entry>`` elements for deleted keys are removed, along with the
+      lines they were on if nothing else was on those lines
+
+    - ``<entry>`` elements for new keys are added at the end of the
+      ``<properties>`` element
+
+    Only the changed entries are examined when writing, so saving a large
+    document after a few edits is almost as cheap as copying it.
+
+    Like `PropertiesFile`, `XMLPropertiesFile` remembers the order in which
+    keys were first defined (with new keys coming last) and uses it when
+    iterating (and `reversed` is supported).  As with `load_xml()`, when a key
+    occurs more than once in the document, its last occurrence determines its
+    value.  When comparing an `XMLPropertiesFile` to any mapping, only the
+    key-value pairs are considered, and order is ignored.
+    """
+
+    def __init__(
+        self,
+        mapping: None | Mapping[str, str] | Iterable[tuple[str, str]] = None,
+        **kwargs: str,
+    ) -> None:
+        #: the encoded text of the document as loaded
+        self._source = _EMPTY_DOCUMENT.encode("utf-8")
+        #: the encoding of `_source`
+        self._codec = "utf-8"
+        #: the encoding in which to write the document with `dump()`
+        self._encoding = "utf-8"
+        #: the start & end offsets in `_source` of each ``<entry>`` element in
+        #: the document as loaded
+        self._starts = array("q")
+        self._ends = array("q")
+        #: the values of the ``<entry>`` elements, including new ones; an
+        #: entry's index in this list is its ID
+        self._values: list[str] = []
+        #: mapping from keys to the ID of their entry or (for keys that occur
+        #: more than once in the document) to a list of the IDs of their
+        #: entries
+        self._key2ids: dict[str, int | list[int]] = {}
+        #: the markup of each new or modified entry, by ID
+        self._markup: dict[int, str] = {}
+        #: the IDs of the entries in `_source` that have been deleted
+        self._deleted: set[int] = set()
+        #: the offset in `_source` at which to insert new entries
+        self._insert_at = self._source.index(b"</properties>")
+        #: whether new entries are to be inserted on lines of their own, and
+        #: the indentation & line ending to use for those lines
+        self._own_lines = True
+        self._indent = b""
+        self._newline = b"\n"
+        #: whether the root element of `_source` is an empty-element tag
+        self._empty_root = False
+        if mapping is not None:
+            self.update(mapping)
+        self.update(kwargs)
+
+    def _check(self) -> None:
+        """
+        Assert the internal consistency of the instance's data structures.
+        This method is for debugging only.
+        """
+        n = len(self._starts)
+        assert len(self._ends) == n, "Span arrays differ in length"
+        assert all(i < n for i in self._deleted), "New entry marked deleted"
+        assert not self._deleted & set(self._markup), "Deleted entry has markup"
+        ids: set[int] = set()
+        for e in self._key2ids.values():
+            if isinstance(e, int):
+                ids.add(e)
+            else:
+                assert len(e) > 1, "Key maps to short list"
+                assert e == sorted(e), "Key's entries are not in order"
+                ids.update(e)
+        assert ids.isdisjoint(self._deleted), "Key maps to deleted entry"
+        assert ids | self._deleted == set(range(n)) | set(
+            self._markup
+        ), "Entries are missing from index"
+        assert list(loads_xml(self.dumps()).items()) == list(
+            self.items()
+        ), "Output does not round-trip"
+
+    def __getitem__(self, key: str) -> str:
+        e = self._key2ids[key]
+        return self._values[e if isinstance(e, int) else e[-1]]
+
+    def __setitem__(self, key: str, value: str) -> None:
+        markup = f"<entry key={quoteattr(key)}>{escape(value)}</entry>"
+        try:
+            e = self._key2ids[key]
+        except KeyError:
+            e = self._key2ids[key] = len(self._values)
+            self._values.append(value)
+        else:
+            if not isinstance(e, int):
+                # Update the first occurrence of the key and remove the rest.
+                # This way, the order in which the keys are listed in the
+                # document and mapping will be preserved.
+                self._deleted.update(e[1:])
+                e = self._key2ids[key] = e[0]
+            self._values[e] = value
+        self._markup[e] = markup
+
+    def __delitem__(self, key: str) -> None:
+        e = self._key2ids.pop(key)
+        n = len(self._starts)
+        for i in [e] if isinstance(e, int) else e:
+            self._markup.pop(i, None)
+            if i < n:
+                self._deleted.add(i)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key2ids)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._key2ids)
+
+    def __len__(self) -> int:
+        return len(self._key2ids)
+
+    @classmethod
+    def load(cls, fp: IO) -> XMLPropertiesFile:
+        """
+        Parse the contents of the file-like object ``fp`` as an XML properties
+        file and return an `XMLPropertiesFile` instance.
+
+        If ``fp`` is a binary filehandle, the document's encoding is determined
+        from its byte order mark or XML declaration, and `dump()` will use the
+        same encoding.
+
+        :param IO fp: the file from which to read the XML properties document
+        :rtype: XMLPropertiesFile
+        :raises ValueError: if the root of the XML tree is not a
+            ``<properties>`` tag or an ``<entry>`` element is missing a
+            ``key`` attribute
+        """
+        return cls.loads(fp.read())
+
+    @classmethod
+    def loads(cls, s: AnyStr) -> XMLPropertiesFile:
+        """
+        Parse the contents of the string ``s`` as an XML properties document
+        and return an `XMLPropertiesFile` instance.
+
+        ``s`` may be either a text string or bytes string.  If it is a bytes
+        string, the document's encoding is determined from its byte order mark
+        or XML declaration, and `dump()` will use the same encoding.
+
+        :param Union[str,bytes] s: the string from which to read the XML
+            properties document
+        :rtype: XMLPropertiesFile
+        :raises ValueError: if the root of the XML tree is not a
+            ``<properties>`` tag or an ``<entry>`` element is missing a
+            ``key`` attribute
+        """
+        obj = cls()
+        if isinstance(s, bytes):
+            obj._encoding = _codec_name(_detect_encoding(s))
+            if obj._encoding in _NATIVE_ENCODINGS:
+                # The document can be parsed & edited as-is.
+                obj._source = s
+                obj._codec = obj._encoding
+                obj._parse(s)
+                return obj
+            text = s.decode(obj._encoding)
+        else:
+            text = s
+            m = _ENCODING_DECL_RGX.match(text[:1024].encode("ascii", "replace"))
+            obj._encoding = _codec_name(m[1].decode("ascii")) if m else "utf-8"
+        # When given a `str`, expat parses its UTF-8 encoding (ignoring any
+        # encoding in the XML declaration) and reports offsets into that.
+        obj._source = text.encode("utf-8")
+        obj._codec = "utf-8"
+        obj._parse(text)
+        return obj
+
+    def _parse(self, data: str | bytes) -> None:
+        # Parse `data`, whose encoding is `_source`, and fill in the instance's
+        # attributes
+        parser = expat.ParserCreate()
+        starts = self._starts
+        ends = self._ends
+        values = self._values
+        key2ids = self._key2ids
+        depth = 0
+        #: whether the end offset of the last entry in `starts` is the offset
+        #: of the next parser event
+        ending = False
+        #: the chunks of text of the entry currently being read
+        chunks: list[str] = []
+        #: whether character data is part of the text of an entry (i.e., is
+        #: before any child elements of the entry)
+        in_text = False
+        close = -1
+
+        def advance() -> None:
+            # Called at the start of every event
+            nonlocal ending
+            if ending:
+                ends.append(parser.CurrentByteIndex)
+                ending = False
+
+        def start_element(name: str, attrs: dict[str, str]) -> None:
+            nonlocal chunks, depth, in_text
+            advance()
+            depth += 1
+            in_text = False
+            if depth == 1:
+                if name != "properties":
+                    raise ValueError("XML tree is not rooted at <properties>")
+            elif depth == 2 and name == "entry":
+                key = attrs.get("key")
+                if key is None:
+                    raise ValueError('<entry> is missing "key" attribute')
+                i = len(starts)
+                starts.append(parser.CurrentByteIndex)
+                e = key2ids.get(key)
+                if e is None:
+                    key2ids[key] = i
+                elif isinstance(e, int):
+                    key2ids[key] = [e, i]
+                else:
+                    e.append(i)
+                chunks = []
+                in_text = True
+
+        def end_element(_name: str) -> None:
+            nonlocal close, depth, ending, in_text
+            advance()
+            if depth == 2 and len(values) < len(starts):
+                values.append("".join(chunks))
+                ending = True
+            elif depth == 1:
+                close = parser.CurrentByteIndex
+            in_text = False
+            depth -= 1
+
+        def character_data(data: str) -> None:
+            advance()
+            if in_text:
+                chunks.append(data)
+
+        def other(*_args: object) -> None:
+            advance()
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+        parser.CommentHandler = other
+        parser.ProcessingInstructionHandler = other
+        parser.StartCdataSectionHandler = other
+        parser.EndCdataSectionHandler = other
+        parser.DefaultHandlerExpand = other
+        try:
+            parser.Parse(data, True)
+        except expat.ExpatError as e:
+            err = ET.ParseError(str(e))
+            err.code = e.code
+            err.position = (e.lineno, e.offset)
+            raise err from None
+        assert not ending and len(ends) == len(starts) == len(values)
+        src = self._source
+        if src.startswith(b"</", close):
+            self._empty_root = False
+            line_start = src.rfind(b"\n", 0, close) + 1
+            self._own_lines = not src[line_start:close].strip()
+            self._insert_at = line_start if self._own_lines else close
+        else:
+            # The root element is an empty-element tag, and `close` is the
+            # offset just past it.
+            self._empty_root = True
+            self._own_lines = False
+            self._insert_at = close - 2
+        if ends:
+            line_start = src.rfind(b"\n", 0, starts[-1]) + 1
+            indent = src[line_start : starts[-1]]
+            if not indent.strip():
+                self._indent = indent
+        if b"\r\n" in src[: self._insert_at]:
+            self._newline = b"\r\n"
+
+    def _line_span(self, i: int) -> tuple[int, int]:
+        # Return the span of the `i`-th loaded entry, extended to cover the
+        # entire line if there is nothing else on it
+        src = self._source
+        start = self._starts[i]
+        end = self._ends[i]
+        line_start = src.rfind(b"\n", 0, start) + 1
+        if not src[line_start:start].strip():
+            m = _LINE_END_RGX.match(src, end)
+            if m:
+                return (line_start, m.end())
+        return (start, end)
+
+    def _pieces(self) -> Iterator[bytes | memoryview]:
+        # Return a generator of consecutive pieces of the encoded document
+        src = memoryview(self._source)
+        codec = self._codec
+        markup = self._markup
+        deleted = self._deleted
+        n = len(self._starts)
+        pos = 0
+        for i in sorted(i for i in (*markup, *deleted) if i < n):
+            if i in deleted:
+                start, end = self._line_span(i)
+            else:
+                start, end = self._starts[i], self._ends[i]
+            start = max(start, pos)
+            yield src[pos:start]
+            if i in markup:
+                yield markup[i].encode(codec, "xmlcharrefreplace")
+            pos = end
+        new = [markup[i] for i in sorted(i for i in markup if i >= n)]
+        if new:
+            yield src[pos : self._insert_at]
+            pos = self._insert_at
+            if self._empty_root:
+                yield b">"
+                pos += 2
+            if self._own_lines:
+                indent = self._indent.decode(codec)
+                newline = self._newline.decode(codec)
+                text = "".join(indent + m + newline for m in new)
+            else:
+                text = "".join(new)
+            if self._empty_root:
+                text += "</properties>"
+            yield text.encode(codec, "xmlcharrefreplace")
+        yield src[pos:]
+
+    def dump(self, fp: BinaryIO) -> None:
+        """
+        Write the document to the binary filehandle ``fp``.  If the instance
+        was loaded from a bytes document, the document's original encoding is
+        used; otherwise, the encoding named in the document's XML declaration
+        (or UTF-8 if there is none) is used.
+
+        :param BinaryIO fp: the file to write the document to
+        :return: `None`
+        """
+        if self._encoding == self._codec:
+            for piece in self._pieces():
+                fp.write(piece)
+        else:
+            fp.write(self.dumps().encode(self._encoding, "xmlcharrefreplace"))
+
+    def dumps(self) -> str:
+        """
+        Return the document as a `str`
+
+        :rtype: str
+        """
+        return b"".join(self._pieces()).decode(self._codec)
+
+    def copy(self) -> XMLPropertiesFile:
+        """Create a copy of the mapping, including the document"""
+        dup = type(self)()
+        dup._source = self._source
+        dup._codec = self._codec
+        dup._encoding = self._encoding
+        dup._insert_at = self._insert_at
+        dup._own_lines = self._own_lines
+        dup._indent = self._indent
+        dup._newline = self._newline
+        dup._empty_root = self._empty_root
+        dup._starts = self._starts[:]
+        dup._ends = self._ends[:]
+        dup._values = self._values[:]
+        dup._key2ids = {
+            k: e if isinstance(e, int) else e[:] for k, e in self._key2ids.items()
+        }
+        dup._markup = self._markup.copy()
+        dup._deleted = self._deleted.copy()
+        return dup
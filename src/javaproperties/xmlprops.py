@@ -1,31 +1,42 @@
 from __future__ import annotations
-from collections.abc import Callable, Iterable, Iterator, Mapping
-from typing import AnyStr, BinaryIO, IO, TypeVar, overload
+import codecs
+from collections import deque
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator, Mapping
+from itertools import islice
+import os
+from typing import AnyStr, BinaryIO, IO, TypeVar, cast, overload
 import xml.etree.ElementTree as ET
 from xml.sax.saxutils import escape, quoteattr
-from .util import itemize
+from .metrics import _listeners, _Measurement
+from .util import AsyncReader, AsyncWriter, aiter_chunks, awrite, itemize
+from .writing import DUMP_BATCH_SIZE
 
 T = TypeVar("T")
 
+#: Number of characters or bytes read from the file at a time by `load_xml()`
+XML_READ_SIZE = 65536
+
 
 @overload
-def load_xml(fp: IO) -> dict[str, str]: ...
+def load_xml(fp: IO | str | os.PathLike[str]) -> dict[str, str]: ...
 
 
 @overload
-def load_xml(fp: IO, object_pairs_hook: type[T]) -> T: ...
+def load_xml(fp: IO | str | os.PathLike[str], object_pairs_hook: type[T]) -> T: ...
 
 
 @overload
 def load_xml(
-    fp: IO, object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T]
+    fp: IO | str | os.PathLike[str],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
 ) -> T: ...
 
 
 def load_xml(fp, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
     r"""
     Parse the contents of the file-like object ``fp`` as an XML properties file
-    and return a `dict` of the key-value pairs.
+    and return a `dict` of the key-value pairs.  ``fp`` may also be the path
+    to a file, which is then opened & closed by `load_xml`.
 
     Beyond basic XML well-formedness, `load_xml` only checks that the root
     element is named "``properties``" and that all of its ``<entry>`` children
@@ -40,15 +51,48 @@ def load_xml(fp, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
     ``fp`` (including duplicates) in order of occurrence.  `load_xml` will then
     return the value returned by ``object_pairs_hook``.
 
-    :param IO fp: the file from which to read the XML properties document
+    .. versionchanged:: 0.9.0
+        The document is now parsed incrementally as the generator passed to
+        ``object_pairs_hook`` is consumed, and each ``<entry>`` is discarded
+        once its key-value pair has been yielded, so the memory used for
+        parsing no longer grows with the size of the document.  As a result,
+        errors in the document are now raised by the generator when it reaches
+        them rather than before ``object_pairs_hook`` is called.  If
+        ``object_pairs_hook`` returns without consuming the whole generator,
+        the rest of the document is still parsed (and any errors in it raised)
+        before `load_xml` returns.
+
+    :param fp: the file from which to read the XML properties document, or
+        its path
+    :type fp: IO, str, or os.PathLike
     :param callable object_pairs_hook: class or function for combining the
         key-value pairs
     :rtype: `dict` or the return value of ``object_pairs_hook``
     :raises ValueError: if the root of the XML tree is not a ``<properties>``
         tag or an ``<entry>`` element is missing a ``key`` attribute
     """
-    tree = ET.parse(fp)
-    return object_pairs_hook(_fromXML(tree.getroot()))
+    if _listeners:
+        with _Measurement("load_xml") as m:
+            return _load_xml(fp, m.hook(object_pairs_hook), m)
+    return _load_xml(fp, object_pairs_hook, None)
+
+
+def _load_xml(
+    fp: IO | str | os.PathLike[str],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+    measurement: _Measurement | None,
+) -> T:
+    if isinstance(fp, (str, os.PathLike)):
+        with open(fp, "rb") as fh:
+            return _load_xml(fh, object_pairs_hook, measurement)
+    if measurement is not None:
+        fp = measurement.reader(fp)
+    pairs = _iterparse_xml(fp)
+    result = object_pairs_hook(pairs)
+    # Parse whatever the hook didn't consume so that a malformed document is
+    # never accepted.
+    deque(pairs, maxlen=0)
+    return result
 
 
 @overload
@@ -91,10 +135,116 @@ def loads_xml(s, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
     :raises ValueError: if the root of the XML tree is not a ``<properties>``
         tag or an ``<entry>`` element is missing a ``key`` attribute
     """
+    if _listeners:
+        with _Measurement("loads_xml", len(s)) as m:
+            elem = ET.fromstring(s)
+            return object_pairs_hook(m.count_entries(_fromXML(elem)))
     elem = ET.fromstring(s)
     return object_pairs_hook(_fromXML(elem))
 
 
+@overload
+async def aload_xml(
+    src: AsyncReader | AsyncIterable[str | bytes],
+) -> dict[str, str]: ...
+
+
+@overload
+async def aload_xml(
+    src: AsyncReader | AsyncIterable[str | bytes],
+    object_pairs_hook: type[T],
+) -> T: ...
+
+
+@overload
+async def aload_xml(
+    src: AsyncReader | AsyncIterable[str | bytes],
+    object_pairs_hook: Callable[[Iterator[tuple[str, str]]], T],
+) -> T: ...
+
+
+async def aload_xml(src, object_pairs_hook=dict):  # type: ignore[no-untyped-def]
+    """
+    .. versionadded:: 0.9.0
+
+    Like `load_xml()`, but read the XML properties document from an
+    asynchronous source.  ``src`` may be either an object with an async
+    ``read()`` method (such as an `asyncio.StreamReader`) or an async iterable
+    of chunks of the document as text strings or bytes strings.  The input is
+    parsed incrementally as it is read, yielding to the event loop between
+    chunks.
+
+    The key-value pairs are passed to ``object_pairs_hook`` as with
+    `load_xml()` once the entire input has been read.
+
+    :param src: the source from which to read the XML properties document
+    :param callable object_pairs_hook: class or function for combining the
+        key-value pairs
+    :rtype: `dict` or the return value of ``object_pairs_hook``
+    :raises ValueError: if the root of the XML tree is not a ``<properties>``
+        tag or an ``<entry>`` element is missing a ``key`` attribute
+    """
+    parser = _EntryPullParser()
+    pairs = []
+    async for chunk in aiter_chunks(src):
+        pairs.extend(parser.feed(chunk))
+    pairs.extend(parser.close())
+    return object_pairs_hook(iter(pairs))
+
+
+def _iterparse_xml(fp: IO) -> Iterator[tuple[str, str]]:
+    parser = _EntryPullParser()
+    while chunk := fp.read(XML_READ_SIZE):
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class _EntryPullParser:
+    """
+    Incrementally parses an XML properties document, returning the key-value
+    pairs of the ``<entry>`` elements as they are completed and discarding
+    each child of the root element once it has been read
+    """
+
+    def __init__(self) -> None:
+        self._parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(
+            events=("start", "end")
+        )
+        self._root: ET.Element | None = None
+        self._depth = 0
+
+    def feed(self, data: str | bytes) -> list[tuple[str, str]]:
+        self._parser.feed(data)
+        return self._read_pairs()
+
+    def close(self) -> list[tuple[str, str]]:
+        self._parser.close()
+        return self._read_pairs()
+
+    def _read_pairs(self) -> list[tuple[str, str]]:
+        pairs = []
+        # We only asked for "start" and "end" events, which are always pairs
+        events = cast("Iterator[tuple[str, ET.Element]]", self._parser.read_events())
+        for event, elem in events:
+            if event == "start":
+                self._depth += 1
+                if self._depth == 1:
+                    if elem.tag != "properties":
+                        raise ValueError("XML tree is not rooted at <properties>")
+                    self._root = elem
+            else:
+                self._depth -= 1
+                if self._depth == 1:
+                    if elem.tag == "entry":
+                        key = elem.get("key")
+                        if key is None:
+                            raise ValueError('<entry> is missing "key" attribute')
+                        pairs.append((key, elem.text or ""))
+                    assert self._root is not None
+                    del self._root[:]
+        return pairs
+
+
 def _fromXML(root: ET.Element) -> Iterator[tuple[str, str]]:
     if root.tag != "properties":
         raise ValueError("XML tree is not rooted at <properties>")
@@ -129,19 +279,60 @@ def dump_xml(
         lexicographically by key in the output
     :return: `None`
     """
-    # This gives type errors <https://github.com/python/typeshed/issues/4793>:
-    # fptxt = codecs.lookup(encoding).streamwriter(fp, errors='xmlcharrefreplace')
-    # print('<?xml version="1.0" encoding={0} standalone="no"?>'
-    #      .format(quoteattr(encoding)), file=fptxt)
-    # for s in _stream_xml(props, comment, sort_keys):
-    #    print(s, file=fptxt)
-    fp.write(
-        '<?xml version="1.0" encoding={} standalone="no"?>\n'.format(
-            quoteattr(encoding)
-        ).encode(encoding, "xmlcharrefreplace")
-    )
-    for s in _stream_xml(props, comment, sort_keys):
-        fp.write((s + "\n").encode(encoding, "xmlcharrefreplace"))
+    if _listeners:
+        with _Measurement("dump_xml") as m:
+            _dump_xml(
+                m.count_entries(itemize(props, sort_keys=sort_keys)),
+                m.writer(fp),
+                comment,
+                encoding,
+                False,
+            )
+    else:
+        _dump_xml(props, fp, comment, encoding, sort_keys)
+
+
+def _dump_xml(
+    props: Mapping[str, str] | Iterable[tuple[str, str]],
+    fp: BinaryIO,
+    comment: str | None,
+    encoding: str,
+    sort_keys: bool,
+) -> None:
+    for data in _encode_xml_chunks(props, comment, encoding, sort_keys):
+        fp.write(data)
+
+
+async def adump_xml(
+    props: Mapping[str, str] | Iterable[tuple[str, str]],
+    fp: AsyncWriter,
+    comment: str | None = None,
+    encoding: str = "UTF-8",
+    sort_keys: bool = False,
+) -> None:
+    """
+    .. versionadded:: 0.9.0
+
+    Like `dump_xml()`, but write to an asynchronous binary stream such as an
+    `asyncio.StreamWriter`.  The output is written in batches of lines,
+    waiting for ``fp`` to drain (if it has an async ``drain()`` method) and
+    yielding to the event loop after each batch.
+
+    :param props: A mapping or iterable of ``(key, value)`` pairs to write to
+        ``fp``.  All keys and values in ``props`` must be `str` values.  If
+        ``sort_keys`` is `False`, the entries are output in iteration order.
+    :param fp: a binary stream to write the values of ``props`` to.  Its
+        ``write()`` method may be either synchronous or async.
+    :param Optional[str] comment: if non-`None`, ``comment`` will be output as
+        a ``<comment>`` element before the ``<entry>`` elements
+    :param str encoding: the name of the encoding to use for the XML document
+        (also included in the XML declaration)
+    :param bool sort_keys: if true, the elements of ``props`` are sorted
+        lexicographically by key in the output
+    :return: `None`
+    """
+    for data in _encode_xml_chunks(props, comment, encoding, sort_keys):
+        await awrite(fp, data)
 
 
 def dumps_xml(
@@ -163,18 +354,87 @@ def dumps_xml(
         lexicographically by key in the output
     :rtype: str
     """
-    return "".join(s + "\n" for s in _stream_xml(props, comment, sort_keys))
+    if _listeners:
+        with _Measurement("dumps_xml") as m:
+            items = m.count_entries(itemize(props, sort_keys=sort_keys))
+            s = "".join(_dump_xml_chunks(items, comment))
+            m.bytes_out = len(s)
+            return s
+    return "".join(_dump_xml_chunks(props, comment, sort_keys))
+
+
+def _encode_xml_chunks(
+    props: Mapping[str, str] | Iterable[tuple[str, str]],
+    comment: str | None,
+    encoding: str,
+    sort_keys: bool,
+) -> Iterator[bytes]:
+    """
+    Return a generator of consecutive pieces of the encoded output of
+    `dump_xml()` for the given arguments.  All pieces are encoded with a
+    single incremental encoder, so that encodings with a BOM (e.g., UTF-16)
+    only emit it once, at the start of the document.
+    """
+    encoder = codecs.getincrementalencoder(encoding)(errors="xmlcharrefreplace")
+    decl = '<?xml version="1.0" encoding={} standalone="no"?>\n'.format(
+        quoteattr(encoding)
+    )
+    for chunk in _dump_xml_chunks(props, comment, sort_keys):
+        if data := encoder.encode(decl + chunk):
+            yield data
+        decl = ""
+    if data := encoder.encode("", final=True):
+        yield data
 
 
-def _stream_xml(
+def _dump_xml_chunks(
     props: Mapping[str, str] | Iterable[tuple[str, str]],
     comment: str | None = None,
     sort_keys: bool = False,
 ) -> Iterator[str]:
-    yield '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">'
-    yield "<properties>"
+    """
+    Return a generator of consecutive pieces of the output of `dumps_xml()`
+    for the given arguments.  Each piece consists of one or more complete
+    lines, with the entries serialized `DUMP_BATCH_SIZE` at a time.
+    """
+    header = (
+        '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+        "<properties>\n"
+    )
     if comment is not None:
-        yield "<comment>" + escape(comment) + "</comment>"
-    for k, v in itemize(props, sort_keys=sort_keys):
-        yield f"<entry key={quoteattr(k)}>{escape(v)}</entry>"
-    yield "</properties>"
+        header += "<comment>" + escape(comment) + "</comment>\n"
+    yield header
+    items = iter(itemize(props, sort_keys=sort_keys))
+    while batch := list(islice(items, DUMP_BATCH_SIZE)):
+        yield _join_entries(batch)
+    yield "</properties>\n"
+
+
+def _join_entries(pairs: list[tuple[str, str]]) -> str:
+    """
+    Convert a list of key-value pairs to ``<entry>`` lines, each terminated by
+    a newline.
+
+    All of the keys (and all of the values) are joined together with LFs and
+    escaped at once, after which the LFs are used to split them apart again.
+    If any key or value already contains an LF or any key contains a double
+    quote (which affects how `quoteattr()` quotes it), the pairs are instead
+    escaped one at a time.
+    """
+    keys, values = zip(*pairs)
+    joined_keys = "\n".join(keys)
+    joined_values = "\n".join(values)
+    n = len(pairs) - 1
+    if (
+        joined_keys.count("\n") != n
+        or joined_values.count("\n") != n
+        or '"' in joined_keys
+    ):
+        return "".join(
+            f"<entry key={quoteattr(k)}>{escape(v)}</entry>\n" for k, v in pairs
+        )
+    esc_keys = escape(joined_keys, {"\r": "&#13;", "\t": "&#9;"}).split("\n")
+    esc_values = escape(joined_values).split("\n")
+    return "".join(
+        [f'<entry key="{k}">{v}</entry>\n' for k, v in zip(esc_keys, esc_values)]
+    )
@@ -1,12 +1,64 @@
 from __future__ import annotations
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 import time
+from typing import TypeVar, cast
 import pytest
 from pytest_mock import MockerFixture
 
+# Documents covering the corners of the `.properties` syntax, used to check the
+# various ways of parsing (text, bytes, files, incremental) against each other
+PARSE_INPUTS = [
+    "",
+    "key=value",
+    "key=value\n",
+    "#comment\n!comment\n\n   \nkey : value\n",
+    "key=value\r\nfoo=bar\rbaz=quux\n",
+    "key=value\r\n\r\n\r",
+    "key va\\\n    lue\n",
+    "key va\\\r\n    lue\r\n",
+    "key va\\\r    lue\r",
+    "key va\\",
+    "key va\\\\\n",
+    "key = v\\\n\ta\\\r\n\fl\\\r u\\\ne\n",
+    " \\\n\t\\\r\n\f\\\r \n",
+    "key=\\\n#not a comment\n",
+    "#comment\\\nkey=value\n",
+    "#comment \\\nnot=continued\\\\\r",
+    "a\\\\ b\na\\ b=c\na\\=b = c\n=value\n",
+    "key \t= : value\n",
+    "\\u00F0=\\u2603\ngoat: \\ud83d\\udc10\n",
+    "\xf0=\xe9\xff\n\x85=\x85\x1c\n",
+    "foo=first\nbar=second\nfoo=third\n",
+    "\r\r\n\n\r",
+    "long\\\n\\\r\\\r\n\\\n\\\r\n  \\\n  value\\\\\\\n end",
+]
+
 
 @pytest.fixture
 def fixed_timestamp(mocker: MockerFixture) -> Iterator[str]:
     m = mocker.patch("time.localtime", return_value=time.localtime(1478550580))
     yield "Mon Nov 07 15:29:40 EST 2016"
     m.assert_called_once_with(None)
+
+
+S = TypeVar("S", bound=str | bytes)
+
+
+async def achunks(data: S, size: int) -> AsyncIterator[S]:
+    """Asynchronously yield ``data`` in pieces of ``size`` characters/bytes"""
+    for i in range(0, len(data), size):
+        yield cast(S, data[i : i + size])
+
+
+class FakeWriter:
+    """A minimal stand-in for an `asyncio.StreamWriter`"""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+        self.drained = 0
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    async def drain(self) -> None:
+        self.drained += 1
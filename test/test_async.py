@@ -0,0 +1,126 @@
+from __future__ import annotations
+import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from conftest import FakeWriter, achunks
+import pytest
+from javaproperties import (
+    InvalidUEscapeError,
+    PropertiesElement,
+    adump,
+    aload,
+    aparse,
+    dumps,
+    loads,
+    parse,
+)
+from javaproperties.writing import DUMP_BATCH_SIZE
+
+INPUT = (
+    "#Comment\r\n"
+    "key = multi\\\r\n"
+    "      line\r\n"
+    "\n"
+    "snowman: \\u2603\r"
+    "goat = \\ud83d\\udc10\n"
+    "key = redefined"
+)
+
+
+async def streamreader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class AsyncWriteOnly:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    async def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+
+async def alist(it: AsyncIterator[PropertiesElement]) -> list[PropertiesElement]:
+    return [e async for e in it]
+
+
+@pytest.mark.parametrize("size", [1, 3, 1000])
+@pytest.mark.parametrize("data", [INPUT, INPUT.encode("iso-8859-1")])
+def test_aparse_chunks(data: str | bytes, size: int) -> None:
+    assert asyncio.run(alist(aparse(achunks(data, size)))) == list(parse(INPUT))
+
+
+def test_aparse_streamreader() -> None:
+    async def run() -> list[PropertiesElement]:
+        return await alist(aparse(await streamreader(INPUT.encode("iso-8859-1"))))
+
+    assert asyncio.run(run()) == list(parse(INPUT))
+
+
+def test_aload_streamreader() -> None:
+    async def run() -> dict[str, str]:
+        return await aload(await streamreader(INPUT.encode("iso-8859-1")))
+
+    assert asyncio.run(run()) == loads(INPUT)
+
+
+def test_aload_object_pairs_hook() -> None:
+    assert asyncio.run(
+        aload(achunks(INPUT, 5), object_pairs_hook=OrderedDict)
+    ) == loads(INPUT, object_pairs_hook=OrderedDict)
+
+
+def test_aload_empty() -> None:
+    assert asyncio.run(aload(achunks("", 5))) == {}
+
+
+def test_aload_invalid_u_escape() -> None:
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        asyncio.run(aload(achunks("good=value\nbad = \\uabcx\n", 4)))
+    assert excinfo.value.escape == "\\uabcx"
+
+
+PROPS = [
+    ("key", "value"),
+    ("edh", "\xf0"),
+    ("snowman", "\u2603"),
+    ("goat", "\U0001f410"),
+]
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_adump(ensure_ascii: bool) -> None:
+    fp = FakeWriter()
+    asyncio.run(
+        adump(
+            PROPS,
+            fp,
+            comments="\u2603 comment",
+            timestamp=None,
+            ensure_ascii=ensure_ascii,
+        )
+    )
+    assert fp.drained == len(fp.chunks)
+    assert b"".join(fp.chunks) == dumps(
+        PROPS, comments="\u2603 comment", timestamp=None, ensure_ascii=ensure_ascii
+    ).encode("iso-8859-1", "javapropertiesreplace")
+
+
+def test_adump_timestamp(fixed_timestamp: str) -> None:
+    fp = AsyncWriteOnly()
+    asyncio.run(adump({"key": "value"}, fp))
+    assert b"".join(fp.chunks) == f"#{fixed_timestamp}\nkey=value\n".encode()
+
+
+def test_adump_batches() -> None:
+    props: Iterable[tuple[str, str]] = [
+        (f"key{i}", f"value{i}") for i in range(DUMP_BATCH_SIZE * 5 // 2)
+    ]
+    fp = FakeWriter()
+    asyncio.run(adump(props, fp, timestamp=None, sort_keys=True))
+    assert len(fp.chunks) == fp.drained == 3
+    assert b"".join(fp.chunks) == dumps(props, timestamp=None, sort_keys=True).encode(
+        "iso-8859-1"
+    )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+import asyncio
+from collections import OrderedDict
+from io import BytesIO
+import xml.etree.ElementTree as ET
+from conftest import FakeWriter, achunks
+import pytest
+from javaproperties import adump_xml, aload_xml, dump_xml, loads_xml
+
+INPUT = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+    '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+    "<properties>\n"
+    "<comment>This is a comment.</comment>\n"
+    '<entry key="foo">bar</entry>\n'
+    '<entry key="snowman">\u2603</entry>\n'
+    '<entry key="empty"/>\n'
+    '<entry key="goat">\U0001f410</entry>\n'
+    '<entry key="foo">redefined</entry>\n'
+    "</properties>\n"
+).encode("utf-8")
+
+
+@pytest.mark.parametrize("size", [1, 7, 10000])
+def test_aload_xml(size: int) -> None:
+    assert asyncio.run(
+        aload_xml(achunks(INPUT, size), object_pairs_hook=OrderedDict)
+    ) == loads_xml(INPUT, object_pairs_hook=OrderedDict)
+
+
+def test_aload_xml_streamreader() -> None:
+    async def run() -> dict[str, str]:
+        reader = asyncio.StreamReader()
+        reader.feed_data(INPUT)
+        reader.feed_eof()
+        return await aload_xml(reader)
+
+    assert asyncio.run(run()) == loads_xml(INPUT)
+
+
+def test_aload_xml_bad_root() -> None:
+    with pytest.raises(ValueError) as excinfo:
+        asyncio.run(aload_xml(achunks(b'<proprieties><entry key="a">b</entry>', 5)))
+    assert str(excinfo.value) == "XML tree is not rooted at <properties>"
+
+
+def test_aload_xml_missing_key() -> None:
+    with pytest.raises(ValueError) as excinfo:
+        asyncio.run(aload_xml(achunks(b"<properties><entry>b</entry></properties>", 5)))
+    assert str(excinfo.value) == '<entry> is missing "key" attribute'
+
+
+def test_aload_xml_nested_entries_ignored() -> None:
+    data = (
+        b'<properties><entry key="a">b</entry>'
+        b'<foo><entry key="c">d</entry></foo></properties>'
+    )
+    assert asyncio.run(aload_xml(achunks(data, 3))) == {"a": "b"}
+
+
+def test_aload_xml_malformed() -> None:
+    with pytest.raises(ET.ParseError):
+        asyncio.run(aload_xml(achunks(b'<properties><entry key="a">b</entry>', 5)))
+
+
+@pytest.mark.parametrize("enc", ["ASCII", "Latin-1", "UTF-16BE", "UTF-8"])
+def test_adump_xml(enc: str) -> None:
+    props = [("key", "value"), ("snowman", "\u2603"), ("goat", "\U0001f410")]
+    fp = FakeWriter()
+    asyncio.run(adump_xml(props, fp, comment="Comment", encoding=enc))
+    expected = BytesIO()
+    dump_xml(props, expected, comment="Comment", encoding=enc)
+    assert b"".join(fp.chunks) == expected.getvalue()
+
+
+def test_adump_xml_utf16_matches_dump_xml() -> None:
+    # Enough entries for several batches, each of which must not start with a
+    # BOM of its own
+    props = [(f"key{i}", f"value ☃ {i}") for i in range(10000)]
+    fp = FakeWriter()
+    asyncio.run(adump_xml(props, fp, encoding="utf-16"))
+    assert len(fp.chunks) > 2
+    expected = BytesIO()
+    dump_xml(props, expected, encoding="utf-16")
+    assert b"".join(fp.chunks) == expected.getvalue()
+    assert expected.getvalue() == (
+        '<?xml version="1.0" encoding="utf-16" standalone="no"?>\n'
+        + '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+        "<properties>\n"
+        + "".join(f'<entry key="{k}">{v}</entry>\n' for k, v in props)
+        + "</properties>\n"
+    ).encode("utf-16")
@@ -0,0 +1,60 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+import pytest
+from javaproperties import loads, loads_xml
+from javaproperties.bench import Workload, main
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_workload(seed: int) -> None:
+    wl = Workload.generate(500, seed)
+    assert loads(wl.text) == dict(wl.pairs)
+    assert loads_xml(wl.xml) == dict(wl.pairs)
+    assert Workload.generate(500, seed) == wl
+
+
+def test_bench_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    save = tmp_path / "baseline.json"
+    args = ["-n", "20", "-r", "1", "--min-time", "0"]
+    assert main([*args, "--save", str(save), "reading.*"]) == 0
+    data = json.loads(save.read_text(encoding="utf-8"))
+    assert data["size"] == 20
+    assert sorted(data["results"]) == [
+        "reading.load_path",
+        "reading.loads",
+        "reading.parse",
+        "reading.unescape",
+    ]
+    capsys.readouterr()
+    assert main([*args, "--baseline", str(save), "reading.loads"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert len(out) == 2
+    assert out[0].split() == [
+        "benchmark",
+        "ops/s",
+        "MB/s",
+        "ns/entry",
+        "vs",
+        "baseline",
+    ]
+    assert out[1].split()[0] == "reading.loads"
+    assert out[1].endswith("x")
+    assert (
+        main([*args, "--baseline", str(save), "--max-slowdown", "0", "reading.loads"])
+        == 1
+    )
+
+
+def test_bench_parallel(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    save = tmp_path / "results.json"
+    args = ["-n", "50", "-r", "1", "--min-time", "0", "--save", str(save)]
+    assert main([*args, "parallel.*"]) == 0
+    capsys.readouterr()
+    data = json.loads(save.read_text(encoding="utf-8"))
+    assert sorted(data["results"]) == [
+        "parallel.load_many",
+        "parallel.load_many_serial",
+        "parallel.load_path_parallel",
+    ]
+    assert all(r["entries"] == 50 for r in data["results"].values())
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from dataclasses import replace
+from io import StringIO
+from pathlib import Path
+import pytest
+from javaproperties import (
+    PropertiesFile,
+    load_path,
+    loads,
+    loads_xml,
+    parse,
+)
+from javaproperties.corpus import XML_ESCAPED_CHARS, Corpus, main, parse_size
+
+CORPORA = [
+    Corpus(500),
+    Corpus(500, seed=42, duplicate_ratio=0.3, newline="\r\n"),
+    Corpus(
+        500,
+        seed=1,
+        escape_ratio=0.3,
+        bmp_ratio=0.2,
+        astral_ratio=0.2,
+        continuation_ratio=0.5,
+        comment_ratio=0.3,
+        blank_ratio=0.3,
+        newline="\r",
+        separators=("=", ":", " ", " = ", "\t:\t"),
+    ),
+    Corpus(
+        500, seed=2, escape_ratio=1, bmp_ratio=0, astral_ratio=0, continuation_ratio=1
+    ),
+    Corpus(500, seed=3, ensure_ascii=False, astral_ratio=0.1),
+    Corpus(0),
+]
+
+
+@pytest.mark.parametrize("corpus", CORPORA)
+def test_corpus_properties(corpus: Corpus) -> None:
+    text = corpus.text()
+    assert text == replace(corpus).text()
+    assert loads(text) == corpus.expected()
+    assert "".join(e.source for e in parse(text)) == text
+    pf = PropertiesFile.loads(text)
+    assert dict(pf) == corpus.expected()
+    assert pf.dumps() == text
+    fp = StringIO()
+    corpus.dump(fp)
+    assert loads(fp.getvalue()) == corpus.expected()
+
+
+@pytest.mark.parametrize("corpus", CORPORA)
+def test_corpus_xml(corpus: Corpus) -> None:
+    corpus = replace(corpus, escaped_chars=XML_ESCAPED_CHARS)
+    assert loads_xml(corpus.xml()) == corpus.expected()
+
+
+def test_corpus_shape() -> None:
+    corpus = Corpus(
+        2000,
+        escape_ratio=0,
+        bmp_ratio=0,
+        astral_ratio=0,
+        duplicate_ratio=0.5,
+        comment_ratio=0,
+        blank_ratio=0,
+        continuation_ratio=0,
+    )
+    text = corpus.text()
+    assert text.isascii()
+    assert "\\u" not in text
+    assert "\\\n" not in text
+    assert len(text.splitlines()) == 2000
+    assert 800 < len(corpus.expected()) < 1200
+
+
+def test_corpus_seed() -> None:
+    assert Corpus(100, seed=1).text() != Corpus(100, seed=2).text()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"entries": -1},
+        {"comment_ratio": 1.5},
+        {"escape_ratio": 0.5, "bmp_ratio": 0.5, "astral_ratio": 0.5},
+        {"newline": "\n\r"},
+        {"separators": ()},
+        {"escaped_chars": ""},
+    ],
+)
+def test_corpus_invalid(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        Corpus(**kwargs)
+
+
+@pytest.mark.parametrize("size", [1, 10000, 1 << 20])
+def test_corpus_for_size(size: int) -> None:
+    corpus = Corpus.for_size(size, seed=5)
+    assert corpus.seed == 5
+    assert 0.5 * size <= len(corpus.text()) <= 1.5 * size or size < 1000
+
+
+@pytest.mark.parametrize(
+    "s,size",
+    [
+        ("100", 100),
+        ("2K", 2048),
+        ("1.5MiB", 1572864),
+        ("1gb", 1 << 30),
+    ],
+)
+def test_parse_size(s: str, size: int) -> None:
+    assert parse_size(s) == size
+
+
+def test_corpus_main(tmp_path: Path) -> None:
+    outfile = tmp_path / "corpus.properties"
+    assert main(["-n", "50", "--seed", "7", "--newline", "crlf", str(outfile)]) == 0
+    corpus = Corpus(50, seed=7, newline="\r\n")
+    assert outfile.read_bytes() == corpus.text().encode("iso-8859-1")
+    assert load_path(outfile) == corpus.expected()
+    assert main(["--size", "64K", "--format", "xml", str(outfile)]) == 0
+    assert 32768 < len(outfile.read_bytes()) < 131072
@@ -30,3 +30,17 @@ def test_dump_xml_encoding(enc: str) -> None:
         '<entry key="goat">\U0001f410</entry>\n'
         "</properties>\n"
     ).encode(enc, "xmlcharrefreplace")
+
+
+def test_dump_xml_bom_encoding() -> None:
+    # Encodings that prefix their output with a BOM only emit it once, at the
+    # start of the document.
+    fp = BytesIO()
+    dump_xml([("key", "value")], fp, encoding="UTF-16")
+    assert fp.getvalue() == (
+        '<?xml version="1.0" encoding="UTF-16" standalone="no"?>\n'
+        '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+        "<properties>\n"
+        '<entry key="key">value</entry>\n'
+        "</properties>\n"
+    ).encode("UTF-16")
@@ -3,7 +3,7 @@ from collections import OrderedDict
 from datetime import datetime
 from dateutil.tz import tzoffset
 import pytest
-from javaproperties import dumps, to_comment
+from javaproperties import dumps, join_key_value, to_comment
 
 
 @pytest.mark.parametrize(
@@ -231,3 +231,39 @@ def test_dumps_timestamp_and_comment() -> None:
         )
         == "#This is a comment.\n#Mon Sep 12 14:00:54 EDT 2016\nkey=value\n"
     )
+
+
+FIELDS = [
+    "",
+    "plain",
+    " leading space",
+    "  two leading spaces",
+    "trailing space ",
+    "inner space",
+    "tab\tand\fform feed",
+    "line\nbreak",
+    "carriage\rreturn",
+    "#!=:\\",
+    "caf\xe9",
+    "☃",
+    "\U0001f410",
+    "\x7f\x00",
+]
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("separator", ["=", " : ", "\t"])
+def test_dumps_many_entries(ensure_ascii: bool, separator: str) -> None:
+    # Enough entries to span several serialization batches, with newlines only
+    # in some of the batches
+    pairs = [
+        (f"{FIELDS[i % len(FIELDS)]}{i}", FIELDS[i * 7 % len(FIELDS)])
+        for i in range(10000)
+        if i < 5000 or "\n" not in FIELDS[i % len(FIELDS)] + FIELDS[i * 7 % len(FIELDS)]
+    ]
+    assert dumps(
+        pairs, separator=separator, timestamp=None, ensure_ascii=ensure_ascii
+    ) == "".join(
+        join_key_value(k, v, separator=separator, ensure_ascii=ensure_ascii) + "\n"
+        for k, v in pairs
+    )
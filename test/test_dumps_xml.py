@@ -155,3 +155,30 @@ def test_dumps_xml_entities() -> None:
         '<entry key="&amp;&lt;&gt;&quot;\'">&amp;&lt;&gt;"\'</entry>\n'
         "</properties>\n"
     )
+
+
+@pytest.mark.parametrize(
+    "pairs,entries",
+    [
+        (
+            [("a\tb\rc", "d\te\rf"), ("plain", "x<y")],
+            '<entry key="a&#9;b&#13;c">d\te\rf</entry>\n'
+            '<entry key="plain">x&lt;y</entry>\n',
+        ),
+        (
+            [("a\nb", "c\nd"), ("plain", "x<y")],
+            '<entry key="a&#10;b">c\nd</entry>\n<entry key="plain">x&lt;y</entry>\n',
+        ),
+        (
+            [('say "hi"', "v"), ('it\'s "x"', "w"), ("plain", "x<y")],
+            "<entry key='say \"hi\"'>v</entry>\n"
+            '<entry key="it\'s &quot;x&quot;">w</entry>\n'
+            '<entry key="plain">x&lt;y</entry>\n',
+        ),
+    ],
+)
+def test_dumps_xml_batch_escaping(pairs: list[tuple[str, str]], entries: str) -> None:
+    assert dumps_xml(pairs) == (
+        '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+        "<properties>\n" + entries + "</properties>\n"
+    )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+import pytest
+from javaproperties import (
+    EscapeCache,
+    EscapeCacheInfo,
+    PropertiesFile,
+    dumps,
+    escape,
+    join_key_value,
+)
+
+FIELDS = [
+    "",
+    "plain",
+    " leading space",
+    "inner space",
+    "tab\tand\nnewline",
+    "#!=:\\",
+    "caf\xe9",
+    "☃",
+    "\U0001f410",
+]
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_escape_cache_escape(ensure_ascii: bool) -> None:
+    cache = EscapeCache()
+    for _ in range(2):
+        for f in FIELDS:
+            assert cache.escape(f, ensure_ascii=ensure_ascii) == escape(
+                f, ensure_ascii=ensure_ascii
+            )
+    info = cache.cache_info()
+    assert info.misses == len(FIELDS)
+    assert info.hits == len(FIELDS)
+    assert info.currsize == len(FIELDS)
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("separator", ["=", " : ", "\t"])
+def test_escape_cache_join_key_value(ensure_ascii: bool, separator: str) -> None:
+    cache = EscapeCache()
+    for k in FIELDS:
+        for v in FIELDS:
+            assert cache.join_key_value(
+                k, v, separator=separator, ensure_ascii=ensure_ascii
+            ) == join_key_value(k, v, separator=separator, ensure_ascii=ensure_ascii)
+
+
+def test_escape_cache_keyed_by_ensure_ascii() -> None:
+    cache = EscapeCache()
+    assert cache.escape("caf\xe9", ensure_ascii=True) == "caf\\u00e9"
+    assert cache.escape("caf\xe9", ensure_ascii=False) == "caf\xe9"
+    assert cache.cache_info().misses == 2
+
+
+def test_escape_cache_maxsize() -> None:
+    cache = EscapeCache(maxsize=2)
+    for f in ["a", "b", "c", "a"]:
+        cache.escape(f)
+    info = cache.cache_info()
+    assert info.maxsize == 2
+    assert info.currsize == 2
+    assert info.hits == 0
+    assert info.misses == 4
+
+
+def test_escape_cache_clear() -> None:
+    cache = EscapeCache()
+    cache.escape("a")
+    cache.escape("a")
+    cache.cache_clear()
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_dumps_escape_cache(ensure_ascii: bool) -> None:
+    cache = EscapeCache()
+    props = {f"{k}{i}": v for i, k in enumerate(FIELDS) for v in FIELDS}
+    for _ in range(2):
+        assert dumps(
+            props, timestamp=None, ensure_ascii=ensure_ascii, escape_cache=cache
+        ) == dumps(props, timestamp=None, ensure_ascii=ensure_ascii)
+    assert cache.cache_info().hits > 0
+
+
+def test_propfile_dumps_escape_cache() -> None:
+    cache = EscapeCache()
+    pf = PropertiesFile.loads("#comment\nkey = value\nfoo: bar\n")
+    pf["foo"] = "new value"
+    pf["new key"] = " ☃"
+    for _ in range(2):
+        assert pf.dumps(escape_cache=cache) == pf.dumps()
+    info = cache.cache_info()
+    assert info.misses == 4
+    assert info.hits == 4
+
+
+def test_escape_cache_info() -> None:
+    cache = EscapeCache(maxsize=None)
+    cache.escape("foo")
+    cache.escape("foo")
+    info = cache.cache_info()
+    assert isinstance(info, EscapeCacheInfo)
+    assert info == EscapeCacheInfo(hits=1, misses=1, maxsize=None, currsize=1)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, None, 0)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import AnyStr
+import pytest
+from pytest_mock import MockerFixture
+from javaproperties import InvalidUEscapeError, LazyProperties, loads
+import javaproperties.lazyprops
+
+INPUT = """\
+# A comment
+foo: first definition
+bar=only definition
+snowman = \\u2603
+goat = \\ud83d\\udc10
+
+key = multi\\
+      line
+foo : second definition
+"""
+
+
+@pytest.mark.parametrize("src", [INPUT, INPUT.encode("iso-8859-1")])
+def test_lazyprops_loads(src: AnyStr) -> None:
+    lp = LazyProperties.loads(src)
+    assert len(lp) == 5
+    assert list(lp) == ["foo", "bar", "snowman", "goat", "key"]
+    assert dict(lp) == loads(src)
+    assert lp == loads(src)
+
+
+def test_lazyprops_load(tmp_path: Path) -> None:
+    p = tmp_path / "test.properties"
+    p.write_text(INPUT, encoding="iso-8859-1")
+    with p.open(encoding="iso-8859-1") as fp:
+        lp = LazyProperties.load(fp)
+    assert dict(lp) == loads(INPUT)
+
+
+def test_lazyprops_empty() -> None:
+    lp = LazyProperties.loads("")
+    assert len(lp) == 0
+    assert dict(lp) == {}
+    assert "foo" not in lp
+
+
+def test_lazyprops_values_decoded_on_access(mocker: MockerFixture) -> None:
+    lp = LazyProperties.loads(INPUT)
+    spy = mocker.spy(javaproperties.lazyprops, "unescape")
+    assert "snowman" in lp
+    assert "missing" not in lp
+    assert list(lp) == ["foo", "bar", "snowman", "goat", "key"]
+    spy.assert_not_called()
+    assert lp["snowman"] == "\u2603"
+    assert lp["snowman"] == "\u2603"
+    spy.assert_called_once_with("\\u2603")
+    assert lp["goat"] == "\U0001f410"
+    assert spy.call_count == 2
+
+
+def test_lazyprops_missing_key() -> None:
+    lp = LazyProperties.loads(INPUT)
+    with pytest.raises(KeyError):
+        lp["missing"]
+    assert lp.get("missing") is None
+
+
+def test_lazyprops_invalid_u_escape_in_value() -> None:
+    lp = LazyProperties.loads("good = value\nbad = \\uabcx\n")
+    assert lp["good"] == "value"
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        lp["bad"]
+    assert excinfo.value.escape == "\\uabcx"
+
+
+def test_lazyprops_invalid_u_escape_in_key() -> None:
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        LazyProperties.loads("\\uabcx = bad\n")
+    assert excinfo.value.escape == "\\uabcx"
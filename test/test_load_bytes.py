@@ -0,0 +1,44 @@
+from __future__ import annotations
+from io import BytesIO, StringIO
+from conftest import PARSE_INPUTS
+import pytest
+from javaproperties import (
+    InvalidUEscapeError,
+    LazyProperties,
+    PropertiesFile,
+    load,
+    loads,
+    parse,
+)
+import javaproperties.reading
+
+
+@pytest.mark.parametrize("s", PARSE_INPUTS)
+def test_loads_bytes(s: str) -> None:
+    b = s.encode("iso-8859-1")
+    assert loads(b, list) == loads(s, list)
+    assert list(parse(b)) == list(parse(s))
+    assert LazyProperties.loads(b) == LazyProperties.loads(s)
+    assert PropertiesFile.loads(b) == PropertiesFile.loads(s)
+
+
+@pytest.mark.parametrize("s", PARSE_INPUTS)
+def test_load_binary_file(s: str) -> None:
+    b = s.encode("iso-8859-1")
+    assert load(BytesIO(b), list) == load(StringIO(s, newline=""), list)
+    assert list(parse(BytesIO(b))) == list(parse(StringIO(s, newline="")))
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 5, 8, 13])
+def test_loads_bytes_windows(monkeypatch: pytest.MonkeyPatch, window: int) -> None:
+    monkeypatch.setattr(javaproperties.reading, "SPLIT_WINDOW_SIZE", window)
+    s = "".join(PARSE_INPUTS) + "\n".join(PARSE_INPUTS)
+    b = s.encode("iso-8859-1")
+    assert loads(b, list) == loads(s, list)
+    assert [e.source for e in parse(b)] == [e.source for e in parse(s)]
+
+
+def test_loads_bytes_invalid_u_escape() -> None:
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        loads(b"good=value\nbad=\\uabcx\n")
+    assert excinfo.value.escape == "\\uabcx"
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from collections import OrderedDict
+from pathlib import Path
+from conftest import PARSE_INPUTS
+import pytest
+from javaproperties import InvalidUEscapeError, load_path, loads
+
+
+@pytest.mark.parametrize("s", PARSE_INPUTS)
+def test_load_path(tmp_path: Path, s: str) -> None:
+    p = tmp_path / "test.properties"
+    p.write_bytes(s.encode("iso-8859-1"))
+    assert load_path(p) == loads(s)
+    assert load_path(str(p), object_pairs_hook=list) == loads(s, object_pairs_hook=list)
+
+
+def test_load_path_ordereddict(tmp_path: Path) -> None:
+    p = tmp_path / "test.properties"
+    p.write_bytes(b"key = value\nfoo = bar\nkey = other\n")
+    assert load_path(p, object_pairs_hook=OrderedDict) == OrderedDict(
+        [("key", "other"), ("foo", "bar")]
+    )
+
+
+def test_load_path_invalid_u_escape(tmp_path: Path) -> None:
+    p = tmp_path / "test.properties"
+    p.write_bytes(b"good = value\nbad = \\uabcx\n")
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        load_path(p)
+    assert excinfo.value.escape == "\\uabcx"
+
+
+def test_load_path_missing(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_path(tmp_path / "nonexistent.properties")
@@ -1,10 +1,13 @@
 from __future__ import annotations
-from io import BytesIO
+from collections.abc import Iterator
+from io import BytesIO, StringIO
+from pathlib import Path
+import xml.etree.ElementTree as ET
 import pytest
 from javaproperties import load_xml
 
-# The only thing special about `load_xml` compared to `loads_xml` is encoding,
-# so that's the only thing we'll test here.
+# The only things special about `load_xml` compared to `loads_xml` are encoding
+# and incremental parsing, so those are the only things we'll test here.
 
 
 @pytest.mark.parametrize(
@@ -59,3 +62,50 @@ def test_load_xml(b: bytes) -> None:
         "snowman": "\u2603",
         "goat": "\U0001f410",
     }
+
+
+def test_load_xml_text() -> None:
+    fp = StringIO('<properties><entry key="key">\u2603</entry></properties>')
+    assert load_xml(fp) == {"key": "\u2603"}
+
+
+def test_load_xml_incremental(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("javaproperties.xmlprops.XML_READ_SIZE", 32)
+    fp = BytesIO(
+        b"<properties>\n"
+        + b"".join(b'<entry key="key%d">value</entry>\n' % i for i in range(10))
+        + b"<entry key="
+    )
+    seen = []
+
+    def hook(pairs: Iterator[tuple[str, str]]) -> None:
+        for k, _ in pairs:
+            seen.append((k, fp.tell()))
+
+    with pytest.raises(ET.ParseError):
+        load_xml(fp, object_pairs_hook=hook)
+    assert [k for k, _ in seen] == [f"key{i}" for i in range(10)]
+    # The entries were yielded before the whole document was read:
+    assert seen[0][1] < len(fp.getvalue())
+
+
+def test_load_xml_path(tmp_path: Path) -> None:
+    p = tmp_path / "test.xml"
+    p.write_bytes(b'<properties><entry key="key">\xe2\x98\x83</entry></properties>')
+    assert load_xml(p) == {"key": "☃"}
+    assert load_xml(str(p), list) == [("key", "☃")]
+
+
+@pytest.mark.parametrize(
+    "b,exc",
+    [
+        (b'<properties><entry key="a">b</entry><entry key=', ET.ParseError),
+        (
+            b'<properties><entry key="a">b</entry><entry>c</entry></properties>',
+            ValueError,
+        ),
+    ],
+)
+def test_load_xml_partial_hook_still_validates(b: bytes, exc: type[Exception]) -> None:
+    with pytest.raises(exc):
+        load_xml(BytesIO(b), object_pairs_hook=next)
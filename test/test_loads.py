@@ -149,6 +149,24 @@ def test_loads_multiple_ordereddict_rev() -> None:
     ) == OrderedDict([("foo", "bar"), ("key", "value")])
 
 
+def test_loads_many_entries() -> None:
+    # Enough entries to span several unescaping batches, with escapes and
+    # literal surrogate pairs in only some of them
+    lines = []
+    expected = OrderedDict()
+    for i in range(5000):
+        if i % 1000 == 999:
+            lines.append(f"key{i}=\\u00f0\\ud83d\\udc10{i}\n")
+            expected[f"key{i}"] = f"\xf0\U0001f410{i}"
+        elif i % 1500 == 0:
+            lines.append(f"key{i}=\ud83d\udc10{i}\n")
+            expected[f"key{i}"] = f"\U0001f410{i}"
+        else:
+            lines.append(f"key{i}=value{i}\n")
+            expected[f"key{i}"] = f"value{i}"
+    assert loads("".join(lines), object_pairs_hook=OrderedDict) == expected
+
+
 @pytest.mark.parametrize(
     "s,esc",
     [
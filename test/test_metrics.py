@@ -0,0 +1,144 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from io import BytesIO, StringIO
+from pathlib import Path
+import pytest
+from javaproperties import (
+    CallMetrics,
+    InvalidUEscapeError,
+    MetricsRegistry,
+    OperationStats,
+    PropertiesFile,
+    add_metrics_listener,
+    dump,
+    dump_xml,
+    dumps,
+    dumps_xml,
+    load,
+    load_path,
+    load_xml,
+    loads,
+    loads_xml,
+    remove_metrics_listener,
+)
+
+INPUT = "#comment\nkey=value\nfoo: bar\nkey = other\n"
+
+
+@pytest.fixture
+def calls() -> Iterator[list[CallMetrics]]:
+    recorded: list[CallMetrics] = []
+    add_metrics_listener(recorded.append)
+    try:
+        yield recorded
+    finally:
+        remove_metrics_listener(recorded.append)
+
+
+def test_metrics_load(calls: list[CallMetrics]) -> None:
+    assert load(StringIO(INPUT)) == {"key": "other", "foo": "bar"}
+    assert loads(INPUT.encode("iso-8859-1")) == {"key": "other", "foo": "bar"}
+    assert loads(INPUT, list) == [
+        ("key", "value"),
+        ("foo", "bar"),
+        ("key", "other"),
+    ]
+    assert [(c.operation, c.bytes_in, c.bytes_out, c.entries) for c in calls] == [
+        ("load", len(INPUT), 0, 3),
+        ("loads", len(INPUT), 0, 3),
+        ("loads", len(INPUT), 0, 3),
+    ]
+    assert all(c.duration >= 0 and c.error is None for c in calls)
+
+
+def test_metrics_load_path(calls: list[CallMetrics], tmp_path: Path) -> None:
+    p = tmp_path / "test.properties"
+    p.write_text(INPUT, encoding="iso-8859-1")
+    assert load_path(p) == {"key": "other", "foo": "bar"}
+    p.write_bytes(b"")
+    assert load_path(p) == {}
+    assert [(c.operation, c.bytes_in, c.entries) for c in calls] == [
+        ("load_path", len(INPUT), 3),
+        ("load_path", 0, 0),
+    ]
+
+
+def test_metrics_dump(calls: list[CallMetrics]) -> None:
+    props = {"key": "value", "zebra": "apple", "foo": "bar"}
+    fp = StringIO()
+    dump(props, fp, timestamp=None, sort_keys=True)
+    assert fp.getvalue() == "foo=bar\nkey=value\nzebra=apple\n"
+    s = dumps(props, comments="Comment", timestamp=None)
+    assert [(c.operation, c.bytes_in, c.bytes_out, c.entries) for c in calls] == [
+        ("dump", 0, len(fp.getvalue()), 3),
+        ("dumps", 0, len(s), 3),
+    ]
+
+
+def test_metrics_xml(calls: list[CallMetrics]) -> None:
+    fp = BytesIO()
+    dump_xml([("key", "value"), ("snowman", "☃")], fp, sort_keys=True)
+    xml = fp.getvalue()
+    assert load_xml(BytesIO(xml)) == {"key": "value", "snowman": "☃"}
+    s = dumps_xml({"key": "value"})
+    assert loads_xml(s) == {"key": "value"}
+    assert [(c.operation, c.bytes_in, c.bytes_out, c.entries) for c in calls] == [
+        ("dump_xml", 0, len(xml), 2),
+        ("load_xml", len(xml), 0, 2),
+        ("dumps_xml", 0, len(s), 1),
+        ("loads_xml", len(s), 0, 1),
+    ]
+
+
+def test_metrics_propfile(calls: list[CallMetrics]) -> None:
+    pf = PropertiesFile.load(StringIO(INPUT))
+    pf = PropertiesFile.loads(INPUT)
+    pf["new"] = "entry"
+    fp = StringIO()
+    pf.dump(fp)
+    s = pf.dumps()
+    assert fp.getvalue() == s
+    assert [(c.operation, c.bytes_in, c.bytes_out, c.entries) for c in calls] == [
+        ("PropertiesFile.load", len(INPUT), 0, 2),
+        ("PropertiesFile.loads", len(INPUT), 0, 2),
+        ("PropertiesFile.dump", 0, len(s), 3),
+        ("PropertiesFile.dumps", 0, len(s), 3),
+    ]
+
+
+def test_metrics_error(calls: list[CallMetrics]) -> None:
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        loads("good=value\nbad=\\uabcx\n")
+    assert len(calls) == 1
+    assert calls[0].operation == "loads"
+    assert calls[0].error is excinfo.value
+
+
+def test_metrics_registry() -> None:
+    registry = MetricsRegistry()
+    loads(INPUT)
+    with registry:
+        loads(INPUT)
+        loads(INPUT)
+        dumps({"key": "value"}, timestamp=None)
+        with pytest.raises(ValueError):
+            loads_xml("<not-properties/>")
+    loads(INPUT)
+    stats = registry.snapshot()
+    assert sorted(stats) == ["dumps", "loads", "loads_xml"]
+    assert stats["loads"].calls == 2
+    assert stats["loads"].errors == 0
+    assert stats["loads"].bytes_in == 2 * len(INPUT)
+    assert stats["loads"].entries == 6
+    assert 0 <= stats["loads"].max_duration <= stats["loads"].duration
+    assert stats["dumps"].bytes_out == len("key=value\n")
+    assert stats["loads_xml"].calls == 1
+    assert stats["loads_xml"].errors == 1
+    registry.reset()
+    assert registry.snapshot() == {}
+    assert OperationStats() == (0, 0, 0.0, 0.0, 0, 0, 0)
+
+
+def test_remove_unregistered_listener() -> None:
+    with pytest.raises(ValueError):
+        remove_metrics_listener(print)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from conftest import PARSE_INPUTS
+import pytest
+from javaproperties import (
+    FileLoadError,
+    InvalidUEscapeError,
+    load_many,
+    load_path_parallel,
+    loads,
+)
+import javaproperties.parallel
+
+INPUT = "".join(PARSE_INPUTS)
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(10):
+        p = tmp_path / f"{i}.properties"
+        p.write_text(f"key = {i}\nfile = {p.name}\n", encoding="iso-8859-1")
+        paths.append(p)
+    return paths
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 3, 100])
+def test_load_many_thread(files: list[Path], chunksize: int | None) -> None:
+    assert list(load_many(files, executor="thread", chunksize=chunksize)) == [
+        (p, {"key": str(i), "file": p.name}) for i, p in enumerate(files)
+    ]
+
+
+def test_load_many_process(files: list[Path]) -> None:
+    assert list(load_many(files, OrderedDict, max_workers=2)) == [
+        (p, OrderedDict([("key", str(i)), ("file", p.name)]))
+        for i, p in enumerate(files)
+    ]
+
+
+def test_load_many_unordered(files: list[Path]) -> None:
+    with ThreadPoolExecutor(4) as pool:
+        results = dict(load_many(files, executor=pool, ordered=False, chunksize=2))
+        # The executor is left running:
+        assert pool.submit(int, "42").result() == 42
+    assert results == {p: {"key": str(i), "file": p.name} for i, p in enumerate(files)}
+
+
+def test_load_many_empty() -> None:
+    assert list(load_many([], executor="thread")) == []
+
+
+def test_load_many_error(files: list[Path]) -> None:
+    files[5].write_bytes(b"bad = \\uabcx\n")
+    results = load_many(files, executor="thread", chunksize=2)
+    for i in range(5):
+        assert next(results)[0] == files[i]
+    with pytest.raises(FileLoadError) as excinfo:
+        next(results)
+    assert excinfo.value.path == files[5]
+    assert isinstance(excinfo.value.error, InvalidUEscapeError)
+    assert excinfo.value.error.escape == "\\uabcx"
+    assert str(excinfo.value) == f"{files[5]}: Invalid \\u escape sequence: \\uabcx"
+
+
+def test_load_many_missing_process(files: list[Path], tmp_path: Path) -> None:
+    missing = tmp_path / "nonexistent.properties"
+    with pytest.raises(FileLoadError) as excinfo:
+        list(load_many([*files, missing], max_workers=2))
+    assert excinfo.value.path == missing
+    assert isinstance(excinfo.value.error, FileNotFoundError)
+
+
+def test_load_many_abandoned(
+    files: list[Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pools: list[Executor] = []
+    get_executor = javaproperties.parallel._get_executor
+
+    def spy(executor: Any, max_workers: int | None) -> tuple[Executor, bool]:
+        pool, owned = get_executor(executor, max_workers)
+        pools.append(pool)
+        return (pool, owned)
+
+    monkeypatch.setattr(javaproperties.parallel, "_get_executor", spy)
+    results = load_many(files, executor="thread", chunksize=1)
+    assert next(results)[0] == files[0]
+    # The executor no longer accepts work even though the generator is still
+    # open:
+    with pytest.raises(RuntimeError):
+        pools[0].submit(int, "42")
+    results.close()
+
+
+def test_load_many_bad_executor(files: list[Path]) -> None:
+    with pytest.raises(ValueError):
+        load_many(files, executor="fiber")  # type: ignore[call-overload]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13, 64, 1000])
+def test_load_path_parallel(tmp_path: Path, chunk_size: int) -> None:
+    p = tmp_path / "test.properties"
+    p.write_bytes(INPUT.encode("iso-8859-1"))
+    assert load_path_parallel(
+        p, list, executor="thread", chunk_size=chunk_size
+    ) == loads(INPUT, list)
+
+
+def test_load_path_parallel_process(tmp_path: Path) -> None:
+    s = "".join(f"key{i % 100} = value {i} \\\n  continued\n" for i in range(5000))
+    p = tmp_path / "test.properties"
+    p.write_bytes(s.encode("iso-8859-1"))
+    assert load_path_parallel(p, max_workers=2, chunk_size=4096) == loads(s)
+
+
+def test_load_path_parallel_empty(tmp_path: Path) -> None:
+    p = tmp_path / "test.properties"
+    p.write_bytes(b"")
+    assert load_path_parallel(p, chunk_size=1) == {}
+
+
+def test_load_path_parallel_invalid_u_escape(tmp_path: Path) -> None:
+    p = tmp_path / "test.properties"
+    p.write_bytes(b"good = value\n" * 100 + b"bad = \\uabcx\n")
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        load_path_parallel(p, executor="thread", chunk_size=64)
+    assert excinfo.value.escape == "\\uabcx"
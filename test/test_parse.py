@@ -1,6 +1,14 @@
 from __future__ import annotations
+import pickle
 import pytest
-from javaproperties import Comment, KeyValue, PropertiesElement, Whitespace, parse
+from javaproperties import (
+    Comment,
+    KeyValue,
+    ParseStats,
+    PropertiesElement,
+    Whitespace,
+    parse,
+)
 
 
 @pytest.mark.parametrize(
@@ -53,10 +61,25 @@ from javaproperties import Comment, KeyValue, PropertiesElement, Whitespace, par
             "key = v\\\n\ta\\\r\n\fl\\\r u\\\ne\n",
             [KeyValue("key", "value", "key = v\\\n\ta\\\r\n\fl\\\r u\\\ne\n")],
         ),
+        ("a\\\\ b\n", [KeyValue("a\\", "b", "a\\\\ b\n")]),
+        ("a\\ b=c\n", [KeyValue("a b", "c", "a\\ b=c\n")]),
+        ("a\\=b = c\n", [KeyValue("a=b", "c", "a\\=b = c\n")]),
+        ("key \t= : value\n", [KeyValue("key", ": value", "key \t= : value\n")]),
+        ("=value\n", [KeyValue("", "value", "=value\n")]),
+        (
+            "key=a\\\\\\\n  \\\\b\n",
+            [KeyValue("key", "a\\\\b", "key=a\\\\\\\n  \\\\b\n")],
+        ),
+        (
+            "key=\\\n#not a comment\n",
+            [KeyValue("key", "#not a comment", "key=\\\n#not a comment\n")],
+        ),
+        ("key=value\\\n\n", [KeyValue("key", "value", "key=value\\\n\n")]),
     ],
 )
 def test_parse(s: str, objects: list[PropertiesElement]) -> None:
     assert list(parse(s)) == objects
+    assert list(parse(s, stats=ParseStats())) == objects
 
 
 def test_keyvalue_attributes() -> None:
@@ -206,3 +229,51 @@ def test_whitespace_source_stripped(s: str, ss: str) -> None:
 )
 def test_comment_value(s: str, v: str) -> None:
     assert Comment(s).value == v
+
+
+@pytest.mark.parametrize(
+    "elem",
+    [
+        Comment("#comment\n"),
+        Whitespace("\n"),
+        KeyValue("key", "value", "key=value\n"),
+    ],
+)
+def test_elements_have_no_dict(elem: PropertiesElement) -> None:
+    assert not hasattr(elem, "__dict__")
+    with pytest.raises(AttributeError):
+        elem.foo = "bar"  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "elem",
+    [
+        Comment("#comment\n"),
+        Whitespace("\n"),
+        KeyValue("key", "value", "key=value\n"),
+    ],
+)
+def test_elements_pickle(elem: PropertiesElement) -> None:
+    assert pickle.loads(pickle.dumps(elem)) == elem
+
+
+# `list(parse("#c\nk=v\n \n"))` pickled by javaproperties 0.8.2, before the
+# element classes used `__slots__`
+LEGACY_PICKLE = (
+    b"\x80\x02]q\x00(cjavaproperties.reading\nComment\nq\x01)\x81q\x02}q\x03X"
+    b"\x06\x00\x00\x00sourceq\x04X\x03\x00\x00\x00#c\nq\x05sbcjavaproperties.r"
+    b"eading\nKeyValue\nq\x06)\x81q\x07}q\x08(h\x04X\x04\x00\x00\x00k=v\nq\tX"
+    b"\x03\x00\x00\x00keyq\nX\x01\x00\x00\x00kq\x0bX\x05\x00\x00\x00valueq\x0cX"
+    b"\x01\x00\x00\x00vq\rubcjavaproperties.reading\nWhitespace\nq\x0e)\x81q\x0f"
+    b"}q\x10h\x04X\x02\x00\x00\x00 \nq\x11sbe."
+)
+
+
+def test_elements_unpickle_legacy() -> None:
+    elems = pickle.loads(LEGACY_PICKLE)
+    assert elems == [
+        Comment("#c\n"),
+        KeyValue("k", "v", "k=v\n"),
+        Whitespace(" \n"),
+    ]
+    assert not hasattr(elems[1], "__dict__")
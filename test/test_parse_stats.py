@@ -0,0 +1,117 @@
+from __future__ import annotations
+from collections import Counter
+from io import BytesIO, StringIO
+from typing import Any
+from conftest import PARSE_INPUTS
+import pytest
+from javaproperties import (
+    InvalidUEscapeError,
+    KeyValue,
+    ParseStats,
+    load,
+    loads,
+    parse,
+)
+import javaproperties.reading
+
+INPUT = "".join(PARSE_INPUTS)
+
+
+def test_parse_stats() -> None:
+    stats = ParseStats()
+    elements = list(parse(INPUT, stats=stats))
+    assert elements == list(parse(INPUT))
+    assert stats == ParseStats(
+        physical_lines=58,
+        key_values=27,
+        comments=4,
+        blank_lines=9,
+        escapes=Counter({"\\\\": 4, "\\u": 4, "\\k": 1, "\\ ": 1, "\\=": 1}),
+        escaped_fields=9,
+        surrogate_pairs=1,
+        duplicate_keys=14,
+        max_line_length=18,
+        max_value_length=14,
+    )
+    assert stats.logical_lines == len(elements) == 40
+    assert stats.continuation_lines == 18
+    assert stats.u_escapes == 4
+
+
+def test_parse_stats_empty() -> None:
+    stats = ParseStats()
+    assert list(parse("", stats=stats)) == []
+    assert stats == ParseStats()
+    assert stats.logical_lines == 0
+    assert stats.continuation_lines == 0
+    assert stats.u_escapes == 0
+
+
+def test_load_stats() -> None:
+    stats = ParseStats()
+    assert load(StringIO(INPUT), stats=stats) == loads(INPUT)
+    stats2 = ParseStats()
+    assert load(BytesIO(INPUT.encode("iso-8859-1")), list, stats=stats2) == loads(
+        INPUT, list
+    )
+    assert stats == stats2
+    assert stats.key_values == 27
+
+
+def test_loads_stats_accumulate() -> None:
+    stats = ParseStats()
+    assert loads("key=value\nkey=\\tlonger value\n", stats=stats) == {
+        "key": "\tlonger value"
+    }
+    assert loads(b"# comment\nkey=x\n", stats=stats) == {"key": "x"}
+    assert stats == ParseStats(
+        physical_lines=4,
+        key_values=3,
+        comments=1,
+        escapes=Counter({"\\t": 1}),
+        escaped_fields=1,
+        duplicate_keys=1,
+        max_line_length=18,
+        max_value_length=13,
+    )
+
+
+def test_parse_stats_lazy() -> None:
+    stats = ParseStats()
+    elements = parse("a=1\nb=2\n", stats=stats)
+    assert stats.key_values == 0
+    assert next(elements) == KeyValue("a", "1", "a=1\n")
+    assert stats.key_values == 1
+
+
+def test_loads_stats_invalid_u_escape() -> None:
+    stats = ParseStats()
+    with pytest.raises(InvalidUEscapeError) as excinfo:
+        loads("good=value\nbad=\\uabcx\n", stats=stats)
+    assert excinfo.value.escape == "\\uabcx"
+    assert stats.key_values == 2
+
+
+def test_parse_stats_bytes() -> None:
+    expected = ParseStats()
+    elements = list(parse(INPUT, stats=expected))
+    b = INPUT.encode("iso-8859-1")
+    stats = ParseStats()
+    assert list(parse(b, stats=stats)) == elements
+    assert stats == expected
+    stats = ParseStats()
+    assert loads(b, list, stats=stats) == loads(INPUT, list)
+    assert stats == expected
+    stats = ParseStats()
+    assert load(BytesIO(b), list, stats=stats) == loads(INPUT, list)
+    assert stats == expected
+
+
+def test_parse_stats_uses_bytes_scanner(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*_args: Any) -> None:
+        raise AssertionError("Text scanner called")
+
+    monkeypatch.setattr(javaproperties.reading, "_scan", fail)
+    stats = ParseStats()
+    assert loads(b"key=\\tvalue\n", stats=stats) == {"key": "\tvalue"}
+    assert stats.escapes == Counter({"\\t": 1})
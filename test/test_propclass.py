@@ -1,6 +1,7 @@
 from __future__ import annotations
 from collections.abc import Iterator
 from io import BytesIO, StringIO
+import pickle
 import pytest
 from javaproperties import Properties, dumps
 
@@ -709,3 +710,73 @@ def test_propclass_repr_noinit() -> None:
 
 
 # defaults with defaults
+
+
+def test_propclass_cache_defaults() -> None:
+    base = Properties({"a": "base", "b": "base", "c": "base"})
+    mid = Properties({"b": "mid"}, defaults=base)
+    p = Properties({"c": "top"}, defaults=mid, cache_defaults=True)
+    assert p.getProperty("a") == "base"
+    assert p.getProperty("b") == "mid"
+    assert p.getProperty("c") == "top"
+    assert p.getProperty("d", "missing") == "missing"
+    assert list(p.propertyNames()) == ["c", "b", "a"]
+    assert p.stringPropertyNames() == {"a", "b", "c"}
+    base["d"] = "base"
+    assert p.getProperty("d") == "base"
+    mid["a"] = "mid"
+    assert p.getProperty("a") == "mid"
+    del mid["b"]
+    assert p.getProperty("b") == "base"
+    p["b"] = "top"
+    assert p.getProperty("b") == "top"
+    mid.load(StringIO("e=mid\n"))
+    assert p.getProperty("e") == "mid"
+    mid.defaults = None
+    assert p.getProperty("d") is None
+    assert p.stringPropertyNames() == {"a", "b", "c", "e"}
+    p.defaults = base
+    assert p.getProperty("e") is None
+    assert p.getProperty("d") == "base"
+    p2 = p.copy()
+    assert p2.cache_defaults
+    base["d"] = "changed"
+    assert p.getProperty("d") == p2.getProperty("d") == "changed"
+    p.cache_defaults = False
+    assert p.getProperty("d") == "changed"
+    assert sorted(p.propertyNames()) == ["a", "b", "c", "d"]
+
+
+# `Properties({"a": "1"}, defaults=Properties({"b": "2"}))` pickled by
+# javaproperties 0.8.2, which stored `defaults` as a plain attribute
+LEGACY_PICKLE = (
+    b"\x80\x02cjavaproperties.propclass\nProperties\nq\x00)\x81q\x01}q\x02(X\x04"
+    b"\x00\x00\x00dataq\x03}q\x04X\x01\x00\x00\x00aq\x05X\x01\x00\x00\x001q\x06sX"
+    b"\x08\x00\x00\x00defaultsq\x07h\x00)\x81q\x08}q\t(h\x03}q\nX\x01\x00\x00\x00"
+    b"bq\x0bX\x01\x00\x00\x002q\x0csh\x07Nubub."
+)
+
+
+def test_propclass_unpickle_legacy() -> None:
+    p = pickle.loads(LEGACY_PICKLE)
+    assert p.data == {"a": "1"}
+    assert p.defaults is not None
+    assert p.defaults.data == {"b": "2"}
+    assert p.defaults.defaults is None
+    assert not p.cache_defaults
+    assert p.getProperty("a") == "1"
+    assert p.getProperty("b") == "2"
+    assert p == Properties({"a": "1"}, defaults=Properties({"b": "2"}))
+    p.cache_defaults = True
+    assert p.getProperty("b") == "2"
+    p.defaults["b"] = "3"
+    assert p.getProperty("b") == "3"
+
+
+def test_propclass_pickle_roundtrip() -> None:
+    p = Properties({"a": "1"}, defaults=Properties({"b": "2"}), cache_defaults=True)
+    assert p.getProperty("b") == "2"
+    q = pickle.loads(pickle.dumps(p))
+    assert q == p
+    assert q.cache_defaults
+    assert q.getProperty("b") == "2"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from conftest import PARSE_INPUTS
+import pytest
+from javaproperties import KeyValue, PropertiesParser, Whitespace, parse
+
+
+@pytest.mark.parametrize("s", PARSE_INPUTS)
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 1000])
+def test_propertiesparser_chunks(s: str, size: int) -> None:
+    parser = PropertiesParser()
+    elems = []
+    for i in range(0, len(s), size):
+        elems.extend(parser.feed(s[i : i + size]))
+    elems.extend(parser.close())
+    assert elems == list(parse(s))
+
+
+@pytest.mark.parametrize("s", PARSE_INPUTS)
+def test_propertiesparser_bytes(s: str) -> None:
+    parser = PropertiesParser()
+    elems = []
+    for c in s.encode("iso-8859-1"):
+        elems.extend(parser.feed(bytes([c])))
+    elems.extend(parser.close())
+    assert elems == list(parse(s))
+
+
+def test_propertiesparser_emits_completed_lines() -> None:
+    parser = PropertiesParser()
+    assert parser.feed("key=value\nfoo") == [KeyValue("key", "value", "key=value\n")]
+    assert parser.feed("=bar\\\n") == []
+    assert parser.feed("  baz\r") == []
+    assert parser.feed("\n\n") == [
+        KeyValue("foo", "barbaz", "foo=bar\\\n  baz\r\n"),
+        Whitespace("\n"),
+    ]
+    assert parser.close() == []
+
+
+def test_propertiesparser_long_line_small_pieces() -> None:
+    # A long unterminated line fed a character at a time is buffered in
+    # pieces rather than re-copied on every call.
+    parser = PropertiesParser()
+    value = "x" * 200000
+    for c in "key=" + value:
+        assert parser.feed(c) == []
+    assert len(parser._buffer) == len(value) + 4
+    assert parser.feed("\r") == []
+    assert parser.feed("\nfoo") == [KeyValue("key", value, f"key={value}\r\n")]
+    assert parser._buffer == ["foo"]
+    assert parser.close() == [KeyValue("foo", "", "foo")]
+
+
+def test_propertiesparser_feed_after_close() -> None:
+    parser = PropertiesParser()
+    parser.feed("key=value")
+    parser.close()
+    with pytest.raises(ValueError):
+        parser.feed("foo=bar\n")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from collections import OrderedDict
 from datetime import datetime
+from io import StringIO
+import pickle
 from typing import AnyStr
 from dateutil.tz import tzstr
 import pytest
@@ -472,6 +474,192 @@ def test_propfile_set_dumps_no_ensure_ascii() -> None:
     assert pf.dumps(ensure_ascii=False) == INPUT + "ð=edh\n"
 
 
+class WriteRecorder(StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+def test_propfile_dump_unmodified_single_write() -> None:
+    pf = PropertiesFile.loads(INPUT)
+    fp = WriteRecorder()
+    pf.dump(fp)
+    assert fp.getvalue() == INPUT
+    assert fp.writes == 1
+
+
+def test_propfile_dump_modified_bulk_writes() -> None:
+    src = "".join(f"key{i} = value{i}\n" for i in range(1000))
+    pf = PropertiesFile.loads(src)
+    pf["key500"] = "new"
+    fp = WriteRecorder()
+    pf.dump(fp)
+    assert fp.getvalue() == src.replace("key500 = value500", "key500=new")
+    assert fp.writes == 3
+
+
+def test_propfile_dump_after_deletions_and_insertions() -> None:
+    pf = PropertiesFile.loads(INPUT)
+    del pf["bar"]
+    del pf.header_comment
+    pf.timestamp = "Fri Feb 13 18:31:30 EST 2009"
+    pf["new"] = "old"
+    pf._check()
+    fp = WriteRecorder()
+    pf.dump(fp)
+    assert fp.getvalue() == (
+        "#Fri Feb 13 18:31:30 EST 2009\n"
+        "# A comment after the timestamp\n"
+        "foo: first definition\n"
+        "\n"
+        "# Comment between values\n"
+        "\n"
+        "key = value\n"
+        "\n"
+        "zebra \\\n"
+        "    apple\n"
+        "foo : second definition\n"
+        "\n"
+        "# Comment at end of file\n"
+        "new=old\n"
+    )
+    assert fp.getvalue() == pf.copy().dumps()
+    assert fp.writes == 4
+
+
+def test_propfile_delete_many() -> None:
+    src = "".join(
+        (f"# comment {i}\n" if i % 4 == 0 else "") + f"key{i} = value{i}\n"
+        for i in range(100)
+    )
+    pf = PropertiesFile.loads(src)
+    for i in range(0, 100, 4):
+        pf[f"key{i}"] = "changed"
+    for i in range(100):
+        if i % 4:
+            del pf[f"key{i}"]
+    pf._check()
+    assert len(pf._lines) < 125
+    assert dict(pf) == {f"key{i}": "changed" for i in range(0, 100, 4)}
+    assert pf.dumps() == "".join(
+        f"# comment {i}\nkey{i}=changed\n" for i in range(0, 100, 4)
+    )
+
+
+def test_propfile_insert_shifts_keys() -> None:
+    pf = PropertiesFile.loads("#Header\nfoo=bar\n\nkey = value\n")
+    pf.timestamp = "Tue Feb 25 19:13:27 EST 2020\nLine 2\nLine 3"
+    pf._check()
+    pf.header_comment = "New\nlonger\nheader"
+    pf._check()
+    assert pf["foo"] == "bar"
+    assert pf["key"] == "value"
+    pf["foo"] = "baz"
+    pf._check()
+    assert pf.dumps() == (
+        "#New\n#longer\n#header\n#Tue Feb 25 19:13:27 EST 2020\n#Line 2\n"
+        "#Line 3\n"
+        "foo=baz\n\nkey = value\n"
+    )
+
+
+def test_propfile_many_duplicates() -> None:
+    src = "".join(f"key{i % 10} = value{i}\n" for i in range(1000))
+    pf = PropertiesFile.loads(src)
+    assert pf["key3"] == "value993"
+    pf["key3"] = "new"
+    del pf["key5"]
+    assert pf["key3"] == "new"
+    assert "key5" not in pf
+    pf["key5"] = "again"
+    pf._check()
+    assert list(pf) == [f"key{i}" for i in range(10) if i != 5] + ["key5"]
+    assert pf.dumps() == (
+        "".join(
+            "key3=new\n" if i == 3 else f"key{i % 10} = value{i}\n"
+            for i in range(1000)
+            if i % 10 not in (3, 5) or i == 3
+        )
+        + "key5=again\n"
+    )
+
+
+def timestamp_of(pf: PropertiesFile) -> str | None:
+    # Reading the timestamp through a function keeps mypy from narrowing
+    # `pf.timestamp` across the mutations in between.
+    return pf.timestamp
+
+
+def test_propfile_header_tracks_mutations() -> None:
+    pf = PropertiesFile.loads(
+        "#Header\nkey=value\n#Tue Feb 25 19:13:27 EST 2020\n#More\nfoo=bar\n"
+    )
+    assert timestamp_of(pf) is None
+    assert pf.header_comment == "Header"
+    del pf["key"]
+    pf._check()
+    assert timestamp_of(pf) == "Tue Feb 25 19:13:27 EST 2020"
+    assert pf.header_comment == "Header"
+    pf.timestamp = "Not a timestamp"
+    pf._check()
+    assert timestamp_of(pf) is None
+    assert pf.header_comment == "Header\nNot a timestamp\nMore"
+    del pf["foo"]
+    pf["new"] = "value"
+    pf._check()
+    assert timestamp_of(pf) is None
+    pf.timestamp = 1234567890
+    pf._check()
+    assert timestamp_of(pf) == "Fri Feb 13 18:31:30 EST 2009"
+    assert pf.dumps() == (
+        "#Header\n#Not a timestamp\n#More\n#Fri Feb 13 18:31:30 EST 2009\n"
+        "new=value\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        "",
+        INPUT,
+        "#No trailing newline",
+        "key = value \\",
+        "key = value\\\n",
+    ],
+)
+def test_propfile_update(src: str) -> None:
+    pairs = [
+        ("new1", "a"),
+        ("foo", "updated"),
+        ("new2", "b"),
+        ("new1", "c"),
+        ("key", "updated"),
+    ]
+    pf = PropertiesFile.loads(src)
+    pf.update(pairs, new3="d")
+    pf._check()
+    expected = PropertiesFile.loads(src)
+    for k, v in pairs + [("new3", "d")]:
+        expected[k] = v
+    expected._check()
+    assert pf == expected
+    assert list(pf.items()) == list(expected.items())
+    assert pf.dumps() == expected.dumps()
+
+
+def test_propfile_update_mapping() -> None:
+    pf = PropertiesFile.loads(INPUT)
+    pf.update(OrderedDict([("zebra", "horse"), ("new", "value")]))
+    pf._check()
+    assert pf.dumps() == INPUT.replace("zebra \\\n    apple\n", "zebra=horse\n") + (
+        "new=value\n"
+    )
+
+
 def test_propfile_copy() -> None:
     pf = PropertiesFile({"Foo": "bar"})
     pf2 = pf.copy()
@@ -551,6 +739,52 @@ def test_propfile_copy_more() -> None:
     )
 
 
+def test_propfile_copy_shares_lines() -> None:
+    src = "".join(f"key{i} = value{i}\n" for i in range(5000))
+    pf = PropertiesFile.loads(src)
+    pf2 = pf.copy()
+    assert pf2._lines.pages == pf._lines.pages
+    assert all(p is q for p, q in zip(pf._lines.pages, pf2._lines.pages))
+    pf2["key10"] = "changed"
+    pf2._check()
+    unshared = [
+        i
+        for i, (p, q) in enumerate(zip(pf._lines.pages, pf2._lines.pages))
+        if p is not q
+    ]
+    assert unshared == [0]
+    assert pf["key10"] == "value10"
+    assert pf2["key10"] == "changed"
+    pf["key4000"] = "original"
+    pf._check()
+    assert pf2["key4000"] == "value4000"
+    assert pf.dumps() == src.replace("key4000 = value4000\n", "key4000=original\n")
+    assert pf2.dumps() == src.replace("key10 = value10\n", "key10=changed\n")
+
+
+def test_propfile_copy_chain() -> None:
+    pf = PropertiesFile.loads(INPUT)
+    copies = [pf]
+    for i in range(4):
+        dup = copies[-1].copy()
+        del dup["key"]
+        dup["key"] = f"value{i}"
+        dup[f"new{i}"] = "x"
+        dup.header_comment = f"Copy {i}"
+        copies.append(dup)
+    for dup in copies:
+        dup._check()
+    assert pf.dumps() == INPUT
+    assert list(pf) == ["foo", "bar", "key", "zebra"]
+    assert list(copies[2]) == ["foo", "bar", "zebra", "new0", "key", "new1"]
+    assert list(reversed(copies[2])) == ["new1", "key", "new0", "zebra", "bar", "foo"]
+    assert copies[2].header_comment == "Copy 1"
+    assert copies[2].timestamp == "Thu Mar 16 17:06:52 EDT 2017"
+    assert copies[2]["foo"] == "second definition"
+    assert copies[4]["key"] == "value3"
+    assert len(copies[4]) == 8
+
+
 def test_propfile_eq_empty() -> None:
     pf = PropertiesFile()
     pf2 = PropertiesFile()
@@ -1120,3 +1354,39 @@ def test_propfile_delete_header_comment(part1: str, part2: str) -> None:
 
 
 # preserving mixtures of line endings
+
+
+def test_propfile_pickle() -> None:
+    pf = PropertiesFile.loads(INPUT)
+    pf["key"] = "new value"
+    pf2 = pickle.loads(pickle.dumps(pf))
+    assert pf2 == pf
+    assert pf2.dumps() == pf.dumps()
+    pf2["foo"] = "changed"
+    assert pf["foo"] == "second definition"
+
+
+# `PropertiesFile.loads("#c\nk=v\n")` pickled by javaproperties 0.8.2, which
+# stored the lines in a linked list
+LEGACY_PICKLE = (
+    b"\x80\x02cjavaproperties.propfile\nPropertiesFile\nq\x00)\x81q\x01}q\x02(X"
+    b"\n\x00\x00\x00_key2nodesq\x03ccollections\nOrderedDict\nq\x04)Rq\x05X\x01"
+    b"\x00\x00\x00kq\x06]q\x07cjavaproperties.util\nLinkedListNode\nq\x08)\x81q"
+    b"\t}q\n(X\x05\x00\x00\x00valueq\x0bcjavaproperties.reading\nKeyValue\nq\x0c"
+    b")\x81q\r}q\x0e(X\x06\x00\x00\x00sourceq\x0fX\x04\x00\x00\x00k=v\nq\x10X\x03"
+    b"\x00\x00\x00keyq\x11h\x06h\x0bX\x01\x00\x00\x00vq\x12ubX\x03\x00\x00\x00ls"
+    b"tq\x13cjavaproperties.util\nLinkedList\nq\x14)\x81q\x15}q\x16(X\x05\x00"
+    b"\x00\x00startq\x17h\x08)\x81q\x18}q\x19(h\x0bcjavaproperties.reading\nCom"
+    b"ment\nq\x1a)\x81q\x1b}q\x1ch\x0fX\x03\x00\x00\x00#c\nq\x1dsbh\x13h\x15X\x04"
+    b"\x00\x00\x00prevq\x1eNX\x04\x00\x00\x00nextq\x1fh\tubX\x03\x00\x00\x00endq"
+    b" h\tubh\x1eh\x18h\x1fNubasX\x06\x00\x00\x00_linesq!h\x15ub."
+)
+
+
+def test_propfile_unpickle_legacy() -> None:
+    pf = pickle.loads(LEGACY_PICKLE)
+    assert pf == {"k": "v"}
+    assert pf.dumps() == "#c\nk=v\n"
+    pf["new"] = "entry"
+    pf._check()
+    assert pf.dumps() == "#c\nk=v\nnew=entry\n"
@@ -46,12 +46,20 @@ from javaproperties import InvalidUEscapeError, unescape
         ("\xf0", "\xf0"),
         ("\u2603", "\u2603"),
         ("\U0001f410", "\U0001f410"),
+        ("\ud83d\udc10", "\U0001f410"),
+        ("\udc10\ud83d", "\udc10\ud83d"),
+        ("\ue000\uffff", "\ue000\uffff"),
     ],
 )
 def test_unescape(sin: str, sout: str) -> None:
     assert unescape(sin) == sout
 
 
+@pytest.mark.parametrize("s", ["", "foobar", "caf\xe9", "\u2603 snowman"])
+def test_unescape_no_escapes_returns_input(s: str) -> None:
+    assert unescape(s) is s
+
+
 @pytest.mark.parametrize(
     "s,esc",
     [
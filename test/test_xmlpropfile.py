@@ -0,0 +1,169 @@
+from __future__ import annotations
+from io import BytesIO
+from typing import AnyStr
+import xml.etree.ElementTree as ET
+import pytest
+from javaproperties import XMLPropertiesFile, dump_xml
+
+INPUT = """\
+<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">
+<properties>
+  <comment>A comment</comment>
+  <!-- An XML comment -->
+  <entry key="foo">first definition</entry>
+  <entry key="bar">only definition</entry>
+  <entry key="snowman">☃ &amp; <![CDATA[<goat>]]></entry>
+
+  <entry key="key">value</entry><entry key="zebra"/>
+  <entry key="foo">second definition</entry>
+</properties>
+"""
+
+
+@pytest.mark.parametrize("src", [INPUT, INPUT.encode("utf-8")])
+def test_xmlpropfile_loads(src: AnyStr) -> None:
+    xpf = XMLPropertiesFile.loads(src)
+    xpf._check()
+    assert len(xpf) == 5
+    assert list(xpf) == ["foo", "bar", "snowman", "key", "zebra"]
+    assert list(reversed(xpf)) == ["zebra", "key", "snowman", "bar", "foo"]
+    assert dict(xpf) == {
+        "foo": "second definition",
+        "bar": "only definition",
+        "snowman": "☃ & <goat>",
+        "key": "value",
+        "zebra": "",
+    }
+    assert xpf.dumps() == INPUT
+
+
+def test_xmlpropfile_edit() -> None:
+    xpf = XMLPropertiesFile.loads(INPUT)
+    xpf["foo"] = "<new>"
+    xpf["key"] = "lock"
+    del xpf["bar"]
+    del xpf["zebra"]
+    xpf["new"] = "old"
+    xpf._check()
+    assert list(xpf) == ["foo", "snowman", "key", "new"]
+    assert xpf.dumps() == (
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+        '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+        "<properties>\n"
+        "  <comment>A comment</comment>\n"
+        "  <!-- An XML comment -->\n"
+        '  <entry key="foo">&lt;new&gt;</entry>\n'
+        '  <entry key="snowman">☃ &amp; <![CDATA[<goat>]]></entry>\n'
+        "\n"
+        '  <entry key="key">lock</entry>\n'
+        '  <entry key="new">old</entry>\n'
+        "</properties>\n"
+    )
+
+
+def test_xmlpropfile_move_item() -> None:
+    xpf = XMLPropertiesFile.loads(INPUT)
+    del xpf["foo"]
+    xpf["foo"] = "recreated"
+    xpf._check()
+    assert list(xpf) == ["bar", "snowman", "key", "zebra", "foo"]
+    assert xpf.dumps() == (
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+        '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+        "<properties>\n"
+        "  <comment>A comment</comment>\n"
+        "  <!-- An XML comment -->\n"
+        '  <entry key="bar">only definition</entry>\n'
+        '  <entry key="snowman">☃ &amp; <![CDATA[<goat>]]></entry>\n'
+        "\n"
+        '  <entry key="key">value</entry><entry key="zebra"/>\n'
+        '  <entry key="foo">recreated</entry>\n'
+        "</properties>\n"
+    )
+
+
+@pytest.mark.parametrize("encoding", ["UTF-8", "Latin-1", "ASCII", "UTF-16"])
+def test_xmlpropfile_encoding(encoding: str) -> None:
+    fp = BytesIO()
+    dump_xml({"key": "value", "edh": "\xf0"}, fp, encoding=encoding)
+    # `dump_xml()` writes a BOM before every line in UTF-16, so re-encode:
+    src = fp.getvalue().decode(encoding).replace("\ufeff", "").encode(encoding)
+    xpf = XMLPropertiesFile.load(BytesIO(src))
+    xpf._check()
+    assert dict(xpf) == {"key": "value", "edh": "\xf0"}
+    out = BytesIO()
+    xpf.dump(out)
+    assert out.getvalue() == src
+    xpf["snowman"] = "☃"
+    out = BytesIO()
+    xpf.dump(out)
+    assert out.getvalue() == src.decode(encoding).replace(
+        "</properties>", '<entry key="snowman">☃</entry>\n</properties>'
+    ).encode(encoding, "xmlcharrefreplace")
+
+
+@pytest.mark.parametrize(
+    "src,output",
+    [
+        (
+            "<properties/>",
+            '<properties><entry key="new">value</entry></properties>',
+        ),
+        (
+            '<properties><entry key="a">b</entry></properties>',
+            '<properties><entry key="a">b</entry>'
+            '<entry key="new">value</entry></properties>',
+        ),
+        (
+            '<properties>\r\n\t<entry key="a">b</entry>\r\n</properties>',
+            '<properties>\r\n\t<entry key="a">b</entry>\r\n'
+            '\t<entry key="new">value</entry>\r\n</properties>',
+        ),
+    ],
+)
+def test_xmlpropfile_add_layout(src: str, output: str) -> None:
+    xpf = XMLPropertiesFile.loads(src)
+    xpf["new"] = "value"
+    xpf._check()
+    assert xpf.dumps() == output
+
+
+def test_xmlpropfile_new() -> None:
+    xpf = XMLPropertiesFile({"key": "value"}, zebra="apple")
+    xpf._check()
+    assert xpf.dumps() == (
+        '<?xml version="1.0" encoding="UTF-8" standalone="no"?>\n'
+        '<!DOCTYPE properties SYSTEM "http://java.sun.com/dtd/properties.dtd">\n'
+        "<properties>\n"
+        '<entry key="key">value</entry>\n'
+        '<entry key="zebra">apple</entry>\n'
+        "</properties>\n"
+    )
+
+
+def test_xmlpropfile_copy() -> None:
+    xpf = XMLPropertiesFile.loads(INPUT)
+    xpf2 = xpf.copy()
+    xpf2["foo"] = "changed"
+    del xpf2["bar"]
+    xpf._check()
+    xpf2._check()
+    assert xpf.dumps() == INPUT
+    assert xpf["foo"] == "second definition"
+    assert xpf2["foo"] == "changed"
+    assert "bar" in xpf
+    assert "bar" not in xpf2
+
+
+@pytest.mark.parametrize(
+    "src,exc",
+    [
+        ('<proprieties><entry key="a">b</entry></proprieties>', ValueError),
+        ("<properties><entry>b</entry></properties>", ValueError),
+        ('<properties><entry key="a">b</properties>', ET.ParseError),
+    ],
+)
+def test_xmlpropfile_bad_input(src: str, exc: type[Exception]) -> None:
+    with pytest.raises(exc):
+        XMLPropertiesFile.loads(src)